@@ -228,7 +228,7 @@ class CheckpointManagerV2:
                 "pending_claims_count": len(shared_state.pending_claims),
                 "crm_queue_size": len(shared_state.crm_event_queue),
                 "communication_queue_size": len(shared_state.communication_event_queue),
-                "nba_queue_size": len(shared_state.nba_action_queue),
+                "nba_queue_size": shared_state.count_pending_nba_recommendations(),
                 "nba_execution_history_members": len(shared_state.nba_execution_history),
                 "nba_active_effects_policies": len(shared_state.nba_active_effects),
             },
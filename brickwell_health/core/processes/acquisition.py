@@ -12,6 +12,7 @@ import structlog
 from brickwell_health.core.processes.base import BaseProcess
 from brickwell_health.domain.enums import (
     PolicyType,
+    MemberRole,
     DistributionChannel,
     ApplicationStatus,
     CoverageType,
@@ -420,6 +421,11 @@ class AcquisitionProcess(BaseProcess):
                 {
                     "policy": policy,
                     "members": members,
+                    "primary_member_id": primary_member.member_id,
+                    "policy_type": policy.policy_type.value,
+                    "dependent_count": sum(
+                        pm.member_role == MemberRole.DEPENDENT for pm in policy_members
+                    ),
                     "coverages": coverages,
                     "tier": tier,
                     "product_id": product_id,
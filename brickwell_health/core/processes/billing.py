@@ -13,7 +13,12 @@ import structlog
 
 from brickwell_health.config.regulatory import AgeBasedDiscountCalculator
 from brickwell_health.core.processes.base import BaseProcess
-from brickwell_health.domain.enums import InvoiceStatus, PaymentMethod, PaymentStatus
+from brickwell_health.domain.enums import (
+    TRIGGER_EVENT_TYPE_BY_NAME,
+    InvoiceStatus,
+    PaymentMethod,
+    PaymentStatus,
+)
 from brickwell_health.generators.billing_generator import BillingGenerator
 from brickwell_health.utils.time_conversion import get_age
 
@@ -169,6 +174,7 @@ class BillingProcess(BaseProcess):
 
         self.shared_state.add_crm_event({
             "event_type": event_type,
+            "event_type_code": TRIGGER_EVENT_TYPE_BY_NAME.get(event_type),
             "policy_id": policy_id,
             "member_id": member_id,
             "timestamp": self.sim_env.current_datetime,
@@ -713,14 +719,12 @@ class BillingProcess(BaseProcess):
         # Terminate the direct-debit mandate (if any)
         mandate = policy_data.get("mandate")
         if mandate is not None:
-            self.batch_writer.add_raw_sql(
-                "mandate_cancellation_lapse",
-                self.billing_gen.cancel_mandate_sql(
-                    direct_debit_id=mandate.direct_debit_id,
-                    cancellation_date=current_date,
-                    reason=f"Policy lapsed for arrears ({days_overdue} days overdue)",
-                ),
+            cancel_sql, cancel_params = self.billing_gen.cancel_mandate_sql(
+                direct_debit_id=mandate.direct_debit_id,
+                cancellation_date=current_date,
+                reason=f"Policy lapsed for arrears ({days_overdue} days overdue)",
             )
+            self.batch_writer.add_raw_sql("mandate_cancellation_lapse", cancel_sql, cancel_params)
 
         self.increment_stat("policies_lapsed")
 
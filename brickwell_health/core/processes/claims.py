@@ -16,6 +16,7 @@ from brickwell_health.domain.coverage import BenefitUsageCreate
 from brickwell_health.domain.claims import ClaimAssessmentCreate, ClaimCreate, ClaimLineCreate
 from brickwell_health.domain.enums import (
     CoverageType, ClaimType, ClaimStatus, ClaimChannel, DenialReason, FraudType,
+    TRIGGER_EVENT_TYPE_BY_NAME,
 )
 from brickwell_health.generators.claims_generator import ClaimsGenerator
 from brickwell_health.statistics.claim_propensity import ClaimPropensityModel
@@ -1592,6 +1593,7 @@ class ClaimsProcess(BaseProcess):
 
         self.shared_state.add_crm_event({
             "event_type": event_type,
+            "event_type_code": TRIGGER_EVENT_TYPE_BY_NAME.get(event_type),
             "claim_id": claim_id,
             "policy_id": data.get("policy_id"),
             "member_id": data.get("member_id"),
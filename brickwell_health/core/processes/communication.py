@@ -12,6 +12,7 @@ from uuid import UUID
 import structlog
 
 from brickwell_health.core.processes.base import BaseProcess
+from brickwell_health.core.shared_state import INACTIVE_POLICY_STATUSES
 from brickwell_health.domain.communication import (
     CommunicationCreate,
     CampaignCreate,
@@ -610,8 +611,9 @@ class CommunicationProcess(BaseProcess):
             return []
 
         eligible = []
+        active_policies = self.shared_state.active_policies
 
-        for pm_id, member_data in self.shared_state.policy_members.items():
+        for member_data in self.shared_state.policy_members.values():
             policy = member_data.get("policy")
             member = member_data.get("member")
 
@@ -619,9 +621,8 @@ class CommunicationProcess(BaseProcess):
                 continue
 
             # Check policy status
-            policy_data = self.shared_state.active_policies.get(policy.policy_id, {})
-            status = policy_data.get("status", "")
-            if status in ("Suspended", "Lapsed", "Cancelled"):
+            policy_data = active_policies.get(policy.policy_id)
+            if policy_data is not None and policy_data.get("status") in INACTIVE_POLICY_STATUSES:
                 continue
 
             eligible.append(
@@ -5,17 +5,20 @@ Handles generation of interactions, cases, and complaints based on
 trigger events from Claims and Billing processes, plus baseline interactions.
 """
 
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Any, Generator, Optional, TYPE_CHECKING
 from uuid import UUID
 
+import numpy as np
 import structlog
 
 from brickwell_health.core.processes.base import BaseProcess
+from brickwell_health.core.shared_state import CRMEvent, CRMQueueEvent
 from brickwell_health.core.trigger_engine import EventTriggerEngine
 from brickwell_health.domain.crm import InteractionCreate, CaseCreate, ComplaintCreate
 from brickwell_health.domain.enums import (
+    TRIGGER_EVENT_TYPE_BY_NAME,
     CasePriority,
     CaseStatus,
     ComplaintStatus,
@@ -124,10 +127,19 @@ class CRMProcess(BaseProcess):
         # Load baseline interaction types from database (inquiry types only)
         self._baseline_interaction_types = self._load_baseline_interaction_types()
 
+        # Baseline contact rate (2.5 contacts per member per year by default)
+        annual_rate = getattr(crm_config.interaction, "baseline_contacts_per_year", 2.5)
+        self._baseline_daily_rate = annual_rate / 365
+
         # Track pending cases and complaints for lifecycle processing (INSERT-then-UPDATE)
         self.pending_cases: dict[UUID, dict[str, Any]] = {}
         self.pending_complaints: dict[UUID, dict[str, Any]] = {}
 
+        # Earliest date the lifecycle scans have work; None forces a rescan.
+        # Cleared whenever a case/complaint is scheduled.
+        self._next_case_due: date | None = None
+        self._next_complaint_due: date | None = None
+
         # Track active customer journeys for survey triggering
         # Key: member_id -> journey data
         # Journey structure:
@@ -155,6 +167,7 @@ class CRMProcess(BaseProcess):
             "complaints_resolved": 0,
             "baseline_interactions": 0,
             "trigger_interactions": 0,
+            "nba_interactions_created": 0,
             "journeys_started": 0,
             "journeys_completed": 0,
             "journeys_with_escalation": 0,
@@ -285,7 +298,7 @@ class CRMProcess(BaseProcess):
     def _execute_triggered_action(
         self,
         action: str,
-        event: dict,
+        event: CRMQueueEvent,
         context: dict,
     ) -> None:
         """Execute a triggered CRM action."""
@@ -296,8 +309,10 @@ class CRMProcess(BaseProcess):
         if not policy_id or not member_id:
             return
 
-        # Map event type to TriggerEventType enum
-        trigger_type = self._get_trigger_event_type(event_type)
+        # Producers attach the resolved TriggerEventType; map legacy events
+        trigger_type = event.get("event_type_code") or self._get_trigger_event_type(
+            event_type
+        )
         trigger_id = event.get("claim_id") or event.get("invoice_id")
 
         if action == "interaction":
@@ -333,7 +348,7 @@ class CRMProcess(BaseProcess):
             )
 
     def _create_nba_outbound_interaction(
-        self, event: dict, current_date: date
+        self, event: CRMQueueEvent, current_date: date
     ) -> None:
         """
         Create outbound phone interaction for NBA action.
@@ -365,9 +380,7 @@ class CRMProcess(BaseProcess):
         # Write to batch
         self.batch_writer.add("crm.interaction", interaction.model_dump_db())
         self._stats["interactions_created"] += 1
-        self._stats["nba_interactions_created"] = self._stats.get(
-            "nba_interactions_created", 0
-        ) + 1
+        self._stats["nba_interactions_created"] += 1
 
         # Emit completion event for downstream (surveys, CSAT triggers, etc.)
         if self.shared_state:
@@ -392,7 +405,7 @@ class CRMProcess(BaseProcess):
     # Journey Lifecycle Methods
     # =========================================================================
 
-    def _start_journey(self, event: dict, current_date: date) -> None:
+    def _start_journey(self, event: CRMQueueEvent, current_date: date) -> None:
         """
         Start a new customer journey for a claim event.
 
@@ -476,7 +489,7 @@ class CRMProcess(BaseProcess):
             timeout_date=str(journey["timeout_date"]) if journey["timeout_date"] else None,
         )
 
-    def _build_journey_context(self, event: dict) -> dict:
+    def _build_journey_context(self, event: CRMQueueEvent) -> dict:
         """
         Build context for escalation prediction from event and member data.
 
@@ -550,7 +563,7 @@ class CRMProcess(BaseProcess):
 
     def _check_journey_completion(
         self,
-        event: dict,
+        event: CRMQueueEvent,
         current_date: date,
     ) -> None:
         """
@@ -892,36 +905,35 @@ class CRMProcess(BaseProcess):
         if not self.shared_state:
             return
 
-        # Get baseline rate from config (2.5 contacts per member per year)
-        crm_config = getattr(self.config, "crm", None)
-        if crm_config and hasattr(crm_config, "interaction"):
-            interaction_config = crm_config.interaction
-            annual_rate = getattr(interaction_config, "baseline_contacts_per_year", 2.5)
-        else:
-            annual_rate = 2.5
-
-        daily_rate = annual_rate / 365
-
-        # For each active policy member
-        for pm_id, member_data in self.shared_state.policy_members.items():
-            # Check if member has an interaction today (Poisson process)
-            if self.rng.random() < daily_rate:
-                policy = member_data.get("policy")
-                member = member_data.get("member")
+        members = self.shared_state.members_soa()
 
-                if policy and member:
-                    # Sample interaction type for baseline contact from database reference
-                    interaction_type = self.rng.choice(self._baseline_interaction_types)
+        # Number of members contacting today (one Bernoulli trial per member),
+        # then which members and which inquiry types
+        n_contacts = self.rng.binomial(len(members), self._baseline_daily_rate)
+        if not n_contacts:
+            return
+        contacted = np.sort(self.rng.choice(len(members), size=n_contacts, replace=False))
+        interaction_types = self.rng.choice(
+            self._baseline_interaction_types, size=n_contacts
+        )
 
-                    interaction = self.interaction_gen.generate(
-                        policy_id=policy.policy_id,
-                        member_id=member.member_id,
-                        interaction_type_code=interaction_type,
-                    )
+        policy_ids = members.policy_ids
+        member_ids = members.member_ids
+        interactions = [
+            self.interaction_gen.generate(
+                policy_id=policy_ids[idx],
+                member_id=member_ids[idx],
+                interaction_type_code=interaction_type,
+            )
+            for idx, interaction_type in zip(contacted, interaction_types)
+        ]
 
-                    self.batch_writer.add("crm.interaction", interaction.model_dump_db())
-                    self._stats["interactions_created"] += 1
-                    self._stats["baseline_interactions"] += 1
+        if interactions:
+            self.batch_writer.add_many(
+                "crm.interaction", InteractionCreate.model_dump_db_many(interactions)
+            )
+            self._stats["interactions_created"] += len(interactions)
+            self._stats["baseline_interactions"] += len(interactions)
 
     def _schedule_case_resolution(self, case: CaseCreate) -> None:
         """Schedule a case for future UPDATE to RESOLVED status."""
@@ -969,6 +981,7 @@ class CRMProcess(BaseProcess):
             "resolution_date": resolution_date.date(),
             "sla_breached": sla_breached,
         }
+        self._next_case_due = None
 
     def _schedule_complaint_resolution(self, complaint: ComplaintCreate) -> None:
         """Schedule a complaint for future UPDATE through states."""
@@ -1007,87 +1020,150 @@ class CRMProcess(BaseProcess):
             "phio_escalated": phio_escalated,
             "acknowledged": False,
         }
+        self._next_complaint_due = None
 
     def _process_case_lifecycle(self, current_date: date) -> None:
         """Process case resolutions (UPDATE cases to RESOLVED)."""
-        for case_id, data in list(self.pending_cases.items()):
-            resolution_date = data["resolution_date"]
+        if self._next_case_due is not None and current_date < self._next_case_due:
+            return
 
+        due = []
+        next_due = None
+        for case_id, data in self.pending_cases.items():
+            resolution_date = data["resolution_date"]
             if current_date >= resolution_date:
-                # Resolve the case
-                self._resolve_case(case_id, data)
-                del self.pending_cases[case_id]
+                due.append((case_id, data))
+            elif next_due is None or resolution_date < next_due:
+                next_due = resolution_date
+        self._next_case_due = next_due or date.max
 
-    def _resolve_case(self, case_id: UUID, data: dict) -> None:
-        """UPDATE case status to RESOLVED."""
-        # Flush if still in buffer to ensure INSERT is committed for CDC
-        self.batch_writer.flush_for_cdc("service_case", "case_id", case_id)
+        if not due:
+            return
 
-        updates = {
+        # Resolve all due cases as a single group; timestamps are invariant
+        # within the tick, so format them once
+        now = self.sim_env.current_datetime
+        self._resolve_cases(due, now, now.isoformat())
+        for case_id, _ in due:
+            del self.pending_cases[case_id]
+
+    def _build_case_update(self, data: dict, now_iso: str) -> dict[str, Any]:
+        """Build the RESOLVED update for a pending case."""
+        return {
             "status": CaseStatus.RESOLVED.value,
-            "resolution_date": self.sim_env.current_datetime.isoformat(),
+            "resolution_date": now_iso,
             "sla_breached": data["sla_breached"],
-            "modified_at": self.sim_env.current_datetime.isoformat(),
+            "modified_at": now_iso,
             "modified_by": "SIMULATION",
         }
 
-        self.batch_writer.update_record("service_case", "case_id", case_id, updates)
-        self._stats["cases_resolved"] += 1
+    def _resolve_cases(
+        self, due: list[tuple[UUID, dict]], now: datetime, now_iso: str
+    ) -> None:
+        """UPDATE case status to RESOLVED for a group of cases."""
+        resolved = [
+            (case_id, self._build_case_update(data, now_iso)) for case_id, data in due
+        ]
+
+        # Flush once if any is still in buffer to ensure INSERTs are committed for CDC
+        self.batch_writer.flush_for_cdc_many(
+            "service_case", "case_id", [case_id for case_id, _ in resolved]
+        )
+        self.batch_writer.update_many("service_case", "case_id", resolved)
+        self._stats["cases_resolved"] += len(resolved)
 
-        # Emit event for CSAT survey
+        # Emit events for CSAT survey
         if self.shared_state:
-            case = data["case"]
-            self.shared_state.add_crm_event(
-                {
-                    "event_type": "case_resolved",
-                    "case_id": case_id,
-                    "policy_id": case.policy_id,
-                    "member_id": case.member_id,
-                    "sla_breached": data["sla_breached"],
-                    "timestamp": self.sim_env.current_datetime,
-                }
-            )
+            self.shared_state.add_crm_events([
+                CRMEvent(
+                    event_type="case_resolved",
+                    case_id=case_id,
+                    policy_id=data["case"].policy_id,
+                    member_id=data["case"].member_id,
+                    sla_breached=data["sla_breached"],
+                    timestamp=now,
+                )
+                for case_id, data in due
+            ])
 
     def _process_complaint_lifecycle(self, current_date: date) -> None:
         """Process complaint lifecycle (RECEIVED -> ACKNOWLEDGED -> RESOLVED)."""
-        for complaint_id, data in list(self.pending_complaints.items()):
-            complaint = data["complaint"]
+        if self._next_complaint_due is not None and current_date < self._next_complaint_due:
+            return
 
+        to_acknowledge: list[UUID] = []
+        to_resolve: list[tuple[UUID, dict]] = []
+        next_due = date.max
+
+        for complaint_id, data in self.pending_complaints.items():
             # Acknowledge after 1-2 days
             if not data["acknowledged"]:
-                days_since_received = (current_date - complaint.received_date).days
+                days_since_received = (current_date - data["complaint"].received_date).days
                 if days_since_received >= 1:
-                    self._acknowledge_complaint(complaint_id)
+                    to_acknowledge.append(complaint_id)
                     data["acknowledged"] = True
+                else:
+                    next_due = min(next_due, data["complaint"].received_date + timedelta(days=1))
 
             # Resolve on resolution date
             if current_date >= data["resolution_date"]:
-                self._resolve_complaint(complaint_id, data)
-                del self.pending_complaints[complaint_id]
+                to_resolve.append((complaint_id, data))
+            else:
+                next_due = min(next_due, data["resolution_date"])
+
+        self._next_complaint_due = next_due
 
-    def _acknowledge_complaint(self, complaint_id: UUID) -> None:
-        """UPDATE complaint status to ACKNOWLEDGED."""
-        self.batch_writer.flush_for_cdc("complaint", "complaint_id", complaint_id)
+        if not to_acknowledge and not to_resolve:
+            return
+
+        # Single CDC flush for both groups (same table)
+        self.batch_writer.flush_for_cdc_many(
+            "complaint",
+            "complaint_id",
+            to_acknowledge + [complaint_id for complaint_id, _ in to_resolve],
+        )
+
+        now = self.sim_env.current_datetime
+        now_iso = now.isoformat()
+        today_iso = current_date.isoformat()
+
+        # Acknowledgements are applied before resolutions so a complaint
+        # acknowledged and resolved on the same day ends up RESOLVED
+        if to_acknowledge:
+            self._acknowledge_complaints(to_acknowledge, now_iso, today_iso)
+
+        if to_resolve:
+            self._resolve_complaints(to_resolve, now, now_iso, today_iso)
+            for complaint_id, _ in to_resolve:
+                del self.pending_complaints[complaint_id]
 
+    def _acknowledge_complaints(
+        self, complaint_ids: list[UUID], now_iso: str, today_iso: str
+    ) -> None:
+        """UPDATE complaint status to ACKNOWLEDGED for a group of complaints."""
         updates = {
             "status": ComplaintStatus.ACKNOWLEDGED.value,
-            "acknowledged_date": self.sim_env.current_date.isoformat(),
-            "modified_at": self.sim_env.current_datetime.isoformat(),
+            "acknowledged_date": today_iso,
+            "modified_at": now_iso,
             "modified_by": "SIMULATION",
         }
 
-        self.batch_writer.update_record("complaint", "complaint_id", complaint_id, updates)
-
-    def _resolve_complaint(self, complaint_id: UUID, data: dict) -> None:
-        """UPDATE complaint status to RESOLVED."""
-        self.batch_writer.flush_for_cdc("complaint", "complaint_id", complaint_id)
+        self.batch_writer.update_many(
+            "complaint",
+            "complaint_id",
+            [(complaint_id, dict(updates)) for complaint_id in complaint_ids],
+        )
 
+    def _build_complaint_resolution(
+        self, data: dict, now_iso: str, today_iso: str
+    ) -> dict[str, Any]:
+        """Build the RESOLVED update for a pending complaint."""
         updates = {
             "status": ComplaintStatus.RESOLVED.value,
-            "resolution_date": self.sim_env.current_date.isoformat(),
+            "resolution_date": today_iso,
             "resolution_outcome": data["resolution_outcome"],
             "phio_escalated": data["phio_escalated"],
-            "modified_at": self.sim_env.current_datetime.isoformat(),
+            "modified_at": now_iso,
             "modified_by": "SIMULATION",
         }
 
@@ -1096,35 +1172,43 @@ class CRMProcess(BaseProcess):
             escalation_date = complaint.received_date + timedelta(days=14)
             updates["phio_escalation_date"] = escalation_date.isoformat()
 
-        self.batch_writer.update_record("complaint", "complaint_id", complaint_id, updates)
-        self._stats["complaints_resolved"] += 1
+        return updates
+
+    def _resolve_complaints(
+        self,
+        due: list[tuple[UUID, dict]],
+        now: datetime,
+        now_iso: str,
+        today_iso: str,
+    ) -> None:
+        """UPDATE complaint status to RESOLVED for a group of complaints."""
+        self.batch_writer.update_many(
+            "complaint",
+            "complaint_id",
+            [
+                (complaint_id, self._build_complaint_resolution(data, now_iso, today_iso))
+                for complaint_id, data in due
+            ],
+        )
+        self._stats["complaints_resolved"] += len(due)
 
-        # Emit event for NPS survey
+        # Emit events for NPS survey
         if self.shared_state:
-            complaint = data["complaint"]
-            self.shared_state.add_crm_event(
-                {
-                    "event_type": "complaint_resolved",
-                    "complaint_id": complaint_id,
-                    "policy_id": complaint.policy_id,
-                    "member_id": complaint.member_id,
-                    "resolution_outcome": data["resolution_outcome"],
-                    "timestamp": self.sim_env.current_datetime,
-                }
-            )
+            self.shared_state.add_crm_events([
+                CRMEvent(
+                    event_type="complaint_resolved",
+                    complaint_id=complaint_id,
+                    policy_id=data["complaint"].policy_id,
+                    member_id=data["complaint"].member_id,
+                    resolution_outcome=data["resolution_outcome"],
+                    timestamp=now,
+                )
+                for complaint_id, data in due
+            ])
 
     def _get_trigger_event_type(self, event_type: str) -> Optional[TriggerEventType]:
         """Convert string event type to TriggerEventType enum."""
-        mapping = {
-            "claim_submitted": TriggerEventType.CLAIM_SUBMITTED,
-            "claim_rejected": TriggerEventType.CLAIM_REJECTED,
-            "claim_delayed": TriggerEventType.CLAIM_DELAYED,
-            "claim_paid": TriggerEventType.CLAIM_PAID,
-            "payment_failed": TriggerEventType.PAYMENT_FAILED,
-            "arrears_created": TriggerEventType.ARREARS_CREATED,
-            "policy_suspended": TriggerEventType.POLICY_SUSPENDED,
-        }
-        return mapping.get(event_type)
+        return TRIGGER_EVENT_TYPE_BY_NAME.get(event_type)
 
     def _log_progress(self) -> None:
         """Log process statistics."""
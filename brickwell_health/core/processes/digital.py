@@ -5,14 +5,21 @@ Generates web sessions and digital events for member behavioral analytics.
 """
 
 from datetime import date
-from typing import Any, Generator, Optional, TYPE_CHECKING
+from typing import Any, Generator, TYPE_CHECKING
 from uuid import UUID
 
+import numpy as np
 import structlog
 
 from brickwell_health.core.processes.base import BaseProcess
+from brickwell_health.core.shared_state import (
+    INACTIVE_POLICY_STATUSES,
+    CRMEvent,
+    CRMQueueEvent,
+    MemberColumns,
+)
 from brickwell_health.domain.digital import WebSessionCreate, DigitalEventCreate
-from brickwell_health.domain.enums import TriggerEventType
+from brickwell_health.domain.enums import TRIGGER_EVENT_TYPE_BY_NAME, TriggerEventType
 from brickwell_health.generators.digital_generator import DigitalBehaviorGenerator
 
 if TYPE_CHECKING:
@@ -78,18 +85,24 @@ class DigitalBehaviorProcess(BaseProcess):
             "engagement_distribution", {"high": 0.15, "medium": 0.35, "low": 0.50}
         )
 
-        # Trigger session probabilities
-        self.trigger_session_probs = {
-            "claim_submitted": 0.40,
-            "claim_rejected": 0.50,
-            "claim_paid": 0.25,
-            "invoice_issued": 0.30,
-            "payment_failed": 0.50,
-            "renewal_reminder": 0.35,
+        # Trigger session probabilities, keyed by the event's TriggerEventType
+        self._trigger_session_probs: dict[TriggerEventType, float] = {
+            TriggerEventType.CLAIM_SUBMITTED: 0.40,
+            TriggerEventType.CLAIM_REJECTED: 0.50,
+            TriggerEventType.CLAIM_PAID: 0.25,
+            TriggerEventType.INVOICE_ISSUED: 0.30,
+            TriggerEventType.PAYMENT_FAILED: 0.50,
+            TriggerEventType.RENEWAL_REMINDER: 0.35,
         }
 
         # Track processed trigger events to avoid duplicates
-        self._processed_triggers: set[str] = set()
+        # Key: (TriggerEventType, claim_id or invoice_id)
+        self._processed_triggers: set[tuple[TriggerEventType, Any]] = set()
+
+        # Engagement-level groups over SharedState.members_soa(), recomputed
+        # when that column view is rebuilt
+        self._groups_source: MemberColumns | None = None
+        self._groups: list[tuple[np.ndarray, float]] = []
 
         # Statistics
         self._stats = {
@@ -130,25 +143,39 @@ class DigitalBehaviorProcess(BaseProcess):
         # Peek at CRM events (don't consume - they're for CRM/Communication)
         events = self.shared_state.peek_crm_events()
 
+        probs = self._trigger_session_probs
+
         for event in events:
-            event_type = event.get("event_type", "").lower()
+            code = event.get("event_type_code")
+            if code is None:
+                # Cold path: events queued without a resolved code
+                code = TRIGGER_EVENT_TYPE_BY_NAME.get(
+                    event.get("event_type", "").lower()
+                )
+                if code is None:
+                    continue
+
+            prob = probs.get(code, 0.0)
+            if prob <= 0:
+                continue
 
             # Create unique key for this trigger
             event_id = event.get("claim_id") or event.get("invoice_id")
-            trigger_key = f"{event_type}:{event_id}"
+            trigger_key = (code, event_id)
 
             # Skip if already processed
             if trigger_key in self._processed_triggers:
                 continue
 
             # Check if this event should trigger a session
-            prob = self.trigger_session_probs.get(event_type, 0)
-            if prob > 0 and self.rng.random() < prob:
-                self._generate_trigger_session(event)
+            if self.rng.random() < prob:
+                self._generate_trigger_session(event, code)
                 self._processed_triggers.add(trigger_key)
                 self._stats["trigger_sessions"] += 1
 
-    def _generate_trigger_session(self, event: dict) -> None:
+    def _generate_trigger_session(
+        self, event: CRMQueueEvent, trigger_type: TriggerEventType
+    ) -> None:
         """Generate a session triggered by an event."""
         member_id = event.get("member_id")
         policy_id = event.get("policy_id")
@@ -156,8 +183,6 @@ class DigitalBehaviorProcess(BaseProcess):
         if not member_id or not policy_id:
             return
 
-        # Map event type to TriggerEventType
-        trigger_type = self._map_trigger_type(event.get("event_type", ""))
         trigger_id = event.get("claim_id") or event.get("invoice_id")
 
         # Get member engagement level
@@ -173,72 +198,109 @@ class DigitalBehaviorProcess(BaseProcess):
         )
 
         # Write to database
-        self._write_session_and_events(session, events)
+        self._write_sessions_and_events([session], events)
 
     def _generate_baseline_sessions(self, current_date: date) -> None:
         """Generate baseline sessions based on member engagement levels."""
         if not self.shared_state:
             return
 
-        for pm_id, member_data in self.shared_state.policy_members.items():
-            policy = member_data.get("policy")
-            member = member_data.get("member")
-
-            if not policy or not member:
-                continue
+        members = self.shared_state.members_soa()
+        if not len(members):
+            return
 
-            # Check policy status
-            policy_data = self.shared_state.active_policies.get(policy.policy_id, {})
-            policy_status = policy_data.get("status", "")
-            if policy_status in ("Suspended", "Lapsed", "Cancelled"):
+        # Per engagement level: how many members have a session today, then
+        # which ones (equivalent to one Bernoulli trial per member)
+        fired_groups = []
+        for group, daily_rate in self._engagement_groups(members):
+            n_fired = self.rng.binomial(len(group), daily_rate)
+            if n_fired:
+                fired_groups.append(
+                    group[self.rng.choice(len(group), size=n_fired, replace=False)]
+                )
+        if not fired_groups:
+            return
+        fired = np.sort(np.concatenate(fired_groups))
+
+        # Status is mutated in place by billing/suspension, so it is checked
+        # for today's fires only rather than cached in the index
+        active_policies = self.shared_state.active_policies
+        policy_ids = members.policy_ids
+        member_ids = members.member_ids
+        engagement = members.engagement_idx
+        levels = members.engagement_levels
+        sessions: list[WebSessionCreate] = []
+        session_events: list[DigitalEventCreate] = []
+
+        for i in fired:
+            policy_id = policy_ids[i]
+            policy_data = active_policies.get(policy_id)
+            if policy_data is not None and policy_data.get("status") in INACTIVE_POLICY_STATUSES:
                 continue
 
-            # Get engagement level
-            engagement_level = self._get_engagement_level(member.member_id)
-
-            # Calculate daily session probability
-            monthly_rate = self.sessions_per_month.get(engagement_level, 2.5)
-            daily_rate = monthly_rate / 30
-
-            # Check if member has a session today
-            if self.rng.random() < daily_rate:
-                session, events = self.digital_gen.generate_session(
-                    member_id=member.member_id,
-                    policy_id=policy.policy_id,
-                    engagement_level=engagement_level,
+            session, events = self.digital_gen.generate_session(
+                member_id=member_ids[i],
+                policy_id=policy_id,
+                engagement_level=levels[engagement[i]],
+            )
+            sessions.append(session)
+            session_events.extend(events)
+
+        self._write_sessions_and_events(sessions, session_events)
+        self._stats["baseline_sessions"] += len(sessions)
+
+    def _engagement_groups(
+        self, members: MemberColumns
+    ) -> list[tuple[np.ndarray, float]]:
+        """Get (row positions, daily session rate) per engagement level."""
+        if members is not self._groups_source:
+            self._groups = [
+                (
+                    np.flatnonzero(members.engagement_idx == idx),
+                    self.sessions_per_month.get(level, 2.5) / 30,
                 )
+                for idx, level in enumerate(members.engagement_levels)
+            ]
+            self._groups_source = members
+        return self._groups
 
-                self._write_session_and_events(session, events)
-                self._stats["baseline_sessions"] += 1
-
-    def _write_session_and_events(
-        self, session: WebSessionCreate, events: list[DigitalEventCreate]
+    def _write_sessions_and_events(
+        self, sessions: list[WebSessionCreate], events: list[DigitalEventCreate]
     ) -> None:
-        """Write session and events to database."""
-        # Write session
-        self.batch_writer.add("digital.web_session", session.model_dump_db())
-        self._stats["sessions_created"] += 1
+        """Write sessions and their events to database."""
+        if not sessions:
+            return
+
+        # Write sessions before events (event rows reference their session)
+        self.batch_writer.add_many(
+            "digital.web_session", WebSessionCreate.model_dump_db_many(sessions)
+        )
+        self._stats["sessions_created"] += len(sessions)
 
         # Track cancel page views
-        if session.viewed_cancel_page:
+        for session in sessions:
+            if not session.viewed_cancel_page:
+                continue
             self._stats["cancel_page_views"] += 1
 
             # Emit event for churn risk tracking
             if self.shared_state:
                 self.shared_state.add_crm_event(
-                    {
-                        "event_type": "cancel_page_viewed",
-                        "member_id": session.member_id,
-                        "policy_id": session.policy_id,
-                        "session_id": session.session_id,
-                        "timestamp": session.session_start,
-                    }
+                    CRMEvent(
+                        event_type="cancel_page_viewed",
+                        member_id=session.member_id,
+                        policy_id=session.policy_id,
+                        session_id=session.session_id,
+                        timestamp=session.session_start,
+                    )
                 )
 
         # Write events
-        for event in events:
-            self.batch_writer.add("digital.digital_event", event.model_dump_db())
-            self._stats["events_created"] += 1
+        if events:
+            self.batch_writer.add_many(
+                "digital.digital_event", DigitalEventCreate.model_dump_db_many(events)
+            )
+            self._stats["events_created"] += len(events)
 
     def _get_engagement_level(self, member_id: UUID) -> str:
         """Get engagement level for a member from SharedState."""
@@ -246,19 +308,6 @@ class DigitalBehaviorProcess(BaseProcess):
             return self.shared_state.get_engagement_level(member_id)
         return "medium"
 
-    def _map_trigger_type(self, event_type: str) -> Optional[TriggerEventType]:
-        """Map event type string to TriggerEventType enum."""
-        mapping = {
-            "claim_submitted": TriggerEventType.CLAIM_SUBMITTED,
-            "claim_rejected": TriggerEventType.CLAIM_REJECTED,
-            "claim_paid": TriggerEventType.CLAIM_PAID,
-            "invoice_issued": TriggerEventType.INVOICE_ISSUED,
-            "payment_failed": TriggerEventType.PAYMENT_FAILED,
-            "renewal_reminder": TriggerEventType.RENEWAL_REMINDER,
-            "arrears_created": TriggerEventType.ARREARS_CREATED,
-        }
-        return mapping.get(event_type.lower())
-
     def _log_progress(self) -> None:
         """Log process statistics."""
         logger.info(
@@ -270,7 +319,3 @@ class DigitalBehaviorProcess(BaseProcess):
             trigger_sessions=self._stats["trigger_sessions"],
             baseline_sessions=self._stats["baseline_sessions"],
         )
-
-    def get_stats(self) -> dict[str, int]:
-        """Get process statistics."""
-        return self._stats.copy()
@@ -10,15 +10,17 @@ Handles member demographic changes over time:
 - Death processing
 """
 
+import json
 from datetime import date, timedelta
 from typing import Any, Generator, TYPE_CHECKING
 from uuid import UUID
 
+import numpy as np
 import structlog
 
 from brickwell_health.core.processes.base import BaseProcess
-from brickwell_health.domain.enums import MaritalStatus, MemberChangeType, MemberRole
-from brickwell_health.domain.member import MemberUpdate
+from brickwell_health.domain.enums import Gender, MaritalStatus, MemberChangeType, MemberRole
+from brickwell_health.domain.member import MemberCreate
 from brickwell_health.generators.billing_generator import BillingGenerator
 from brickwell_health.generators.member_generator import MemberGenerator
 
@@ -28,6 +30,43 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+# Member change event types consumed by PolicyLifecycleProcess
+_EVENT_ADDRESS_CHANGE = "ADDRESS_CHANGE"
+_EVENT_DEATH = "DEATH"
+
+_ROLE_PRIMARY = MemberRole.PRIMARY.value
+
+# Statuses from which a name change is treated as a marriage (otherwise divorce)
+_UNPARTNERED_STATUSES = frozenset({
+    MaritalStatus.SINGLE,
+    MaritalStatus.DIVORCED,
+    MaritalStatus.WIDOWED,
+})
+
+# Member columns written by batched updates, with their SQL types
+MEMBER_COLUMN_TYPES = {
+    "address_line_1": "text",
+    "address_line_2": "text",
+    "suburb": "text",
+    "state": "text",
+    "postcode": "text",
+    "mobile_phone": "text",
+    "email": "text",
+    "last_name": "text",
+    "title": "text",
+    "marital_status": "text",
+    "preferred_name": "text",
+    "medicare_expiry_date": "date",
+    "deceased_flag": "boolean",
+    "deceased_date": "date",
+}
+
+# SET fragments per column, built once so flushes only join them
+_MEMBER_SET_CLAUSES = {
+    column: f"{column} = v.{column}::{sql_type}"
+    for column, sql_type in MEMBER_COLUMN_TYPES.items()
+}
+
 
 class MemberLifecycleProcess(BaseProcess):
     """
@@ -45,6 +84,11 @@ class MemberLifecycleProcess(BaseProcess):
     Changes are tracked in the member_update table for audit trail.
     Significant events (death, address change) are queued for other
     processes to react to.
+
+    Each SimulationWorker runs its own instance over its own SharedState,
+    which only holds policies in that worker's UUID partition, so the
+    daily member pass is already sharded across worker processes. Members
+    never interact, so no cross-worker coordination is needed.
     """
 
     # Default death rates by age group (annual)
@@ -57,6 +101,29 @@ class MemberLifecycleProcess(BaseProcess):
         "81+": 0.05,
     }
 
+    # Rate-driven member changes as (config key, default annual rate), in the
+    # order they are applied to a member within a day
+    CHANGE_RATE_DEFAULTS = (
+        ("address_change_rate", 0.12),
+        ("phone_change_rate", 0.08),
+        ("email_change_rate", 0.05),
+        ("name_change_rate", 0.015),
+        ("marital_status_change_rate", 0.02),
+        ("preferred_name_rate", 0.01),
+    )
+
+    # Oldest age with its own entry in the daily death rate table
+    MAX_AGE = 120
+
+    # Expiry ordinal for members without a Medicare expiry date (never due)
+    NO_EXPIRY = np.iinfo(np.int64).max
+
+    # Shared empty result for trials with no hits
+    _NO_HITS = np.empty(0, dtype=np.int64)
+
+    # Maximum rows per batched member UPDATE (keeps bind parameters bounded)
+    MEMBER_UPDATE_CHUNK_ROWS = 1000
+
     def __init__(
         self,
         *args: Any,
@@ -92,6 +159,40 @@ class MemberLifecycleProcess(BaseProcess):
         # Load configuration
         self.lifecycle_config = self.config.member_lifecycle
 
+        # Rates and windows are fixed for the run, so resolve them once
+        self._change_rates = np.array([
+            self.annual_rate_to_daily(self._get_config_rate(key, default))
+            for key, default in self.CHANGE_RATE_DEFAULTS
+        ])
+        self._mandate_daily_rate = self.annual_rate_to_daily(
+            self._get_config_rate("mandate_change_rate", 0.03)
+        )
+        self._interstate_rate = self._get_config_rate("interstate_move_rate", 0.15)
+        self._marital_trigger_rate = self._get_config_rate("name_change_triggers_marital", 0.8)
+        self._renewal_advance = timedelta(
+            days=int(self._get_config_rate("medicare_renewal_advance_days", 30))
+        )
+
+        # Member column updates queued during a day, keyed by column tuple
+        self._pending_member_updates: dict[tuple[str, ...], dict[UUID, tuple]] = {}
+
+        # ISO form of the day being processed, shared by that day's payloads
+        self._today_iso = ""
+
+        # Member change events queued during a day, handed to shared state in one batch
+        self._pending_change_events: list[dict[str, Any]] = []
+
+        # Daily death probability indexed by age (ages above MAX_AGE use the last entry)
+        self._daily_death_rate_by_age: np.ndarray = np.array([
+            self.annual_rate_to_daily(self._get_death_rate(age))
+            for age in range(self.MAX_AGE + 1)
+        ])
+
+        # Per-member columns for the live member tuple they were built from
+        self._death_groups: list[tuple[float, np.ndarray]] = []
+        self._expiry_ordinals: np.ndarray = np.empty(0, dtype=np.int64)
+        self._member_columns_source: tuple[UUID, ...] | None = None
+
     def run(self) -> Generator:
         """
         Main member lifecycle process loop.
@@ -111,16 +212,10 @@ class MemberLifecycleProcess(BaseProcess):
 
             current_date = self.sim_env.current_date
 
-            # Process each type of member change
-            self._process_address_changes(current_date)
-            self._process_phone_changes(current_date)
-            self._process_email_changes(current_date)
-            self._process_name_changes(current_date)
-            self._process_marital_status_changes(current_date)
-            self._process_preferred_name_updates(current_date)
+            # Demographic changes, Medicare renewals and deaths share one
+            # pass over members; mandates are policy-scoped
+            self._process_member_changes(current_date)
             self._process_mandate_changes(current_date)
-            self._process_medicare_renewals(current_date)
-            self._process_deaths(current_date)
 
             # Wait until next day
             yield self.env.timeout(1.0)
@@ -150,250 +245,357 @@ class MemberLifecycleProcess(BaseProcess):
         else:
             return death_rates.get("81+", 0.05)
 
-    def _process_address_changes(self, current_date: date) -> None:
-        """Process potential address changes for all members."""
-        if not self.shared_state:
+    def _process_member_changes(self, current_date: date) -> None:
+        """
+        Process all per-member changes in a single pass over policy members.
+
+        Each member's trials for the day (six demographic changes plus death)
+        and the Medicare renewal due check are evaluated up-front as array
+        operations; only members with at least one event are then visited
+        and dispatched to the matching handlers.
+        """
+        shared_state = self.shared_state
+        if not shared_state:
             return
 
-        annual_rate = self._get_config_rate("address_change_rate", 0.12)
-        daily_rate = self.annual_rate_to_daily(annual_rate)
-        interstate_rate = self._get_config_rate("interstate_move_rate", 0.15)
+        policy_members = shared_state.policy_members
+        live_ids = shared_state.live_policy_member_ids()
+        if not live_ids:
+            return
 
-        for pm_id, data in list(self.shared_state.policy_members.items()):
-            if self.rng.random() >= daily_rate:
-                continue
+        self._today_iso = current_date.isoformat()
+        renewal_threshold = current_date + self._renewal_advance
+        hits, fired, died, renewal_due = self._select_daily_events(
+            policy_members, live_ids, renewal_threshold
+        )
 
-            member = data.get("member")
-            if not member or getattr(member, "deceased_flag", False):
+        # Bind handlers once per day rather than per selected member
+        change_address = self._change_address
+        change_phone = self._change_phone
+        change_email = self._change_email
+        change_name = self._change_name
+        change_marital_status = self._change_marital_status
+        add_preferred_name = self._add_preferred_name
+        renew_medicare = self._renew_medicare
+        record_death = self._record_death
+        expiry_ordinals = self._expiry_ordinals
+
+        for idx, changes, death, renew in zip(hits, fired, died, renewal_due):
+            pm_id = live_ids[idx]
+            data = policy_members.get(pm_id)
+            member = data.get("member") if data else None
+            if not data or not member:
                 continue
 
-            policy = data.get("policy")
-            if not policy:
-                continue
+            address, phone, email, name, marital, preferred = changes
+            if address:
+                change_address(shared_state, member, data, current_date)
+            if phone:
+                change_phone(shared_state, member, current_date)
+            if email:
+                change_email(shared_state, member, current_date)
+            if name:
+                change_name(shared_state, member, data, current_date)
+            if marital:
+                change_marital_status(shared_state, member, data, current_date)
+            if preferred:
+                add_preferred_name(shared_state, member, current_date)
+
+            if renew:
+                new_expiry = renew_medicare(
+                    shared_state, member, member.medicare_expiry_date, current_date
+                )
+                expiry_ordinals[idx] = new_expiry.toordinal()
+
+            if death:
+                record_death(shared_state, pm_id, member, data, current_date)
+
+        self._flush_member_updates()
+        if self._pending_change_events:
+            shared_state.add_member_change_events(self._pending_change_events)
+            self._pending_change_events = []
+
+    def _select_daily_events(
+        self,
+        policy_members: dict[UUID, dict[str, Any]],
+        live_ids: tuple[UUID, ...],
+        renewal_threshold: date,
+    ) -> tuple[list[int], list[list[bool]], list[bool], list[bool]]:
+        """
+        Select the live members with at least one event today.
 
-            # Generate new address
-            new_address = self.member_gen.generate_new_address(
-                current_state=member.state,
-                interstate_move_rate=interstate_rate,
-            )
+        Each trial type is drawn as a hit count from a Binomial and then
+        that many distinct members (see _draw_hits); death trials are drawn
+        per age-rate group. The Medicare due check is a single array
+        comparison. The caller's Python loop only runs for selected members.
 
-            # Track previous values
-            previous_values = {
-                "address_line_1": member.address_line_1,
-                "address_line_2": member.address_line_2,
-                "suburb": member.suburb,
-                "state": member.state,
-                "postcode": member.postcode,
-            }
-
-            # Create member update record
-            self._create_member_update(
-                member_id=member.member_id,
-                change_type=MemberChangeType.ADDRESS_CHANGE,
-                change_date=current_date,
-                previous_values=previous_values,
-                new_values=new_address,
-                reason="Member relocation",
-            )
+        Returns:
+            Tuple of (sorted indices into live_ids, per-hit change flags in
+            CHANGE_RATE_DEFAULTS order, per-hit death flags, per-hit
+            Medicare renewal flags)
+        """
+        death_groups, expiry_ordinals = self._live_member_columns(policy_members, live_ids)
+        n = len(live_ids)
+
+        change_hits = [self._draw_hits(n, rate) for rate in self._change_rates]
+        death_hits = [
+            members[self._draw_hits(len(members), rate)] for rate, members in death_groups
+        ]
+        renewal_hits = np.flatnonzero(expiry_ordinals <= renewal_threshold.toordinal())
+
+        hits = np.unique(np.concatenate([*change_hits, *death_hits, renewal_hits]))
+        if not len(hits):
+            return [], [], [], []
+
+        fired = np.column_stack([np.isin(hits, idx) for idx in change_hits])
+        return (
+            hits.tolist(),
+            fired.tolist(),
+            np.isin(hits, np.concatenate(death_hits)).tolist(),
+            np.isin(hits, renewal_hits).tolist(),
+        )
 
-            # Update member record in database
-            self._update_member_in_db(member.member_id, new_address, current_date)
-
-            # Update cached member data
-            self.shared_state.update_member_data(member.member_id, new_address)
-
-            # Queue event for policy/billing processes
-            self.shared_state.add_member_change_event(
-                member_id=member.member_id,
-                policy_id=policy.policy_id,
-                change_type="ADDRESS_CHANGE",
-                change_data={
-                    "previous_state": previous_values["state"],
-                    "new_state": new_address["state"],
-                    "member_role": data.get("member_role"),
-                    "date": current_date.isoformat(),
-                },
-            )
+    def _draw_hits(self, n: int, daily_rate: float) -> np.ndarray:
+        """
+        Draw which of ``n`` members fire an independent daily trial.
 
-            self.increment_stat("address_changes")
-            logger.debug(
-                "member_address_changed",
-                member_id=str(member.member_id),
-                from_state=previous_values["state"],
-                to_state=new_address["state"],
-            )
+        Samples the hit count from Binomial(n, daily_rate) and then that
+        many distinct indices uniformly, which is distributed exactly like
+        n Bernoulli draws but needs only a handful of random numbers for
+        rare events, and none at all on the (common) zero-hit days.
+        """
+        rng = self.rng
+        k = rng.binomial(n, daily_rate) if n else 0
+        if k == 0:
+            return self._NO_HITS
+        return rng.choice(n, size=k, replace=False, shuffle=False)
+
+    def _live_member_columns(
+        self, policy_members: dict[UUID, dict[str, Any]], live_ids: tuple[UUID, ...]
+    ) -> tuple[list[tuple[float, np.ndarray]], np.ndarray]:
+        """
+        Get death-rate groups and Medicare expiry ordinals for ``live_ids``.
 
-    def _process_phone_changes(self, current_date: date) -> None:
-        """Process potential phone number changes."""
-        if not self.shared_state:
+        Death groups pair each distinct daily death probability with the
+        live_ids indices of members at that rate. Ages don't change while a
+        member is tracked and expiries only move through _renew_medicare
+        (which patches its entry), so both are only rebuilt when the live
+        member set does. Members without an expiry date never come due.
+        """
+        if live_ids is not self._member_columns_source:
+            ages = np.empty(len(live_ids), dtype=np.int64)
+            expiries = np.full(len(live_ids), self.NO_EXPIRY, dtype=np.int64)
+
+            for idx, pm_id in enumerate(live_ids):
+                data = policy_members[pm_id]
+                ages[idx] = data.get("age", 50)
+                member = data.get("member")
+                expiry = member.medicare_expiry_date if member else None
+                if expiry:
+                    expiries[idx] = expiry.toordinal()
+
+            death_rates = self._daily_death_rate_by_age[np.clip(ages, 0, self.MAX_AGE)]
+            rates, group_of = np.unique(death_rates, return_inverse=True)
+            order = np.argsort(group_of, kind="stable")
+            bounds = np.searchsorted(group_of[order], np.arange(len(rates) + 1))
+            self._death_groups = [
+                (float(rate), order[bounds[g]:bounds[g + 1]])
+                for g, rate in enumerate(rates)
+            ]
+            self._expiry_ordinals = expiries
+            self._member_columns_source = live_ids
+        return self._death_groups, self._expiry_ordinals
+
+    def _change_address(
+        self,
+        shared_state: "SharedState",
+        member: MemberCreate,
+        member_data: dict[str, Any],
+        current_date: date,
+    ) -> None:
+        """Move a member to a new address."""
+        policy = member_data.get("policy")
+        if not policy:
             return
 
-        annual_rate = self._get_config_rate("phone_change_rate", 0.08)
-        daily_rate = self.annual_rate_to_daily(annual_rate)
-
-        for pm_id, data in list(self.shared_state.policy_members.items()):
-            if self.rng.random() >= daily_rate:
-                continue
-
-            member = data.get("member")
-            if not member or getattr(member, "deceased_flag", False):
-                continue
-
-            # Generate new phone
-            new_phone = self.member_gen.generate_new_phone()
-            previous_phone = member.mobile_phone
-
-            # Create update record
-            self._create_member_update(
-                member_id=member.member_id,
-                change_type=MemberChangeType.PHONE_CHANGE,
-                change_date=current_date,
-                previous_values={"mobile_phone": previous_phone},
-                new_values={"mobile_phone": new_phone},
-                reason="Phone number update",
-            )
-
-            # Update database
-            self._update_member_in_db(
-                member.member_id,
-                {"mobile_phone": new_phone},
-                current_date,
-            )
-
-            # Update cache
-            self.shared_state.update_member_data(
-                member.member_id,
-                {"mobile_phone": new_phone},
-            )
-
-            self.increment_stat("phone_changes")
+        # Generate new address
+        new_address = self.member_gen.generate_new_address(
+            current_state=member.state,
+            interstate_move_rate=self._interstate_rate,
+        )
 
-    def _process_email_changes(self, current_date: date) -> None:
-        """Process potential email address changes."""
-        if not self.shared_state:
-            return
+        # Track previous values
+        previous_values = {
+            "address_line_1": member.address_line_1,
+            "address_line_2": member.address_line_2,
+            "suburb": member.suburb,
+            "state": member.state,
+            "postcode": member.postcode,
+        }
 
-        annual_rate = self._get_config_rate("email_change_rate", 0.05)
-        daily_rate = self.annual_rate_to_daily(annual_rate)
+        # Create member update record
+        self._create_member_update(
+            member_id=member.member_id,
+            change_type=MemberChangeType.ADDRESS_CHANGE,
+            change_date=current_date,
+            previous_values=previous_values,
+            new_values=new_address,
+            reason="Member relocation",
+        )
 
-        for pm_id, data in list(self.shared_state.policy_members.items()):
-            if self.rng.random() >= daily_rate:
-                continue
+        # Update member record in database
+        self._update_member_in_db(member.member_id, new_address, current_date)
+
+        # Update cached member data
+        shared_state.update_member_data(member.member_id, new_address)
+
+        # Queue event for policy/billing processes
+        self._pending_change_events.append({
+            "member_id": member.member_id,
+            "policy_id": policy.policy_id,
+            "change_type": _EVENT_ADDRESS_CHANGE,
+            "change_data": {
+                "previous_state": previous_values["state"],
+                "new_state": new_address["state"],
+                "member_role": member_data.get("member_role"),
+                "date": self._today_iso,
+            },
+        })
+
+        self.increment_stat("address_changes")
+        logger.debug(
+            "member_address_changed",
+            member_id=str(member.member_id),
+            from_state=previous_values["state"],
+            to_state=new_address["state"],
+        )
 
-            member = data.get("member")
-            if not member or getattr(member, "deceased_flag", False):
-                continue
+    def _change_phone(
+        self, shared_state: "SharedState", member: MemberCreate, current_date: date
+    ) -> None:
+        """Give a member a new phone number."""
+        # Generate new phone
+        new_phone = self.member_gen.generate_new_phone()
+        previous_phone = member.mobile_phone
 
-            # Generate new email
-            new_email = self.member_gen.generate_new_email(
-                member.first_name,
-                member.last_name,
-            )
-            previous_email = member.email
-
-            # Create update record
-            self._create_member_update(
-                member_id=member.member_id,
-                change_type=MemberChangeType.EMAIL_CHANGE,
-                change_date=current_date,
-                previous_values={"email": previous_email},
-                new_values={"email": new_email},
-                reason="Email address update",
-            )
+        # Create update record
+        self._create_member_update(
+            member_id=member.member_id,
+            change_type=MemberChangeType.PHONE_CHANGE,
+            change_date=current_date,
+            previous_values={"mobile_phone": previous_phone},
+            new_values={"mobile_phone": new_phone},
+            reason="Phone number update",
+        )
 
-            # Update database
-            self._update_member_in_db(
-                member.member_id,
-                {"email": new_email},
-                current_date,
-            )
+        # Update database
+        self._update_member_in_db(
+            member.member_id,
+            {"mobile_phone": new_phone},
+            current_date,
+        )
 
-            # Update cache
-            self.shared_state.update_member_data(
-                member.member_id,
-                {"email": new_email},
-            )
+        # Update cache
+        shared_state.update_member_data(
+            member.member_id,
+            {"mobile_phone": new_phone},
+        )
 
-            self.increment_stat("email_changes")
+        self.increment_stat("phone_changes")
 
-    def _process_name_changes(self, current_date: date) -> None:
-        """Process potential name changes (marriage/divorce)."""
-        if not self.shared_state:
-            return
+    def _change_email(
+        self, shared_state: "SharedState", member: MemberCreate, current_date: date
+    ) -> None:
+        """Give a member a new email address."""
+        # Generate new email
+        new_email = self.member_gen.generate_new_email(
+            member.first_name,
+            member.last_name,
+        )
+        previous_email = member.email
 
-        annual_rate = self._get_config_rate("name_change_rate", 0.015)
-        daily_rate = self.annual_rate_to_daily(annual_rate)
-        marital_trigger_rate = self._get_config_rate("name_change_triggers_marital", 0.8)
+        # Create update record
+        self._create_member_update(
+            member_id=member.member_id,
+            change_type=MemberChangeType.EMAIL_CHANGE,
+            change_date=current_date,
+            previous_values={"email": previous_email},
+            new_values={"email": new_email},
+            reason="Email address update",
+        )
 
-        for pm_id, data in list(self.shared_state.policy_members.items()):
-            if self.rng.random() >= daily_rate:
-                continue
+        # Update database
+        self._update_member_in_db(
+            member.member_id,
+            {"email": new_email},
+            current_date,
+        )
 
-            member = data.get("member")
-            if not member or getattr(member, "deceased_flag", False):
-                continue
+        # Update cache
+        shared_state.update_member_data(
+            member.member_id,
+            {"email": new_email},
+        )
 
-            current_status = getattr(member, "marital_status", MaritalStatus.SINGLE)
-            previous_name = member.last_name
-
-            # Determine if this is marriage or divorce
-            if current_status in [MaritalStatus.SINGLE, MaritalStatus.DIVORCED, MaritalStatus.WIDOWED]:
-                # Marriage - take new name
-                new_name = self.member_gen.generate_married_name(previous_name)
-                new_title = "Mrs" if member.gender.value == "Female" else member.title
-            else:
-                # Divorce - may revert name
-                new_name = self.member_gen.generate_divorce_name(previous_name)
-                new_title = "Ms" if member.gender.value == "Female" else member.title
-
-            if new_name == previous_name:
-                continue  # No actual change
-
-            updates = {"last_name": new_name}
-            if new_title != member.title:
-                updates["title"] = new_title
-
-            # Create update record
-            self._create_member_update(
-                member_id=member.member_id,
-                change_type=MemberChangeType.NAME_CHANGE,
-                change_date=current_date,
-                previous_values={"last_name": previous_name, "title": member.title},
-                new_values=updates,
-                reason="Name change (marriage/divorce)",
-            )
+        self.increment_stat("email_changes")
 
-            # Update database
-            self._update_member_in_db(member.member_id, updates, current_date)
+    def _change_name(
+        self,
+        shared_state: "SharedState",
+        member: MemberCreate,
+        member_data: dict[str, Any],
+        current_date: date,
+    ) -> None:
+        """Change a member's last name (marriage/divorce)."""
+        current_status = getattr(member, "marital_status", MaritalStatus.SINGLE)
+        previous_name = member.last_name
 
-            # Update cache
-            self.shared_state.update_member_data(member.member_id, updates)
+        # Determine if this is marriage or divorce
+        if current_status in _UNPARTNERED_STATUSES:
+            # Marriage - take new name
+            new_name = self.member_gen.generate_married_name(previous_name)
+            new_title = "Mrs" if member.gender is Gender.FEMALE else member.title
+        else:
+            # Divorce - may revert name
+            new_name = self.member_gen.generate_divorce_name(previous_name)
+            new_title = "Ms" if member.gender is Gender.FEMALE else member.title
 
-            self.increment_stat("name_changes")
+        if new_name is None:
+            return  # No actual change
 
-            # Potentially trigger marital status change
-            if self.rng.random() < marital_trigger_rate:
-                self._change_marital_status(member, data, current_date)
+        updates: dict[str, Any] = {"last_name": new_name}
+        if new_title != member.title:
+            updates["title"] = new_title
 
-    def _process_marital_status_changes(self, current_date: date) -> None:
-        """Process standalone marital status changes."""
-        if not self.shared_state:
-            return
+        # Create update record
+        self._create_member_update(
+            member_id=member.member_id,
+            change_type=MemberChangeType.NAME_CHANGE,
+            change_date=current_date,
+            previous_values={"last_name": previous_name, "title": member.title},
+            new_values=updates,
+            reason="Name change (marriage/divorce)",
+        )
 
-        annual_rate = self._get_config_rate("marital_status_change_rate", 0.02)
-        daily_rate = self.annual_rate_to_daily(annual_rate)
+        # Update database
+        self._update_member_in_db(member.member_id, updates, current_date)
 
-        for pm_id, data in list(self.shared_state.policy_members.items()):
-            if self.rng.random() >= daily_rate:
-                continue
+        # Update cache
+        shared_state.update_member_data(member.member_id, updates)
 
-            member = data.get("member")
-            if not member or getattr(member, "deceased_flag", False):
-                continue
+        self.increment_stat("name_changes")
 
-            self._change_marital_status(member, data, current_date)
+        # Potentially trigger marital status change
+        if self.rng.random() < self._marital_trigger_rate:
+            self._change_marital_status(shared_state, member, member_data, current_date)
 
-    def _change_marital_status(self, member, member_data: dict, current_date: date) -> None:
+    def _change_marital_status(
+        self,
+        shared_state: "SharedState",
+        member: MemberCreate,
+        member_data: dict[str, Any],
+        current_date: date,
+    ) -> None:
         """Change a member's marital status."""
         current_status = getattr(member, "marital_status", MaritalStatus.SINGLE)
         new_status = self.member_gen.generate_new_marital_status(current_status)
@@ -419,7 +621,7 @@ class MemberLifecycleProcess(BaseProcess):
         )
 
         # Update cache
-        self.shared_state.update_member_data(
+        shared_state.update_member_data(
             member.member_id,
             {"marital_status": new_status},
         )
@@ -432,53 +634,40 @@ class MemberLifecycleProcess(BaseProcess):
             to_status=new_status.value,
         )
 
-    def _process_preferred_name_updates(self, current_date: date) -> None:
-        """Process preferred name updates."""
-        if not self.shared_state:
+    def _add_preferred_name(
+        self, shared_state: "SharedState", member: MemberCreate, current_date: date
+    ) -> None:
+        """Add a preferred name for a member who doesn't have one."""
+        # Only update if no preferred name exists
+        if member.preferred_name:
             return
 
-        annual_rate = self._get_config_rate("preferred_name_rate", 0.01)
-        daily_rate = self.annual_rate_to_daily(annual_rate)
-
-        for pm_id, data in list(self.shared_state.policy_members.items()):
-            if self.rng.random() >= daily_rate:
-                continue
-
-            member = data.get("member")
-            if not member or getattr(member, "deceased_flag", False):
-                continue
-
-            # Only update if no preferred name exists
-            if member.preferred_name:
-                continue
-
-            new_preferred = self.member_gen.generate_preferred_name(member.first_name)
+        new_preferred = self.member_gen.generate_preferred_name(member.first_name)
 
-            # Create update record
-            self._create_member_update(
-                member_id=member.member_id,
-                change_type=MemberChangeType.PREFERRED_NAME_UPDATE,
-                change_date=current_date,
-                previous_values={"preferred_name": None},
-                new_values={"preferred_name": new_preferred},
-                reason="Preferred name added",
-            )
-
-            # Update database
-            self._update_member_in_db(
-                member.member_id,
-                {"preferred_name": new_preferred},
-                current_date,
-            )
+        # Create update record
+        self._create_member_update(
+            member_id=member.member_id,
+            change_type=MemberChangeType.PREFERRED_NAME_UPDATE,
+            change_date=current_date,
+            previous_values={"preferred_name": None},
+            new_values={"preferred_name": new_preferred},
+            reason="Preferred name added",
+        )
 
-            # Update cache
-            self.shared_state.update_member_data(
-                member.member_id,
-                {"preferred_name": new_preferred},
-            )
+        # Update database
+        self._update_member_in_db(
+            member.member_id,
+            {"preferred_name": new_preferred},
+            current_date,
+        )
 
-            self.increment_stat("preferred_name_updates")
+        # Update cache
+        shared_state.update_member_data(
+            member.member_id,
+            {"preferred_name": new_preferred},
+        )
 
+        self.increment_stat("preferred_name_updates")
 
     def _process_mandate_changes(self, current_date: date) -> None:
         """
@@ -493,12 +682,13 @@ class MemberLifecycleProcess(BaseProcess):
         if not self.shared_state:
             return
 
-        annual_rate = self._get_config_rate("mandate_change_rate", 0.03)
-        daily_rate = self.annual_rate_to_daily(annual_rate)
+        daily_rate = self._mandate_daily_rate
         if daily_rate <= 0.0:
             return
 
-        for policy_id, policy_data in list(self.shared_state.active_policies.items()):
+        # Only the cached mandate on each entry is replaced below, so the
+        # dict can be walked directly without copying its items
+        for policy_id, policy_data in self.shared_state.active_policies.items():
             if policy_data.get("status") != "Active":
                 continue
 
@@ -518,7 +708,7 @@ class MemberLifecycleProcess(BaseProcess):
             if primary_member is None:
                 continue
 
-            new_bank_account, new_mandate, cancel_sql = self.billing_gen.replace_mandate(
+            new_bank_account, new_mandate, (cancel_sql, cancel_params) = self.billing_gen.replace_mandate(
                 policy=policy_obj,
                 member=primary_member,
                 replacement_date=current_date,
@@ -534,7 +724,9 @@ class MemberLifecycleProcess(BaseProcess):
                 "billing.direct_debit_mandate",
                 new_mandate.model_dump(),
             )
-            self.batch_writer.add_raw_sql("mandate_cancellation_replacement", cancel_sql)
+            self.batch_writer.add_raw_sql(
+                "mandate_cancellation_replacement", cancel_sql, cancel_params
+            )
 
             # Update cached mandate so downstream lookups resolve to the active one
             policy_data["mandate"] = new_mandate
@@ -547,128 +739,99 @@ class MemberLifecycleProcess(BaseProcess):
                 new_mandate_id=str(new_mandate.direct_debit_id),
             )
 
-    def _process_medicare_renewals(self, current_date: date) -> None:
-        """Process Medicare card renewals (deterministic based on expiry)."""
-        if not self.shared_state:
-            return
-
-        advance_days = self._get_config_rate("medicare_renewal_advance_days", 30)
-        renewal_threshold = current_date + timedelta(days=int(advance_days))
-
-        for pm_id, data in list(self.shared_state.policy_members.items()):
-            member = data.get("member")
-            if not member or getattr(member, "deceased_flag", False):
-                continue
-
-            expiry = member.medicare_expiry_date
-            if not expiry or expiry > renewal_threshold:
-                continue
+    def _renew_medicare(
+        self,
+        shared_state: "SharedState",
+        member: MemberCreate,
+        expiry: date,
+        current_date: date,
+    ) -> date:
+        """Renew a member's Medicare card that is within the renewal window."""
+        new_expiry = self.member_gen.generate_medicare_renewal(expiry)
 
-            # Renew Medicare card
-            new_expiry = self.member_gen.generate_medicare_renewal(expiry)
-
-            # Create update record
-            self._create_member_update(
-                member_id=member.member_id,
-                change_type=MemberChangeType.MEDICARE_RENEWAL,
-                change_date=current_date,
-                previous_values={"medicare_expiry_date": expiry.isoformat()},
-                new_values={"medicare_expiry_date": new_expiry.isoformat()},
-                reason="Medicare card renewal",
-            )
+        # Create update record
+        self._create_member_update(
+            member_id=member.member_id,
+            change_type=MemberChangeType.MEDICARE_RENEWAL,
+            change_date=current_date,
+            previous_values={"medicare_expiry_date": expiry.isoformat()},
+            new_values={"medicare_expiry_date": new_expiry.isoformat()},
+            reason="Medicare card renewal",
+        )
 
-            # Update database
-            self._update_member_in_db(
-                member.member_id,
-                {"medicare_expiry_date": new_expiry},
-                current_date,
-            )
+        # Update database
+        self._update_member_in_db(
+            member.member_id,
+            {"medicare_expiry_date": new_expiry},
+            current_date,
+        )
 
-            # Update cache
-            self.shared_state.update_member_data(
-                member.member_id,
-                {"medicare_expiry_date": new_expiry},
-            )
+        # Update cache
+        shared_state.update_member_data(
+            member.member_id,
+            {"medicare_expiry_date": new_expiry},
+        )
 
-            self.increment_stat("medicare_renewals")
+        self.increment_stat("medicare_renewals")
+        return new_expiry
 
-    def _process_deaths(self, current_date: date) -> None:
-        """Process member deaths with age-weighted probability."""
-        if not self.shared_state:
+    def _record_death(
+        self,
+        shared_state: "SharedState",
+        policy_member_id: UUID,
+        member: MemberCreate,
+        member_data: dict[str, Any],
+        current_date: date,
+    ) -> None:
+        """Record a member's death and notify dependent processes."""
+        policy = member_data.get("policy")
+        if not policy:
             return
 
-        for pm_id, data in list(self.shared_state.policy_members.items()):
-            member = data.get("member")
-            if not member:
-                continue
-
-            # Skip already deceased
-            if getattr(member, "deceased_flag", False):
-                continue
-
-            age = data.get("age", 50)
-            death_rate = self._get_death_rate(age)
-            daily_rate = self.annual_rate_to_daily(death_rate)
-
-            if self.rng.random() >= daily_rate:
-                continue
-
-            policy = data.get("policy")
-            if not policy:
-                continue
-
-            member_role = data.get("member_role", MemberRole.PRIMARY.value)
-
-            # Create member update record
-            self._create_member_update(
-                member_id=member.member_id,
-                change_type=MemberChangeType.DEATH,
-                change_date=current_date,
-                previous_values={"deceased_flag": False},
-                new_values={"deceased_flag": True, "deceased_date": current_date.isoformat()},
-                reason="Member deceased",
-            )
+        age = member_data.get("age", 50)
+        member_role = member_data.get("member_role", _ROLE_PRIMARY)
 
-            # Update member record in database
-            self.batch_writer.add_raw_sql(
-                "member_death_update",
-                f"""
-                UPDATE member SET
-                    deceased_flag = true,
-                    deceased_date = '{current_date.isoformat()}',
-                    modified_at = '{self.sim_env.current_datetime.isoformat()}',
-                    modified_by = 'SIMULATION'
-                WHERE member_id = '{member.member_id}'
-                """,
-            )
-
-            # Queue event for PolicyLifecycleProcess
-            self.shared_state.add_member_change_event(
-                member_id=member.member_id,
-                policy_id=policy.policy_id,
-                change_type="DEATH",
-                change_data={
-                    "member_role": member_role,
-                    "date": current_date.isoformat(),
-                    "age": age,
-                },
-            )
+        # Create member update record
+        self._create_member_update(
+            member_id=member.member_id,
+            change_type=MemberChangeType.DEATH,
+            change_date=current_date,
+            previous_values={"deceased_flag": False},
+            new_values={"deceased_flag": True, "deceased_date": self._today_iso},
+            reason="Member deceased",
+        )
 
-            # Update cached member data (mark as deceased in cache via shared state)
-            # Note: MemberCreate doesn't have deceased_flag, so we just mark via shared state
-            self.shared_state.update_member_data(
-                member.member_id,
-                {"deceased_flag": True, "deceased_date": current_date},
-            )
+        # Update member record in database
+        self._update_member_in_db(
+            member.member_id,
+            {"deceased_flag": True, "deceased_date": current_date},
+            current_date,
+        )
 
-            self.increment_stat("deaths")
-            logger.info(
-                "member_deceased",
-                member_id=str(member.member_id),
-                policy_id=str(policy.policy_id),
-                member_role=member_role,
-                age=age,
-            )
+        # Queue event for PolicyLifecycleProcess
+        self._pending_change_events.append({
+            "member_id": member.member_id,
+            "policy_id": policy.policy_id,
+            "change_type": _EVENT_DEATH,
+            "change_data": {
+                "member_role": member_role,
+                "date": self._today_iso,
+                "age": age,
+            },
+        })
+
+        # Deceased state lives in the shared live-member index rather than on
+        # the cached member (MemberCreate has no deceased_flag to set)
+        shared_state.mark_policy_member_deceased(policy_member_id)
+
+        self.increment_stat("deaths")
+        logger.info(
+            "member_deceased",
+            member_id=str(member.member_id),
+            policy_id=str(policy.policy_id),
+            member_role=member_role,
+            age=age,
+        )
 
     def _create_member_update(
         self,
@@ -679,20 +842,25 @@ class MemberLifecycleProcess(BaseProcess):
         new_values: dict[str, Any],
         reason: str | None = None,
     ) -> None:
-        """Create and write a member update record."""
-        update = MemberUpdate(
-            member_update_id=self.id_generator.generate_uuid(),
-            member_id=member_id,
-            change_type=change_type,
-            change_date=change_date,
-            previous_values=previous_values,
-            new_values=new_values,
-            reason=reason,
-            triggered_by="SIMULATION",
-            created_at=self.sim_env.current_datetime,
-            created_by="SIMULATION",
-        )
-        self.batch_writer.add("member_lifecycle.member_update", update.model_dump_db())
+        """
+        Create and write a member update record.
+
+        The row is built directly with the columns of
+        MemberUpdate.model_dump_db(): every value comes from this process, so
+        constructing and dumping a model per audit row would only repeat work.
+        """
+        self.batch_writer.add("member_lifecycle.member_update", {
+            "member_update_id": self.id_generator.generate_uuid(),
+            "member_id": member_id,
+            "change_type": change_type.value,
+            "change_date": change_date,
+            "previous_values": json.dumps(previous_values),
+            "new_values": json.dumps(new_values),
+            "reason": reason,
+            "triggered_by": "SIMULATION",
+            "created_at": self.sim_env.current_datetime,
+            "created_by": "SIMULATION",
+        })
 
     def _update_member_in_db(
         self,
@@ -700,30 +868,44 @@ class MemberLifecycleProcess(BaseProcess):
         updates: dict[str, Any],
         current_date: date,
     ) -> None:
-        """Update member record in database."""
-        set_parts = []
-        for field, value in updates.items():
-            if value is None:
-                set_parts.append(f"{field} = NULL")
-            elif isinstance(value, str):
-                # Escape single quotes
-                escaped = value.replace("'", "''")
-                set_parts.append(f"{field} = '{escaped}'")
-            elif isinstance(value, date):
-                set_parts.append(f"{field} = '{value.isoformat()}'")
-            else:
-                set_parts.append(f"{field} = '{value}'")
-
-        set_clause = ", ".join(set_parts)
-
-        sql = f"""
-            UPDATE member SET
-                {set_clause},
-                modified_at = '{self.sim_env.current_datetime.isoformat()}',
-                modified_by = 'SIMULATION'
-            WHERE member_id = '{member_id}'
         """
-        self.batch_writer.add_raw_sql("member_update", sql)
+        Queue a member record update for the end-of-day batch.
+
+        Updates are grouped by the set of columns they touch so each group
+        is written as one ``UPDATE ... FROM (VALUES ...)`` statement. A later
+        update to the same member and columns on the same day replaces the
+        earlier one, matching the effect of applying them in sequence.
+        """
+        group = self._pending_member_updates.setdefault(tuple(updates), {})
+        group[member_id] = tuple(updates.values())
+
+    def _flush_member_updates(self) -> None:
+        """Write the day's queued member updates as batched, parameterized SQL."""
+        if not self._pending_member_updates:
+            return
+
+        modified_at = self.sim_env.current_datetime
+        for fields, pending in self._pending_member_updates.items():
+            set_clause = ", ".join([_MEMBER_SET_CLAUSES[field] for field in fields])
+            placeholders = "(" + ", ".join(["%s"] * (len(fields) + 1)) + ")"
+            rows = list(pending.items())
+
+            for start in range(0, len(rows), self.MEMBER_UPDATE_CHUNK_ROWS):
+                chunk = rows[start:start + self.MEMBER_UPDATE_CHUNK_ROWS]
+                sql = (
+                    f"UPDATE member AS m SET {set_clause}, "
+                    "modified_at = %s, modified_by = 'SIMULATION' "
+                    f"FROM (VALUES {', '.join([placeholders] * len(chunk))}) "
+                    f"AS v(member_id, {', '.join(fields)}) "
+                    "WHERE m.member_id = v.member_id::uuid"
+                )
+                params: list[Any] = [modified_at]
+                for member_id, values in chunk:
+                    params.append(member_id)
+                    params.extend(values)
+                self.batch_writer.add_raw_sql("member_update", sql, params)
+
+        self._pending_member_updates = {}
 
     def _log_progress(self) -> None:
         """Log member lifecycle process progress."""
@@ -13,6 +13,11 @@ from uuid import UUID
 import structlog
 
 from brickwell_health.core.processes.base import BaseProcess
+from brickwell_health.core.shared_state import (
+    NBA_CHANNEL_CODES,
+    NBA_OTHER_CHANNEL,
+    NBAContactCounts,
+)
 from brickwell_health.domain.nba import (
     ActionCategory,
     NBAActionWithRecommendation,
@@ -29,6 +34,30 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+# Immediate responses per channel: (not engaged, engaged, engaged and
+# upgraded, probability an engaged response is upgraded)
+_CHANNEL_RESPONSES = {
+    "Phone": (
+        ImmediateResponse.NO_ANSWER, ImmediateResponse.ANSWERED, ImmediateResponse.ANSWERED, 0.0,
+    ),
+    "Email": (
+        ImmediateResponse.IGNORED, ImmediateResponse.OPENED, ImmediateResponse.CLICKED, 0.4,
+    ),
+    "SMS": (
+        ImmediateResponse.IGNORED, ImmediateResponse.DELIVERED, ImmediateResponse.CLICKED, 0.3,
+    ),
+    "InApp": (
+        ImmediateResponse.IGNORED, ImmediateResponse.OPENED, ImmediateResponse.CLICKED, 0.6,
+    ),
+}
+_OTHER_CHANNEL_RESPONSES = (
+    ImmediateResponse.IGNORED, ImmediateResponse.DELIVERED, ImmediateResponse.DELIVERED, 0.0,
+)
+
+# Event types consumed by CRMProcess and CommunicationProcess
+_CRM_EVENT_TYPE = "nba_outbound_call"
+_COMMUNICATION_EVENT_TYPE = "nba_communication"
+
 
 class NBAActionProcess(BaseProcess):
     """
@@ -67,6 +96,35 @@ class NBAActionProcess(BaseProcess):
             from brickwell_health.config.models import NBAConfig
             self.nba_config = NBAConfig()
 
+        # Per-channel contact limits indexed by NBA_CHANNEL_CODES (fixed for
+        # the run); other channels only count towards the totals
+        contact_policy = self.nba_config.contact_policy
+        self._daily_channel_limits = [
+            contact_policy.max_email_per_day,
+            contact_policy.max_sms_per_day,
+            contact_policy.max_phone_per_day,
+            contact_policy.max_inapp_per_day,
+            None,
+        ]
+        self._weekly_channel_limits = [
+            contact_policy.max_email_per_week,
+            contact_policy.max_sms_per_week,
+            contact_policy.max_phone_per_week,
+            contact_policy.max_inapp_per_week,
+            None,
+        ]
+
+        # Remaining policy and response settings read on the hot path are
+        # also fixed for the run
+        self._same_category_cooldown_days = contact_policy.same_category_cooldown_days
+        self._max_total_per_day = contact_policy.max_total_per_day
+        self._max_total_per_week = contact_policy.max_total_per_week
+        self._max_actions_per_member_per_day = self.nba_config.max_actions_per_member_per_day
+        self._channel_effectiveness = dict(self.nba_config.response.channel_effectiveness)
+        self._effect_duration_days = getattr(
+            self.nba_config.response, "effect_duration_days", 30
+        )
+
         # Initialize statistics
         self._stats = {
             "recommendations_processed": 0,
@@ -79,6 +137,23 @@ class NBAActionProcess(BaseProcess):
             "communication_events_emitted": 0,
         }
 
+        # Action handlers by category; all take (recommendation, execution_id, now_dt)
+        self._category_handlers = {
+            ActionCategory.RETENTION: self._handle_retention_action,
+            ActionCategory.UPSELL: self._handle_upsell_action,
+            ActionCategory.CROSS_SELL: self._handle_crosssell_action,
+            ActionCategory.SERVICE: self._handle_service_action,
+            ActionCategory.WELLNESS: self._handle_wellness_action,
+        }
+
+        # Executions (recommendation, execution_id, channel) awaiting their
+        # sampled response and database record at the end of the daily pass
+        self._pending_executions: list[tuple[NBAActionWithRecommendation, UUID, str]] = []
+
+        # Behavioral effects created during the daily pass, published to
+        # SharedState once the pass is done
+        self._pending_effects: list[tuple[UUID, dict[str, Any]]] = []
+
     def run(self) -> Generator:
         """
         Main process loop - runs daily.
@@ -93,6 +168,8 @@ class NBAActionProcess(BaseProcess):
             worker_id=self.worker_id,
         )
 
+        self.env.process(self._log_progress_monthly())
+
         while True:
             current_date = self.sim_env.current_date
 
@@ -108,10 +185,6 @@ class NBAActionProcess(BaseProcess):
             # Wait for next day
             yield self.env.timeout(1.0)
 
-            # Log progress monthly
-            if int(self.sim_env.now) % 30 == 0:
-                self._log_progress()
-
     def _process_daily_recommendations(self, current_date: date) -> None:
         """
         Process NBA recommendations for the current day.
@@ -122,8 +195,10 @@ class NBAActionProcess(BaseProcess):
         if not self.shared_state:
             return
 
-        # Get today's recommendations (FIFO from queue)
+        # Get today's recommendations (FIFO from queue), after releasing any
+        # that were deferred until today
         # Note: Queue was populated at startup with valid recommendations
+        self.shared_state.release_deferred_nba_recommendations(current_date)
         recommendations = self.shared_state.get_nba_recommendations()
 
         if not recommendations:
@@ -131,6 +206,10 @@ class NBAActionProcess(BaseProcess):
 
         # Track actions per member today for max_actions_per_member_per_day limit
         member_actions_today: dict[UUID, int] = {}
+        # The pass happens at a single simulation instant
+        now_dt = self.sim_env.current_datetime
+        max_per_day = self._max_actions_per_member_per_day
+        tomorrow = current_date + timedelta(days=1)
 
         for rec in recommendations:
             # Skip if past validity
@@ -144,26 +223,45 @@ class NBAActionProcess(BaseProcess):
 
             # Skip if not yet valid
             if rec.valid_from > current_date:
-                # Put back in queue for later processing
-                self.shared_state.add_nba_recommendation(rec)
+                # Hold back until it becomes valid
+                self.shared_state.defer_nba_recommendation(rec, rec.valid_from)
                 continue
 
             # Check max actions per member per day
             member_id = rec.member_id
             actions_today = member_actions_today.get(member_id, 0)
-            max_per_day = self.nba_config.max_actions_per_member_per_day
             if actions_today >= max_per_day:
-                # Put back in queue for tomorrow
-                self.shared_state.add_nba_recommendation(rec)
+                # Hold back for tomorrow
+                self.shared_state.defer_nba_recommendation(rec, tomorrow)
                 continue
 
-            # Check contact policy
-            allowed, suppression_reason = self._check_contact_policy(rec)
+            # Enum values are read once per recommendation and passed along
+            channel = rec.channel.value
+            category = rec.action_category.value
+
+            # Members already at today's total contact limit fail the policy
+            # whatever the action, so skip the full check for them
+            counts = self.shared_state.get_nba_contact_counts(member_id, now_dt)
+            allowed: bool
+            suppression_reason: str | None
+            retry_date: date | None
+            if sum(counts.day_channels) >= self._max_total_per_day:
+                allowed, suppression_reason, retry_date = (
+                    False, "Daily total contact limit reached", tomorrow
+                )
+            else:
+                # Check contact policy
+                allowed, suppression_reason, retry_date = self._check_contact_policy(
+                    rec, counts, channel, category, now_dt
+                )
 
             if not allowed:
                 # Leave status as pending (may retry within validity window)
-                # Put back in queue for possible retry
-                self.shared_state.add_nba_recommendation(rec)
+                # Hold back until the blocking rule can pass; past valid_until
+                # it simply expires while held
+                if retry_date is None or retry_date <= current_date:
+                    retry_date = tomorrow
+                self.shared_state.defer_nba_recommendation(rec, retry_date)
                 self._stats["recommendations_suppressed"] += 1
                 logger.debug(
                     "nba_action_suppressed",
@@ -174,13 +272,29 @@ class NBAActionProcess(BaseProcess):
                 continue
 
             # Execute the action
-            self._execute_action(rec, current_date)
+            self._execute_action(rec, channel, category, now_dt)
             member_actions_today[member_id] = actions_today + 1
             self._stats["recommendations_processed"] += 1
 
+        if self._pending_executions:
+            self._record_executions(self._pending_executions, now_dt)
+            self._pending_executions = []
+
+        # Executions are recorded in SharedState as they happen, since later
+        # recommendations in the pass are checked against them; effects are
+        # only read by other processes, so they are published together
+        if self._pending_effects:
+            self.shared_state.add_nba_effects(self._pending_effects)
+            self._pending_effects = []
+
     def _check_contact_policy(
-        self, recommendation: NBAActionWithRecommendation
-    ) -> tuple[bool, str | None]:
+        self,
+        recommendation: NBAActionWithRecommendation,
+        counts: NBAContactCounts,
+        channel: str,
+        action_category: str,
+        now_dt: datetime,
+    ) -> tuple[bool, str | None, date | None]:
         """
         Check if action is allowed by contact policy.
 
@@ -191,132 +305,86 @@ class NBAActionProcess(BaseProcess):
         4. Daily channel limits
         5. Weekly total limit
 
+        Args:
+            recommendation: The recommendation to check
+            counts: The member's rolling contact counters as of now_dt
+            channel: The recommendation's channel value
+            action_category: The recommendation's action category value
+            now_dt: Current simulation datetime
+
         Returns:
-            Tuple of (allowed, suppression_reason)
+            Tuple of (allowed, suppression_reason, retry_date), where
+            retry_date is the earliest date the failing rule can pass
         """
-        if not self.shared_state:
-            return True, None
-
-        member_id = recommendation.member_id
         action_id = recommendation.action_id
-        action_category = recommendation.action_category.value
-        channel = recommendation.channel.value
-        current_datetime = self.sim_env.current_datetime
-        contact_policy = self.nba_config.contact_policy
 
         # 1. Check cooldown (same action and same category)
-        is_blocked, reason = self.shared_state.check_nba_cooldown(
-            member_id=member_id,
-            action_id=action_id,
-            action_category=action_category,
-            same_action_cooldown_days=recommendation.cooldown_days,
-            same_category_cooldown_days=contact_policy.same_category_cooldown_days,
-            current_datetime=current_datetime,
+        cooldown = counts.cooldown_block(
+            action_id,
+            action_category,
+            recommendation.cooldown_days,
+            self._same_category_cooldown_days,
+            now_dt,
         )
-        if is_blocked:
-            return False, reason
+        if cooldown is not None:
+            reason, cooldown_end = cooldown
+            return False, reason, cooldown_end.date()
 
         # 2. Check max attempts for this specific action
-        executions = self.shared_state.get_recent_nba_executions(
-            member_id, days=365, current_datetime=current_datetime
-        )
-        action_count = sum(
-            1 for e in executions if e.get("action_id") == action_id
-        )
-        if action_count >= recommendation.max_attempts:
-            return False, f"Max attempts reached ({recommendation.max_attempts})"
+        max_attempts = recommendation.max_attempts
+        if counts.action_counts.get(action_id, 0) >= max_attempts:
+            free_at = counts.attempts_free_at(action_id, max_attempts)
+            return False, f"Max attempts reached ({max_attempts})", free_at.date()
 
-        # 3. Check daily channel limits
-        today_start = datetime.combine(self.sim_env.current_date, datetime.min.time())
-        today_executions = [
-            e for e in executions
-            if e.get("executed_at", datetime.min) >= today_start
-        ]
+        tomorrow = counts.day + timedelta(days=1)
+        next_week = counts.week_start + timedelta(days=7)
 
-        channel_counts: dict[str, int] = {}
-        for e in today_executions:
-            ch = e.get("channel", "")
-            channel_counts[ch] = channel_counts.get(ch, 0) + 1
-
-        # Check specific channel limit
-        daily_limits = {
-            "Email": contact_policy.max_email_per_day,
-            "SMS": contact_policy.max_sms_per_day,
-            "Phone": contact_policy.max_phone_per_day,
-            "InApp": contact_policy.max_inapp_per_day,
-        }
-        if channel in daily_limits:
-            if channel_counts.get(channel, 0) >= daily_limits[channel]:
-                return False, f"Daily {channel} limit reached"
+        # 3. Check daily channel limits
+        channel_code = NBA_CHANNEL_CODES.get(channel, NBA_OTHER_CHANNEL)
+        daily_limit = self._daily_channel_limits[channel_code]
+        if daily_limit is not None and counts.day_channels[channel_code] >= daily_limit:
+            return False, f"Daily {channel} limit reached", tomorrow
 
         # Check total daily limit
-        total_today = sum(channel_counts.values())
-        if total_today >= contact_policy.max_total_per_day:
-            return False, "Daily total contact limit reached"
+        total_today = sum(counts.day_channels)
+        if total_today >= self._max_total_per_day:
+            return False, "Daily total contact limit reached", tomorrow
 
         # 4. Check weekly limits
-        week_start = today_start - timedelta(days=today_start.weekday())
-        week_executions = [
-            e for e in executions
-            if e.get("executed_at", datetime.min) >= week_start
-        ]
-
-        week_channel_counts: dict[str, int] = {}
-        for e in week_executions:
-            ch = e.get("channel", "")
-            week_channel_counts[ch] = week_channel_counts.get(ch, 0) + 1
-
-        weekly_limits = {
-            "Email": contact_policy.max_email_per_week,
-            "SMS": contact_policy.max_sms_per_week,
-            "Phone": contact_policy.max_phone_per_week,
-            "InApp": contact_policy.max_inapp_per_week,
-        }
-        if channel in weekly_limits:
-            if week_channel_counts.get(channel, 0) >= weekly_limits[channel]:
-                return False, f"Weekly {channel} limit reached"
+        weekly_limit = self._weekly_channel_limits[channel_code]
+        if weekly_limit is not None and counts.week_channels[channel_code] >= weekly_limit:
+            return False, f"Weekly {channel} limit reached", next_week
 
         # Check total weekly limit
-        total_week = sum(week_channel_counts.values())
-        if total_week >= contact_policy.max_total_per_week:
-            return False, "Weekly total contact limit reached"
+        total_week = sum(counts.week_channels)
+        if total_week >= self._max_total_per_week:
+            return False, "Weekly total contact limit reached", next_week
 
-        return True, None
+        return True, None, None
 
     def _execute_action(
-        self, recommendation: NBAActionWithRecommendation, current_date: date
+        self,
+        recommendation: NBAActionWithRecommendation,
+        channel: str,
+        category_value: str,
+        now_dt: datetime,
     ) -> None:
         """
         Execute an NBA action based on its category.
 
-        Routes to appropriate handler and records execution.
+        Routes to appropriate handler and queues the execution record for
+        the end of the daily pass.
         """
-        # Sample immediate response
-        immediate_response = self._sample_immediate_response(recommendation)
-
         # Generate execution ID
         execution_id = self.id_generator.generate_uuid()
 
         # Handle based on action category
-        category = recommendation.action_category
-
-        if category == ActionCategory.RETENTION:
-            self._handle_retention_action(recommendation, execution_id)
-        elif category == ActionCategory.UPSELL:
-            self._handle_upsell_action(recommendation, execution_id)
-        elif category == ActionCategory.CROSS_SELL:
-            self._handle_crosssell_action(recommendation, execution_id)
-        elif category == ActionCategory.SERVICE:
-            self._handle_service_action(recommendation)
-        elif category == ActionCategory.WELLNESS:
-            self._handle_wellness_action(recommendation)
-
-        # Record execution
-        self._record_execution(
-            recommendation=recommendation,
-            execution_id=execution_id,
-            immediate_response=immediate_response,
-        )
+        handler = self._category_handlers.get(recommendation.action_category)
+        if handler is not None:
+            handler(recommendation, execution_id, now_dt)
+
+        # Queue execution record (response is sampled with the day's batch)
+        self._pending_executions.append((recommendation, execution_id, channel))
 
         # Update recommendation status
         self._update_recommendation_status(
@@ -331,26 +399,17 @@ class NBAActionProcess(BaseProcess):
                 execution_data={
                     "execution_id": execution_id,
                     "action_id": recommendation.action_id,
-                    "action_category": recommendation.action_category.value,
-                    "channel": recommendation.channel.value,
-                    "executed_at": self.sim_env.current_datetime,
+                    "action_category": category_value,
+                    "channel": channel,
+                    "executed_at": now_dt,
                 },
             )
 
-        logger.debug(
-            "nba_action_executed",
-            recommendation_id=str(recommendation.recommendation_id),
-            member_id=str(recommendation.member_id),
-            action_code=recommendation.action_code,
-            category=category.value,
-            channel=recommendation.channel.value,
-            immediate_response=immediate_response.value if immediate_response else None,
-        )
-
     def _handle_retention_action(
         self,
         recommendation: NBAActionWithRecommendation,
         execution_id: UUID,
+        now_dt: datetime,
     ) -> None:
         """
         Handle retention action - reduce churn probability.
@@ -362,15 +421,17 @@ class NBAActionProcess(BaseProcess):
             recommendation=recommendation,
             execution_id=execution_id,
             effect_type="churn_reduction",
+            now_dt=now_dt,
         )
 
         # Emit to appropriate queue based on channel
-        self._emit_to_queue(recommendation)
+        self._emit_to_queue(recommendation, now_dt)
 
     def _handle_upsell_action(
         self,
         recommendation: NBAActionWithRecommendation,
         execution_id: UUID,
+        now_dt: datetime,
     ) -> None:
         """
         Handle upsell action - increase upgrade probability.
@@ -382,15 +443,17 @@ class NBAActionProcess(BaseProcess):
             recommendation=recommendation,
             execution_id=execution_id,
             effect_type="upgrade_boost",
+            now_dt=now_dt,
         )
 
         # Emit to communication queue (upsell is typically not phone)
-        self._emit_communication_event(recommendation)
+        self._emit_communication_event(recommendation, now_dt)
 
     def _handle_crosssell_action(
         self,
         recommendation: NBAActionWithRecommendation,
         execution_id: UUID,
+        now_dt: datetime,
     ) -> None:
         """
         Handle cross-sell action - increase upgrade probability.
@@ -402,13 +465,17 @@ class NBAActionProcess(BaseProcess):
             recommendation=recommendation,
             execution_id=execution_id,
             effect_type="upgrade_boost",
+            now_dt=now_dt,
         )
 
         # Emit to communication queue
-        self._emit_communication_event(recommendation)
+        self._emit_communication_event(recommendation, now_dt)
 
     def _handle_service_action(
-        self, recommendation: NBAActionWithRecommendation
+        self,
+        recommendation: NBAActionWithRecommendation,
+        execution_id: UUID,
+        now_dt: datetime,
     ) -> None:
         """
         Handle service action - proactive outreach.
@@ -416,10 +483,13 @@ class NBAActionProcess(BaseProcess):
         No behavioral effect, just creates interaction.
         """
         # Emit to CRM queue (service actions create interactions)
-        self._emit_crm_event(recommendation)
+        self._emit_crm_event(recommendation, now_dt)
 
     def _handle_wellness_action(
-        self, recommendation: NBAActionWithRecommendation
+        self,
+        recommendation: NBAActionWithRecommendation,
+        execution_id: UUID,
+        now_dt: datetime,
     ) -> None:
         """
         Handle wellness action - engagement and reminders.
@@ -427,49 +497,48 @@ class NBAActionProcess(BaseProcess):
         No behavioral effect, just sends communication.
         """
         # Emit to communication queue
-        self._emit_communication_event(recommendation)
+        self._emit_communication_event(recommendation, now_dt)
 
     def _create_behavioral_effect(
         self,
         recommendation: NBAActionWithRecommendation,
         execution_id: UUID,
         effect_type: str,
+        now_dt: datetime,
     ) -> None:
         """
-        Create a behavioral effect in SharedState.
+        Create a behavioral effect for SharedState.
 
         Effects are consumed by other processes (PolicyLifecycle) to
-        modify probabilities.
+        modify probabilities. They are queued and published at the end of
+        the daily pass.
         """
         if not self.shared_state or not recommendation.policy_id:
             return
 
-        # Get effect duration from config
-        effect_duration = getattr(
-            self.nba_config.response, "effect_duration_days", 30
-        )
-
         # Calculate expiry
-        expires_at = self.sim_env.current_datetime + timedelta(days=effect_duration)
+        expires_at = now_dt + timedelta(days=self._effect_duration_days)
 
         # Multiplier from the action catalog
         multiplier = float(recommendation.probability_multiplier)
 
-        self.shared_state.add_nba_effect(
-            policy_id=recommendation.policy_id,
-            effect_data={
+        self._pending_effects.append((
+            recommendation.policy_id,
+            {
                 "effect_type": effect_type,
                 "value": multiplier,
                 "expires_at": expires_at,
                 "source_action_id": recommendation.action_id,
                 "source_execution_id": execution_id,
                 "action_code": recommendation.action_code,
-                "created_at": self.sim_env.current_datetime,
+                "created_at": now_dt,
             },
-        )
+        ))
         self._stats["effects_created"] += 1
 
-    def _emit_to_queue(self, recommendation: NBAActionWithRecommendation) -> None:
+    def _emit_to_queue(
+        self, recommendation: NBAActionWithRecommendation, now_dt: datetime
+    ) -> None:
         """
         Emit to appropriate queue based on channel.
 
@@ -477,11 +546,13 @@ class NBAActionProcess(BaseProcess):
         Others -> Communication queue (sends message)
         """
         if recommendation.channel == NBAChannel.PHONE:
-            self._emit_crm_event(recommendation)
+            self._emit_crm_event(recommendation, now_dt)
         else:
-            self._emit_communication_event(recommendation)
+            self._emit_communication_event(recommendation, now_dt)
 
-    def _emit_crm_event(self, recommendation: NBAActionWithRecommendation) -> None:
+    def _emit_crm_event(
+        self, recommendation: NBAActionWithRecommendation, now_dt: datetime
+    ) -> None:
         """
         Emit event to CRM queue for Phone channel actions.
 
@@ -493,8 +564,8 @@ class NBAActionProcess(BaseProcess):
         self.shared_state.add_crm_event({
             "member_id": recommendation.member_id,
             "policy_id": recommendation.policy_id,
-            "event_type": "nba_outbound_call",
-            "timestamp": self.sim_env.current_datetime,
+            "event_type": _CRM_EVENT_TYPE,
+            "timestamp": now_dt,
             "details": {
                 "action_code": recommendation.action_code,
                 "action_name": recommendation.action_name,
@@ -505,7 +576,7 @@ class NBAActionProcess(BaseProcess):
         self._stats["crm_events_emitted"] += 1
 
     def _emit_communication_event(
-        self, recommendation: NBAActionWithRecommendation
+        self, recommendation: NBAActionWithRecommendation, now_dt: datetime
     ) -> None:
         """
         Emit event to Communication queue for Email/SMS/InApp actions.
@@ -518,8 +589,8 @@ class NBAActionProcess(BaseProcess):
         self.shared_state.add_communication_event({
             "member_id": recommendation.member_id,
             "policy_id": recommendation.policy_id,
-            "event_type": "nba_communication",
-            "timestamp": self.sim_env.current_datetime,
+            "event_type": _COMMUNICATION_EVENT_TYPE,
+            "timestamp": now_dt,
             "channel": recommendation.channel.value,
             "details": {
                 "action_code": recommendation.action_code,
@@ -530,74 +601,84 @@ class NBAActionProcess(BaseProcess):
         })
         self._stats["communication_events_emitted"] += 1
 
-    def _sample_immediate_response(
-        self, recommendation: NBAActionWithRecommendation
-    ) -> ImmediateResponse:
+    def _sample_immediate_responses(self, channels: list[str]) -> list[ImmediateResponse]:
         """
-        Sample an immediate response based on channel effectiveness.
+        Sample immediate responses for a batch of executions.
 
-        Uses channel effectiveness from config to determine engagement.
+        Engagement uses channel effectiveness from config; engaged
+        responses may be upgraded (e.g. opened -> clicked) with a
+        channel-specific probability. All draws for the batch come from a
+        single RNG call.
         """
-        channel = recommendation.channel.value
-        effectiveness = self.nba_config.response.channel_effectiveness.get(
-            channel, 0.15
-        )
-
-        # Sample engagement
-        engaged = self.rng.random() < effectiveness
+        channel_effectiveness = self._channel_effectiveness
+        draws = self.rng.random((len(channels), 2)).tolist()
 
-        if not engaged:
-            # Map to appropriate "no engagement" response by channel
-            if channel == "Phone":
-                return ImmediateResponse.NO_ANSWER
-            elif channel == "Email":
-                return ImmediateResponse.IGNORED
+        responses = []
+        for channel, (engage_draw, upgrade_draw) in zip(channels, draws):
+            not_engaged, engaged, upgraded, upgrade_probability = _CHANNEL_RESPONSES.get(
+                channel, _OTHER_CHANNEL_RESPONSES
+            )
+            if engage_draw >= channel_effectiveness.get(channel, 0.15):
+                responses.append(not_engaged)
+            elif upgrade_draw < upgrade_probability:
+                responses.append(upgraded)
             else:
-                return ImmediateResponse.IGNORED
-
-        # Engaged - determine response level
-        if channel == "Phone":
-            return ImmediateResponse.ANSWERED
-        elif channel == "Email":
-            # 60% opened only, 40% clicked
-            if self.rng.random() < 0.4:
-                return ImmediateResponse.CLICKED
-            return ImmediateResponse.OPENED
-        elif channel == "SMS":
-            # SMS: delivered vs clicked
-            if self.rng.random() < 0.3:
-                return ImmediateResponse.CLICKED
-            return ImmediateResponse.DELIVERED
-        elif channel == "InApp":
-            # InApp: high click rate if engaged
-            if self.rng.random() < 0.6:
-                return ImmediateResponse.CLICKED
-            return ImmediateResponse.OPENED
-        else:
-            return ImmediateResponse.DELIVERED
+                responses.append(engaged)
+        return responses
+
+    def _record_executions(
+        self,
+        executions: list[tuple[NBAActionWithRecommendation, UUID, str]],
+        now_dt: datetime,
+    ) -> None:
+        """
+        Sample responses for and record the day's executions.
+        """
+        responses = self._sample_immediate_responses([channel for _, _, channel in executions])
+
+        for (recommendation, execution_id, channel), immediate_response in zip(
+            executions, responses
+        ):
+            self._record_execution(
+                recommendation=recommendation,
+                execution_id=execution_id,
+                immediate_response=immediate_response,
+                now_dt=now_dt,
+            )
+            logger.debug(
+                "nba_action_executed",
+                recommendation_id=str(recommendation.recommendation_id),
+                member_id=str(recommendation.member_id),
+                action_code=recommendation.action_code,
+                category=recommendation.action_category.value,
+                channel=channel,
+                immediate_response=immediate_response.value,
+            )
 
     def _record_execution(
         self,
         recommendation: NBAActionWithRecommendation,
         execution_id: UUID,
         immediate_response: ImmediateResponse,
+        now_dt: datetime,
     ) -> None:
         """
         Record the execution in the database.
         """
-        execution = NBAExecutionCreate(
+        # Every value comes from the simulator, so skip Pydantic validation
+        execution = NBAExecutionCreate.model_construct(
             execution_id=execution_id,
             recommendation_id=recommendation.recommendation_id,
             action_id=recommendation.action_id,
             member_id=recommendation.member_id,
             policy_id=recommendation.policy_id,
-            executed_at=self.sim_env.current_datetime,
+            executed_at=now_dt,
             execution_channel=recommendation.channel,
             execution_method=ExecutionMethod.AUTOMATED,
             immediate_response=immediate_response,
-            response_at=self.sim_env.current_datetime if immediate_response else None,
+            response_at=now_dt if immediate_response else None,
             worker_id=self.worker_id,
-            simulation_date=self.sim_env.current_date,
+            simulation_date=now_dt.date(),
         )
 
         self.batch_writer.add("nba.nba_action_execution", execution.model_dump_db())
@@ -636,22 +717,12 @@ class NBAActionProcess(BaseProcess):
         if not self.shared_state:
             return
 
-        # Check all recommendations in queue
-        remaining: list[NBAActionWithRecommendation] = []
-        recommendations = self.shared_state.peek_nba_recommendations()
-
-        for rec in recommendations:
-            if rec.valid_until < current_date:
-                self._update_recommendation_status(
-                    rec.recommendation_id,
-                    RecommendationStatus.EXPIRED,
-                )
-                self._stats["recommendations_expired"] += 1
-            else:
-                remaining.append(rec)
-
-        # Note: peek doesn't remove, and we process in _process_daily_recommendations
-        # So we don't need to re-add here
+        for rec in self.shared_state.expire_nba_recommendations(current_date):
+            self._update_recommendation_status(
+                rec.recommendation_id,
+                RecommendationStatus.EXPIRED,
+            )
+            self._stats["recommendations_expired"] += 1
 
     def _expire_old_effects(self) -> None:
         """
@@ -665,6 +736,12 @@ class NBAActionProcess(BaseProcess):
         )
         self._stats["effects_expired"] += removed
 
+    def _log_progress_monthly(self) -> Generator:
+        """Log progress every 30 days, alongside the daily loop."""
+        while True:
+            yield self.env.timeout(30.0)
+            self._log_progress()
+
     def _log_progress(self) -> None:
         """Log process progress."""
         logger.info(
@@ -673,7 +750,3 @@ class NBAActionProcess(BaseProcess):
             sim_date=self.sim_env.current_date.isoformat(),
             **self._stats,
         )
-
-    def get_stats(self) -> dict[str, int]:
-        """Get process statistics."""
-        return self._stats.copy()
@@ -5,25 +5,29 @@ Handles policy changes: upgrades, downgrades, cancellations, suspensions.
 Uses ChurnPredictionModel for age-based churn with retention factors.
 """
 
-from datetime import timedelta
+import calendar
+import logging
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Generator, Any, TYPE_CHECKING
 from uuid import UUID
 
+import numpy as np
 import structlog
 
 from brickwell_health.core.processes.base import BaseProcess
 from brickwell_health.domain.enums import (
     CancellationReason,
     CoverageTier,
+    MemberRole,
     PolicyStatus,
+    PolicyType,
 )
 from brickwell_health.domain.policy import UpgradeRequestCreate
 from brickwell_health.generators.billing_generator import BillingGenerator
 from brickwell_health.generators.coverage_generator import CoverageGenerator
 from brickwell_health.generators.waiting_period_generator import WaitingPeriodGenerator
 from brickwell_health.statistics.churn_model import ChurnPredictionModel
-from brickwell_health.utils.time_conversion import last_of_month
 
 if TYPE_CHECKING:
     from brickwell_health.core.processes.suspension import SuspensionProcess
@@ -32,6 +36,88 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+# Lifecycle events in the order their daily probabilities are stacked
+_EVENT_TYPES = ("upgrade", "downgrade", "cancel", "suspend")
+
+# Product name markers and the excess (in cents) they denote, checked in order
+_EXCESS_MARKERS = (
+    ("$250", 25_000),
+    ("$500", 50_000),
+    ("$750", 75_000),
+    ("No Excess", 0),
+)
+
+_ROLE_PRIMARY = MemberRole.PRIMARY.value
+_ROLE_PARTNER = MemberRole.PARTNER.value
+_ROLE_DEPENDENT = MemberRole.DEPENDENT.value
+
+# policy_type after a member death: (member_role, current policy_type) -> new type.
+# Dependent entries apply only when the last dependent dies.
+_DEATH_POLICY_TYPES = {
+    (_ROLE_PARTNER, PolicyType.FAMILY.value): PolicyType.SINGLE_PARENT.value,
+    (_ROLE_PARTNER, PolicyType.COUPLE.value): PolicyType.SINGLE.value,
+    (_ROLE_DEPENDENT, PolicyType.FAMILY.value): PolicyType.COUPLE.value,
+    (_ROLE_DEPENDENT, PolicyType.SINGLE_PARENT.value): PolicyType.SINGLE.value,
+}
+
+# Parameterized statements queued via BatchWriter.add_raw_sql. Policy-level
+# statements match policy_id = ANY(%s) so one statement can cover all of a
+# day's death cancellations.
+_CANCEL_POLICY_SQL = (
+    "UPDATE policy "
+    "SET policy_status = 'Cancelled', "
+    "end_date = %s, "
+    "cancellation_reason = %s, "
+    "modified_at = %s, "
+    "modified_by = 'SIMULATION' "
+    "WHERE policy_id = ANY(%s)"
+)
+_TERMINATE_COVERAGE_SQL = (
+    "UPDATE coverage "
+    "SET status = 'Terminated', "
+    "end_date = %s, "
+    "modified_at = %s, "
+    "modified_by = 'SIMULATION' "
+    "WHERE policy_id = ANY(%s) "
+    "AND (status = 'Active' OR status IS NULL)"
+)
+_END_POLICY_MEMBERS_SQL = (
+    "UPDATE policy_member "
+    "SET is_active = FALSE, "
+    "end_date = %s "
+    "WHERE policy_id = ANY(%s) "
+    "AND is_active = TRUE"
+)
+_REMOVE_POLICY_MEMBER_SQL = (
+    "UPDATE policy_member "
+    "SET is_active = FALSE, "
+    "end_date = %s "
+    "WHERE policy_id = %s "
+    "AND member_id = %s "
+    "AND is_active = TRUE"
+)
+
+
+def _select_events(rands: np.ndarray, rates: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pick at most one event per policy from its uniform draw.
+
+    The event index is the number of cumulative thresholds at or below the
+    draw (searchsorted semantics), so no per-band branching is needed.
+    rates is overwritten with its cumulative sum.
+
+    Args:
+        rands: Uniform [0, 1) draw per policy
+        rates: Daily event probabilities, shape (len(_EVENT_TYPES), policies)
+
+    Returns:
+        Tuple of (indices of policies with an event, their _EVENT_TYPES indices)
+    """
+    thresholds = np.cumsum(rates, axis=0, out=rates)
+    hits = np.flatnonzero(rands < thresholds[-1])
+    events = (rands[hits] >= thresholds[:-1, hits]).sum(axis=0)
+    return hits, events
+
 
 class PolicyLifecycleProcess(BaseProcess):
     """
@@ -49,6 +135,12 @@ class PolicyLifecycleProcess(BaseProcess):
     # Tier ordering for upgrades/downgrades (tier_id: 4=Basic, 3=Bronze, 2=Silver, 1=Gold)
     TIER_ORDER = ["Basic", "Bronze", "Silver", "Gold"]
     TIER_ID_MAP = {"Basic": 4, "Bronze": 3, "Silver": 2, "Gold": 1}
+    # Adjacent tiers; the top and bottom tiers (and unknown tiers) have no entry
+    NEXT_TIER = dict(zip(TIER_ORDER, TIER_ORDER[1:]))
+    PREV_TIER = dict(zip(TIER_ORDER[1:], TIER_ORDER))
+
+    # Maximum rows per batched policy_type UPDATE (keeps bind parameters bounded)
+    POLICY_TYPE_CHUNK_ROWS = 1000
 
     def __init__(
         self,
@@ -85,6 +177,11 @@ class PolicyLifecycleProcess(BaseProcess):
 
         # Initialize churn prediction model
         self.churn_model = ChurnPredictionModel(self.rng, self.reference, self.config)
+        # No policy's daily churn probability (model or fallback) exceeds this
+        self._cancel_daily_bound = max(
+            self.churn_model.max_daily_churn_probability(),
+            self.config.events.cancellation_rate / 365,
+        )
 
         # Daily rates (converted from annual) for upgrade/downgrade/suspension
         # Note: Cancellation now uses ChurnPredictionModel instead of flat rate
@@ -92,6 +189,18 @@ class PolicyLifecycleProcess(BaseProcess):
         self.downgrade_daily = self.config.events.downgrade_rate / 365
         self.suspend_daily = self.config.events.suspension_rate / 365
 
+        # policy_type changes queued while handling a day's member deaths
+        self._pending_policy_type_changes: dict[UUID, str] = {}
+
+        # Per-event member change logs are skipped unless DEBUG is enabled
+        # (logging is configured before the worker builds its processes)
+        self._debug_enabled = logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
+
+        # Cached _policy_columns() result and the active_policies state it
+        # was built from
+        self._policy_columns_cache: tuple[tuple[UUID, ...], np.ndarray] = ((), np.zeros(0))
+        self._policy_columns_key: tuple[int, int, UUID | None] | None = None
+
         # Build product tier lookup: product_id -> tier_id
         # and tier products lookup: tier_id -> list of product_ids
         self._build_product_tier_lookups()
@@ -111,6 +220,8 @@ class PolicyLifecycleProcess(BaseProcess):
             suspend_rate=f"{self.config.events.suspension_rate:.1%}",
         )
 
+        self.env.process(self._log_progress_monthly())
+
         while True:
             # Skip processing during warmup's first week
             if self.sim_env.total_elapsed_days < 7:
@@ -118,48 +229,132 @@ class PolicyLifecycleProcess(BaseProcess):
                 continue
 
             current_date = self.sim_env.current_date
+            now = self.sim_env.current_datetime
 
-            # Process each active policy
-            policy_ids = list(self.active_policies.keys())
-            for policy_id in policy_ids:
-                policy = self.active_policies.get(policy_id)
-                if policy is None:
-                    continue
-
-                # Skip if not active
-                if policy.get("status") != "Active":
-                    continue
-
-                # Randomly select one event (mutually exclusive per day)
-                # Cancellation uses ChurnPredictionModel for age-based probability
-                event_type = self._select_event(policy, current_date)
-                if event_type is None:
-                    continue
-
-                if event_type == "upgrade":
-                    self._process_upgrade(policy_id, policy, current_date)
-                elif event_type == "downgrade":
-                    self._process_downgrade(policy_id, policy, current_date)
-                elif event_type == "cancel":
-                    self._process_cancellation(policy_id, policy, current_date)
-                elif event_type == "suspend":
-                    self._process_suspension(policy_id, policy, current_date)
+            # Sample and apply lifecycle events for active policies
+            self._process_policy_events(current_date, now)
 
             # Process member change events (death, address changes)
-            self._process_member_change_events(current_date)
+            self._process_member_change_events(current_date, now)
 
             # Wait until next day
             yield self.env.timeout(1.0)
 
-            # Log progress monthly
-            if int(self.sim_env.now) % 30 == 0:
-                self._log_progress()
+    def _process_policy_events(self, current_date: date, now: datetime) -> None:
+        """
+        Sample and apply today's lifecycle events across all active policies.
+
+        Events are mutually exclusive - at most one per policy per day. Each
+        policy's daily rates stack into cumulative thresholds, and a single
+        uniform draw per policy (all drawn in one RNG call) picks the event
+        whose threshold band it falls in. Only policies with an event reach
+        the Python handlers.
 
-    def _select_event(self, policy: dict, current_date) -> str | None:
+        Churn and NBA-adjusted rates are only computed for policies whose
+        draw is below the highest total rate any policy could have (or that
+        have NBA effects, which can raise rates); every other draw clears all
+        bands whatever the policy's rates are. Policy status is likewise only
+        read for those candidates, so the sweep over the whole book stays in
+        NumPy.
+
+        Args:
+            current_date: Current simulation date
+            now: Current simulation datetime, stamped on records written today
         """
-        Select which event (if any) should occur.
+        # Defer all lifecycle events until the policy reaches its effective_date.
+        # Acquisitions register policies with a 14-day forward effective_date; an
+        # event picked in that window would set end_date < effective_date and
+        # break the tenure invariant.
+        policy_ids, effective_ordinals = self._policy_columns()
+        effective = np.flatnonzero(effective_ordinals <= current_date.toordinal())
+        if not effective.size:
+            return
+
+        rands = self.rng.random(effective.size)
+        candidates = rands < (
+            self.upgrade_daily
+            + self.downgrade_daily
+            + self._cancel_daily_bound
+            + self.suspend_daily
+        )
+        nba_effects = self.shared_state.nba_active_effects if self.shared_state else {}
+        if nba_effects:
+            candidates |= np.fromiter(
+                (policy_ids[idx] in nba_effects for idx in effective.tolist()),
+                dtype=bool,
+                count=effective.size,
+            )
+
+        # Daily rates in _EVENT_TYPES order, one column per effective policy.
+        # Candidates that are gone or not Active get no bands at all.
+        rates = np.empty((len(_EVENT_TYPES), effective.size))
+        rates[0] = self.upgrade_daily
+        rates[1] = self.downgrade_daily
+        rates[2] = 0.0
+        rates[3] = self.suspend_daily
+        active_policies = self.active_policies
+        eligible: dict[int, tuple[UUID, dict]] = {}
+        for idx in np.flatnonzero(candidates).tolist():
+            policy_id = policy_ids[effective[idx]]
+            policy = active_policies.get(policy_id)
+            if policy is None or policy.get("status") != "Active":
+                rates[:, idx] = 0.0
+                continue
+            eligible[idx] = (policy_id, policy)
+            rates[0, idx], rates[2, idx] = self._get_event_rates(
+                policy_id, policy, current_date, now
+            )
+
+        hits, events = _select_events(rands, rates)
+
+        # Handlers in _EVENT_TYPES order
+        handlers = (
+            self._process_upgrade,
+            self._process_downgrade,
+            self._process_cancellation,
+            self._process_suspension,
+        )
+        for idx, event in zip(hits.tolist(), events.tolist()):
+            policy_id, policy = eligible[idx]
+            handlers[event](policy_id, policy, current_date, now)
+
+    def _policy_columns(self) -> tuple[tuple[UUID, ...], np.ndarray]:
+        """
+        Get tracked policy ids with their effective date ordinals.
+
+        active_policies stays the source of truth (other processes write it
+        directly); this column view only lets the daily pass mask out
+        not-yet-effective policies with one array comparison. It is rebuilt
+        when the dict's identity, size or most recently inserted key
+        changes, which any addition or removal of a policy moves. Status is
+        read from the live dict, so it is not cached. Policies without a
+        policy object are always effective.
+
+        Returns:
+            Tuple of (policy ids in active_policies order, effective ordinals)
+        """
+        policies = self.active_policies
+        key = (id(policies), len(policies), next(reversed(policies), None))
+        if key != self._policy_columns_key:
+            effective_ordinals = np.zeros(len(policies), dtype=np.int64)
+            for idx, policy in enumerate(policies.values()):
+                policy_obj = policy.get("policy")
+                if policy_obj is not None:
+                    effective_ordinals[idx] = policy_obj.effective_date.toordinal()
+            self._policy_columns_cache = (tuple(policies), effective_ordinals)
+            self._policy_columns_key = key
+        return self._policy_columns_cache
+
+    def _get_event_rates(
+        self,
+        policy_id: UUID,
+        policy: dict,
+        current_date: date,
+        now: datetime,
+    ) -> tuple[float, float]:
+        """
+        Get a policy's daily upgrade and cancellation probabilities.
 
-        Events are mutually exclusive - only one can occur per policy per day.
         Cancellation probability is calculated using ChurnPredictionModel based on
         member age, tenure, claims history, and retention factors.
 
@@ -168,39 +363,28 @@ class PolicyLifecycleProcess(BaseProcess):
         - upgrade_boost: Multiplies upgrade probability (> 1.0 increases upgrades)
 
         Args:
+            policy_id: Policy UUID (its active_policies key)
             policy: Policy data dictionary
             current_date: Current simulation date
+            now: Current simulation datetime
 
         Returns:
-            Event type string or None if no event
+            Tuple of (upgrade_daily, cancel_daily)
         """
-        # Defer all lifecycle events until the policy reaches its effective_date.
-        # Acquisitions register policies with a 14-day forward effective_date; an
-        # event picked in that window would set end_date < effective_date and
-        # break the tenure invariant.
-        policy_obj = policy.get("policy")
-        if policy_obj is not None and current_date < policy_obj.effective_date:
-            return None
-
-        rand = self.rng.random()
-
         # Calculate base churn probability using the model
         cancel_daily = self._get_churn_probability(policy, current_date)
 
         # Start with base upgrade rate
         upgrade_daily = self.upgrade_daily
 
-        # Apply NBA behavioral effects if SharedState available
-        policy_id = self._get_policy_id(policy)
-        if self.shared_state and policy_id:
-            current_datetime = self.sim_env.current_datetime
-
+        # Apply NBA behavioral effects if SharedState has any for this policy
+        if self.shared_state and policy_id in self.shared_state.nba_active_effects:
             # Apply churn_reduction effect (multiplier < 1.0 reduces churn)
             churn_multiplier = self.shared_state.get_nba_effect_multiplier(
                 policy_id=policy_id,
                 effect_type="churn_reduction",
                 default=1.0,
-                current_datetime=current_datetime,
+                current_datetime=now,
             )
             if churn_multiplier != 1.0:
                 cancel_daily *= churn_multiplier
@@ -215,7 +399,7 @@ class PolicyLifecycleProcess(BaseProcess):
                 policy_id=policy_id,
                 effect_type="upgrade_boost",
                 default=1.0,
-                current_datetime=current_datetime,
+                current_datetime=now,
             )
             if upgrade_multiplier != 1.0:
                 upgrade_daily *= upgrade_multiplier
@@ -225,20 +409,9 @@ class PolicyLifecycleProcess(BaseProcess):
                     multiplier=upgrade_multiplier,
                 )
 
-        cumulative = 0.0
-        for event, rate in [
-            ("upgrade", upgrade_daily),
-            ("downgrade", self.downgrade_daily),
-            ("cancel", cancel_daily),
-            ("suspend", self.suspend_daily),
-        ]:
-            cumulative += rate
-            if rand < cumulative:
-                return event
-
-        return None
+        return upgrade_daily, cancel_daily
 
-    def _get_churn_probability(self, policy: dict, current_date) -> float:
+    def _get_churn_probability(self, policy: dict, current_date: date) -> float:
         """
         Get daily churn probability for a policy using ChurnPredictionModel.
 
@@ -249,7 +422,7 @@ class PolicyLifecycleProcess(BaseProcess):
         Returns:
             Daily churn probability (0-1)
         """
-        # Get primary member age
+        # Get primary member
         members = policy.get("members", [])
         primary_member = members[0] if members else None
 
@@ -257,30 +430,23 @@ class PolicyLifecycleProcess(BaseProcess):
             # Fall back to default rate if no member info
             return self.config.events.cancellation_rate / 365
 
-        # Calculate member age
-        dob = primary_member.date_of_birth if hasattr(primary_member, "date_of_birth") else None
-        if dob is None:
-            dob = primary_member.get("date_of_birth") if isinstance(primary_member, dict) else None
-
-        if dob is None:
-            return self.config.events.cancellation_rate / 365
-
-        age = (current_date - dob).days // 365
+        # The primary member's date of birth, policy start and premium don't
+        # change while the policy is tracked, so they are resolved once per
+        # primary member and cached on the policy dict
+        churn_inputs = policy.get("_churn_inputs")
+        if churn_inputs is None or churn_inputs[0] is not primary_member:
+            churn_inputs = self._resolve_churn_inputs(policy, primary_member)
+            if churn_inputs is None:
+                return self.config.events.cancellation_rate / 365
+            policy["_churn_inputs"] = churn_inputs
 
-        # Build policy data for churn model
-        policy_obj = policy.get("policy")
-        effective_date = None
-        annual_premium = 0
-
-        if policy_obj is not None:
-            if hasattr(policy_obj, "effective_date"):
-                effective_date = policy_obj.effective_date
-            if hasattr(policy_obj, "premium_amount"):
-                annual_premium = float(policy_obj.premium_amount) * 12
+        _, dob_ordinal, effective_ordinal, annual_premium = churn_inputs
+        today = current_date.toordinal()
+        age = (today - dob_ordinal) // 365
 
         tenure_years = 0
-        if effective_date:
-            tenure_years = (current_date - effective_date).days // 365
+        if effective_ordinal is not None:
+            tenure_years = (today - effective_ordinal) // 365
 
         policy_data = {
             "tenure_years": tenure_years,
@@ -290,7 +456,7 @@ class PolicyLifecycleProcess(BaseProcess):
         }
 
         # Build claims history (simplified - could be enhanced with real tracking)
-        claims_history = self._get_claims_history(policy)
+        claims_history = self._get_claims_history(policy, current_date)
 
         # Get daily probability from churn model
         daily_prob = self.churn_model.predict_daily_churn_probability(
@@ -305,20 +471,63 @@ class PolicyLifecycleProcess(BaseProcess):
 
         return daily_prob
 
-    def _get_claims_history(self, policy: dict) -> dict:
+    def _resolve_churn_inputs(
+        self, policy: dict, primary_member: Any
+    ) -> tuple[Any, int, int | None, float] | None:
+        """
+        Resolve the fixed churn model inputs for a policy.
+
+        Args:
+            policy: Policy data dictionary
+            primary_member: The policy's primary member (object or dict)
+
+        Returns:
+            Tuple of (primary member, date-of-birth ordinal, effective date
+            ordinal or None, annual premium), or None if the member has no
+            date of birth
+        """
+        dob = primary_member.date_of_birth if hasattr(primary_member, "date_of_birth") else None
+        if dob is None:
+            dob = primary_member.get("date_of_birth") if isinstance(primary_member, dict) else None
+
+        if dob is None:
+            return None
+
+        policy_obj = policy.get("policy")
+        effective_date = None
+        annual_premium = 0
+
+        if policy_obj is not None:
+            if hasattr(policy_obj, "effective_date"):
+                effective_date = policy_obj.effective_date
+            if hasattr(policy_obj, "premium_amount"):
+                annual_premium = float(policy_obj.premium_amount) * 12
+
+        return (
+            primary_member,
+            dob.toordinal(),
+            effective_date.toordinal() if effective_date else None,
+            annual_premium,
+        )
+
+    def _get_claims_history(self, policy: dict, current_date: date | None = None) -> dict:
         """
         Build claims history from rolling 12-month event logs.
 
         Reads event logs written by ClaimsProcess._update_policy_claims_stats()
-        and computes derived metrics for ChurnPredictionModel.
+        and computes derived metrics for ChurnPredictionModel. Each log is
+        scanned once; it is only rebuilt when it holds entries older than
+        the window.
 
         Args:
             policy: Policy data dictionary (from SharedState.active_policies)
+            current_date: Current simulation date (defaults to the sim date)
 
         Returns:
             Dictionary with claims history metrics
         """
-        current_date = self.sim_env.current_date
+        if current_date is None:
+            current_date = self.sim_env.current_date
         cutoff = current_date - timedelta(days=365)
 
         # days_since_last_claim: computed from stored date (not windowed)
@@ -328,17 +537,28 @@ class PolicyLifecycleProcess(BaseProcess):
         else:
             days_since = None
 
-        # Prune and compute from paid claim log (rolling 12 months)
-        paid_log = [e for e in policy.get("paid_claim_log", []) if e[0] >= cutoff]
-        policy["paid_claim_log"] = paid_log
-
-        total_claims_amount = sum(e[1] for e in paid_log)
-        cumulative_gap = sum(e[2] for e in paid_log)
-
-        # Prune and compute from denial log (rolling 12 months)
-        denial_log = [d for d in policy.get("denial_log", []) if d >= cutoff]
-        policy["denial_log"] = denial_log
-        denial_count = len(denial_log)
+        # Compute from paid claim log (rolling 12 months), pruning old entries
+        total_claims_amount = 0
+        cumulative_gap = 0
+        paid_log = policy.get("paid_claim_log")
+        if paid_log:
+            stale = 0
+            for claim_date, benefit, gap in paid_log:
+                if claim_date >= cutoff:
+                    total_claims_amount += benefit
+                    cumulative_gap += gap
+                else:
+                    stale += 1
+            if stale:
+                policy["paid_claim_log"] = [e for e in paid_log if e[0] >= cutoff]
+
+        # Compute from denial log (rolling 12 months), pruning old entries
+        denial_count = 0
+        denial_log = policy.get("denial_log")
+        if denial_log:
+            denial_count = sum(1 for d in denial_log if d >= cutoff)
+            if denial_count < len(denial_log):
+                policy["denial_log"] = [d for d in denial_log if d >= cutoff]
 
         # high_out_of_pocket: cumulative gap vs configurable threshold
         high_oop_threshold = 500.0
@@ -354,60 +574,32 @@ class PolicyLifecycleProcess(BaseProcess):
             "total_claims_amount": total_claims_amount,
         }
 
-    def _get_policy_id(self, policy: dict) -> UUID | None:
-        """
-        Extract policy_id from policy data dictionary.
-
-        The policy dict structure varies - policy_id may be stored directly
-        or nested inside a policy object.
-
-        Args:
-            policy: Policy data dictionary
-
-        Returns:
-            Policy UUID or None if not found
-        """
-        # Try direct key first
-        policy_id = policy.get("policy_id")
-        if policy_id:
-            return policy_id
-
-        # Fall back to nested policy object
-        policy_obj = policy.get("policy")
-        if policy_obj and hasattr(policy_obj, "policy_id"):
-            return policy_obj.policy_id
-
-        return None
-
     def _build_product_tier_lookups(self) -> None:
         """Build lookups for product tiers from reference data."""
         products = self.reference.get_products(active_only=True)
 
         # product_id -> tier_id
         self.product_tier: dict[int, int] = {}
-        # tier_id -> list of (product_id, excess_amount) tuples
-        self.tier_products: dict[int, list[tuple[int, Decimal | None]]] = {}
+        # (tier_id, excess in cents) -> first product_id with that excess
+        self.tier_excess_product: dict[tuple[int, int], int] = {}
+        # tier_id -> first product_id in the tier
+        self.tier_default_product: dict[int, int] = {}
 
         for p in products:
             product_id = p.get("product_id")
             tier_id = p.get("product_tier_id")
+            if not (product_id and tier_id):
+                continue
+
+            self.product_tier[product_id] = tier_id
+            self.tier_default_product.setdefault(tier_id, product_id)
+
             # Try to extract excess from product name (e.g., "$500 Excess")
             name = p.get("product_name", "")
-            excess = None
-            if "$250" in name:
-                excess = Decimal("250")
-            elif "$500" in name:
-                excess = Decimal("500")
-            elif "$750" in name:
-                excess = Decimal("750")
-            elif "No Excess" in name:
-                excess = Decimal("0")
-
-            if product_id and tier_id:
-                self.product_tier[product_id] = tier_id
-                if tier_id not in self.tier_products:
-                    self.tier_products[tier_id] = []
-                self.tier_products[tier_id].append((product_id, excess))
+            for marker, excess_cents in _EXCESS_MARKERS:
+                if marker in name:
+                    self.tier_excess_product.setdefault((tier_id, excess_cents), product_id)
+                    break
 
     def _find_product_in_tier(
         self,
@@ -428,24 +620,23 @@ class PolicyLifecycleProcess(BaseProcess):
         if target_tier_id is None:
             return None
 
-        products_in_tier = self.tier_products.get(target_tier_id, [])
-        if not products_in_tier:
-            return None
-
         # Try to find a product with matching excess
         if current_excess is not None:
-            for product_id, excess in products_in_tier:
-                if excess == current_excess:
-                    return product_id
+            product_id = self.tier_excess_product.get(
+                (target_tier_id, int(current_excess * 100))
+            )
+            if product_id is not None:
+                return product_id
 
         # Fall back to first product in tier
-        return products_in_tier[0][0]
+        return self.tier_default_product.get(target_tier_id)
 
     def _process_upgrade(
         self,
         policy_id: UUID,
         policy: dict,
-        current_date,
+        current_date: date,
+        now: datetime,
     ) -> None:
         """
         Process a policy upgrade.
@@ -455,16 +646,11 @@ class PolicyLifecycleProcess(BaseProcess):
         current_tier = policy.get("tier", "Bronze")
 
         # Find next tier up
-        try:
-            current_idx = self.TIER_ORDER.index(current_tier)
-        except ValueError:
+        new_tier = self.NEXT_TIER.get(current_tier)
+        if new_tier is None:
+            # Already at highest tier (or unknown tier)
             return
 
-        if current_idx >= len(self.TIER_ORDER) - 1:
-            # Already at highest tier
-            return
-
-        new_tier = self.TIER_ORDER[current_idx + 1]
         current_product_id = policy.get("product_id", 1)
         current_excess = policy.get("excess")
 
@@ -475,7 +661,8 @@ class PolicyLifecycleProcess(BaseProcess):
             return
 
         # Create upgrade request
-        upgrade_request = UpgradeRequestCreate(
+        # Every value comes from the simulator, so skip Pydantic validation
+        upgrade_request = UpgradeRequestCreate.model_construct(
             upgrade_request_id=self.id_generator.generate_uuid(),
             policy_id=policy_id,
             request_type="Upgrade",
@@ -486,12 +673,12 @@ class PolicyLifecycleProcess(BaseProcess):
             requested_effective_date=current_date,
             request_reason="Member requested upgrade",
             request_status="Approved",
-            submission_date=self.sim_env.current_datetime,
-            decision_date=self.sim_env.current_datetime,
+            submission_date=now,
+            decision_date=now,
             decision_by="SYSTEM",
             requires_waiting_period=True,
             waiting_period_details="New waiting periods apply to upgraded benefits",
-            created_at=self.sim_env.current_datetime,
+            created_at=now,
             created_by="SIMULATION",
         )
 
@@ -500,7 +687,6 @@ class PolicyLifecycleProcess(BaseProcess):
         # Update policy tier and product in memory
         policy["tier"] = new_tier
         policy["product_id"] = new_product_id
-        self.active_policies[policy_id] = policy
 
         self.increment_stat("upgrades")
         logger.debug(
@@ -516,7 +702,8 @@ class PolicyLifecycleProcess(BaseProcess):
         self,
         policy_id: UUID,
         policy: dict,
-        current_date,
+        current_date: date,
+        now: datetime,
     ) -> None:
         """
         Process a policy downgrade.
@@ -526,16 +713,11 @@ class PolicyLifecycleProcess(BaseProcess):
         current_tier = policy.get("tier", "Silver")
 
         # Find next tier down
-        try:
-            current_idx = self.TIER_ORDER.index(current_tier)
-        except ValueError:
+        new_tier = self.PREV_TIER.get(current_tier)
+        if new_tier is None:
+            # Already at lowest tier (or unknown tier)
             return
 
-        if current_idx <= 0:
-            # Already at lowest tier
-            return
-
-        new_tier = self.TIER_ORDER[current_idx - 1]
         current_product_id = policy.get("product_id", 1)
         current_excess = policy.get("excess")
 
@@ -546,7 +728,8 @@ class PolicyLifecycleProcess(BaseProcess):
             return
 
         # Create upgrade request (with type=Downgrade)
-        downgrade_request = UpgradeRequestCreate(
+        # Every value comes from the simulator, so skip Pydantic validation
+        downgrade_request = UpgradeRequestCreate.model_construct(
             upgrade_request_id=self.id_generator.generate_uuid(),
             policy_id=policy_id,
             request_type="Downgrade",
@@ -557,12 +740,12 @@ class PolicyLifecycleProcess(BaseProcess):
             requested_effective_date=current_date,
             request_reason="Member requested downgrade",
             request_status="Approved",
-            submission_date=self.sim_env.current_datetime,
-            decision_date=self.sim_env.current_datetime,
+            submission_date=now,
+            decision_date=now,
             decision_by="SYSTEM",
             requires_waiting_period=False,
             waiting_period_details=None,
-            created_at=self.sim_env.current_datetime,
+            created_at=now,
             created_by="SIMULATION",
         )
 
@@ -571,7 +754,6 @@ class PolicyLifecycleProcess(BaseProcess):
         # Update policy tier and product in memory
         policy["tier"] = new_tier
         policy["product_id"] = new_product_id
-        self.active_policies[policy_id] = policy
 
         self.increment_stat("downgrades")
         logger.debug(
@@ -587,7 +769,8 @@ class PolicyLifecycleProcess(BaseProcess):
         self,
         policy_id: UUID,
         policy: dict,
-        current_date,
+        current_date: date,
+        now: datetime,
     ) -> None:
         """
         Process a policy cancellation.
@@ -653,50 +836,35 @@ class PolicyLifecycleProcess(BaseProcess):
         reason_message = reason_messages.get(cancellation_reason, cancellation_reason)
 
         # Write SQL to update POLICY status to Cancelled with reason
-        sql = f"""
-            UPDATE policy
-            SET policy_status = 'Cancelled',
-                end_date = '{current_date.isoformat()}',
-                cancellation_reason = '{reason_message}',
-                modified_at = '{self.sim_env.current_datetime.isoformat()}',
-                modified_by = 'SIMULATION'
-            WHERE policy_id = '{policy_id}'
-        """
-        self.batch_writer.add_raw_sql("policy_cancellation", sql)
+        self.batch_writer.add_raw_sql(
+            "policy_cancellation",
+            _CANCEL_POLICY_SQL,
+            [current_date, reason_message, now, [policy_id]],
+        )
 
         # Write SQL to end all COVERAGE records for this policy
-        sql = f"""
-            UPDATE coverage
-            SET status = 'Terminated',
-                end_date = '{current_date.isoformat()}',
-                modified_at = '{self.sim_env.current_datetime.isoformat()}',
-                modified_by = 'SIMULATION'
-            WHERE policy_id = '{policy_id}'
-              AND (status = 'Active' OR status IS NULL)
-        """
-        self.batch_writer.add_raw_sql("coverage_termination", sql)
+        self.batch_writer.add_raw_sql(
+            "coverage_termination",
+            _TERMINATE_COVERAGE_SQL,
+            [current_date, now, [policy_id]],
+        )
 
         # Write SQL to end all POLICY_MEMBER records for this policy
-        sql = f"""
-            UPDATE policy_member
-            SET is_active = FALSE,
-                end_date = '{current_date.isoformat()}'
-            WHERE policy_id = '{policy_id}'
-              AND is_active = TRUE
-        """
-        self.batch_writer.add_raw_sql("policy_member_termination", sql)
+        self.batch_writer.add_raw_sql(
+            "policy_member_termination",
+            _END_POLICY_MEMBERS_SQL,
+            [current_date, [policy_id]],
+        )
 
         # Terminate the direct-debit mandate (if any)
         mandate = policy.get("mandate")
         if mandate is not None:
-            self.batch_writer.add_raw_sql(
-                "mandate_cancellation",
-                self.billing_gen.cancel_mandate_sql(
-                    direct_debit_id=mandate.direct_debit_id,
-                    cancellation_date=current_date,
-                    reason="Policy cancelled",
-                ),
+            cancel_sql, cancel_params = self.billing_gen.cancel_mandate_sql(
+                direct_debit_id=mandate.direct_debit_id,
+                cancellation_date=current_date,
+                reason="Policy cancelled",
             )
+            self.batch_writer.add_raw_sql("mandate_cancellation", cancel_sql, cancel_params)
 
         self.increment_stat("cancellations")
 
@@ -729,7 +897,8 @@ class PolicyLifecycleProcess(BaseProcess):
             event_type: "Cancellation" or "Suspension"
 
         Returns:
-            Refund amount, or None if no refund applicable
+            Refund amount rounded half-even to the cent, or None if no
+            refund applicable
         """
         if policy is None or not hasattr(policy, "premium_amount"):
             return None
@@ -739,27 +908,30 @@ class PolicyLifecycleProcess(BaseProcess):
             return None
 
         # Calculate days in current billing period (assume monthly billing)
-        period_end = last_of_month(event_date)
-        period_start = event_date.replace(day=1)
-        days_in_period = (period_end - period_start).days + 1
+        days_in_period = calendar.monthrange(event_date.year, event_date.month)[1]
 
-        # Calculate daily rate
-        daily_rate = monthly_premium / Decimal(str(days_in_period))
-
-        # Calculate unused days
-        unused_days = (period_end - event_date).days
+        # Calculate unused days (to the end of the month)
+        unused_days = days_in_period - event_date.day
 
         if unused_days <= 0:
             return None
 
-        refund_amount = daily_rate * Decimal(str(unused_days))
-        return refund_amount
+        # Prorate in whole cents: premium * unused / days, rounded half-even
+        # like the refund record's quantize(Decimal("0.01"))
+        premium_cents = int(monthly_premium.scaleb(2).to_integral_value())
+        refund_cents, remainder = divmod(premium_cents * unused_days, days_in_period)
+        if 2 * remainder > days_in_period or (
+            2 * remainder == days_in_period and refund_cents % 2
+        ):
+            refund_cents += 1
+        return Decimal(refund_cents).scaleb(-2)
 
     def _process_suspension(
         self,
         policy_id: UUID,
         policy: dict,
-        current_date,
+        current_date: date,
+        now: datetime,
     ) -> None:
         """
         Process a policy suspension.
@@ -817,7 +989,7 @@ class PolicyLifecycleProcess(BaseProcess):
         """
         self.active_policies.pop(policy_id, None)
 
-    def _process_member_change_events(self, current_date) -> None:
+    def _process_member_change_events(self, current_date: date, now: datetime) -> None:
         """
         Process member change events from MemberLifecycleProcess.
 
@@ -825,30 +997,51 @@ class PolicyLifecycleProcess(BaseProcess):
         - DEATH: Cancel policy or transfer to surviving member
         - ADDRESS_CHANGE: Update policy address, may affect ambulance coverage
         """
-        if not self.shared_state:
+        if not self.shared_state or not self.shared_state.has_member_change_events():
             return
 
-        # Process death events
-        death_events = self.shared_state.get_member_change_events("DEATH")
-        for event in death_events:
-            self._handle_member_death(event, current_date)
-
-        # Process address changes (may affect ambulance coverage by state)
-        address_events = self.shared_state.get_member_change_events("ADDRESS_CHANGE")
-        for event in address_events:
-            self._handle_address_change(event, current_date)
-
-    def _handle_member_death(self, event: dict, current_date) -> None:
+        events = self.shared_state.drain_member_change_events(("DEATH", "ADDRESS_CHANGE"))
+
+        # Process death events; primary-death cancellations and policy_type
+        # changes are written together
+        death_cancellations: list[UUID] = []
+        for event in events["DEATH"]:
+            self._handle_member_death(event, current_date, death_cancellations)
+        self._write_death_cancellations(death_cancellations, current_date, now)
+        self._flush_policy_type_changes(now)
+
+        # Process address changes (may affect ambulance coverage by state);
+        # the day's counts and interstate move log are emitted once
+        address_events = events["ADDRESS_CHANGE"]
+        moves = [self._handle_address_change(event, current_date) for event in address_events]
+        processed = len(moves) - moves.count(None)
+        if processed:
+            self.increment_stat("address_changes_processed", processed)
+            interstate = moves.count(True)
+            if interstate:
+                self.increment_stat("interstate_moves", interstate)
+                if self._debug_enabled:
+                    self._log_interstate_moves(address_events, moves, current_date)
+
+    def _handle_member_death(
+        self,
+        event: dict,
+        current_date: date,
+        death_cancellations: list[UUID],
+    ) -> None:
         """
         Handle policy implications of member death.
 
         - Primary death: Cancel policy with reason "Deceased"
         - Partner/Dependent death: Remove from policy, adjust policy type
+
+        Cancelled policy ids are appended to death_cancellations for
+        _write_death_cancellations().
         """
         policy_id = event["policy_id"]
         member_id = event["member_id"]
         change_data = event.get("change_data", {})
-        member_role = change_data.get("member_role", "Primary")
+        member_role = change_data.get("member_role", _ROLE_PRIMARY)
 
         policy = self.active_policies.get(policy_id)
         if not policy:
@@ -863,65 +1056,35 @@ class PolicyLifecycleProcess(BaseProcess):
             self.increment_stat("member_deaths_dropped_pre_effective")
             return
 
-        if member_role == "Primary":
+        if member_role == _ROLE_PRIMARY:
             # Primary death: Cancel the policy
             self._cancel_for_death(policy_id, policy, current_date)
+            death_cancellations.append(policy_id)
         else:
             # Partner or Dependent death: Remove from policy
             self._remove_member_from_policy(policy_id, member_id, member_role, current_date)
 
         self.increment_stat("member_deaths_processed")
 
-    def _cancel_for_death(self, policy_id: UUID, policy: dict, current_date) -> None:
-        """Cancel policy due to primary member death."""
-        # Remove from active policies
-        del self.active_policies[policy_id]
-
-        # Write SQL to update POLICY status to Cancelled with death reason
-        sql = f"""
-            UPDATE policy
-            SET policy_status = 'Cancelled',
-                end_date = '{current_date.isoformat()}',
-                cancellation_reason = 'Primary member deceased',
-                modified_at = '{self.sim_env.current_datetime.isoformat()}',
-                modified_by = 'SIMULATION'
-            WHERE policy_id = '{policy_id}'
-        """
-        self.batch_writer.add_raw_sql("policy_cancellation_death", sql)
-
-        # End all COVERAGE records
-        sql = f"""
-            UPDATE coverage
-            SET status = 'Terminated',
-                end_date = '{current_date.isoformat()}',
-                modified_at = '{self.sim_env.current_datetime.isoformat()}',
-                modified_by = 'SIMULATION'
-            WHERE policy_id = '{policy_id}'
-              AND (status = 'Active' OR status IS NULL)
+    def _cancel_for_death(self, policy_id: UUID, policy: dict, current_date: date) -> None:
         """
-        self.batch_writer.add_raw_sql("coverage_termination_death", sql)
+        Cancel policy due to primary member death.
 
-        # End all POLICY_MEMBER records
-        sql = f"""
-            UPDATE policy_member
-            SET is_active = FALSE,
-                end_date = '{current_date.isoformat()}'
-            WHERE policy_id = '{policy_id}'
-              AND is_active = TRUE
+        The policy, coverage and policy_member updates are written by
+        _write_death_cancellations() once the day's deaths are handled.
         """
-        self.batch_writer.add_raw_sql("policy_member_termination_death", sql)
+        # Remove from active policies
+        del self.active_policies[policy_id]
 
         # Terminate the direct-debit mandate (if any)
         mandate = policy.get("mandate")
         if mandate is not None:
-            self.batch_writer.add_raw_sql(
-                "mandate_cancellation_death",
-                self.billing_gen.cancel_mandate_sql(
-                    direct_debit_id=mandate.direct_debit_id,
-                    cancellation_date=current_date,
-                    reason="Policy cancelled - primary member deceased",
-                ),
+            cancel_sql, cancel_params = self.billing_gen.cancel_mandate_sql(
+                direct_debit_id=mandate.direct_debit_id,
+                cancellation_date=current_date,
+                reason="Policy cancelled - primary member deceased",
             )
+            self.batch_writer.add_raw_sql("mandate_cancellation_death", cancel_sql, cancel_params)
 
         # Remove members from shared state tracking
         if self.shared_state:
@@ -936,74 +1099,124 @@ class PolicyLifecycleProcess(BaseProcess):
             date=current_date.isoformat(),
         )
 
+    def _write_death_cancellations(
+        self,
+        policy_ids: list[UUID],
+        current_date: date,
+        now: datetime,
+    ) -> None:
+        """
+        Write the policy, coverage and policy_member updates for a day's
+        primary-death cancellations as one statement each.
+
+        Args:
+            policy_ids: Policies cancelled by _cancel_for_death() today
+            current_date: Current simulation date
+            now: Current simulation datetime
+        """
+        if not policy_ids:
+            return
+
+        # Update POLICY status to Cancelled with death reason
+        self.batch_writer.add_raw_sql(
+            "policy_cancellation_death",
+            _CANCEL_POLICY_SQL,
+            [current_date, "Primary member deceased", now, policy_ids],
+        )
+
+        # End all COVERAGE records
+        self.batch_writer.add_raw_sql(
+            "coverage_termination_death",
+            _TERMINATE_COVERAGE_SQL,
+            [current_date, now, policy_ids],
+        )
+
+        # End all POLICY_MEMBER records
+        self.batch_writer.add_raw_sql(
+            "policy_member_termination_death",
+            _END_POLICY_MEMBERS_SQL,
+            [current_date, policy_ids],
+        )
+
+    def _flush_policy_type_changes(self, now: datetime) -> None:
+        """Write the day's queued policy_type changes as batched, parameterized SQL."""
+        if not self._pending_policy_type_changes:
+            return
+
+        rows = list(self._pending_policy_type_changes.items())
+        for start in range(0, len(rows), self.POLICY_TYPE_CHUNK_ROWS):
+            chunk = rows[start:start + self.POLICY_TYPE_CHUNK_ROWS]
+            sql = (
+                "UPDATE policy AS p SET policy_type = v.policy_type, "
+                "modified_at = %s, modified_by = 'SIMULATION' "
+                f"FROM (VALUES {', '.join(['(%s, %s)'] * len(chunk))}) "
+                "AS v(policy_id, policy_type) "
+                "WHERE p.policy_id = v.policy_id::uuid"
+            )
+            params: list[Any] = [now]
+            for policy_id, policy_type in chunk:
+                params.append(policy_id)
+                params.append(policy_type)
+            self.batch_writer.add_raw_sql("policy_type_change", sql, params)
+
+        self._pending_policy_type_changes = {}
+
     def _remove_member_from_policy(
         self,
         policy_id: UUID,
         member_id: UUID,
         member_role: str,
-        current_date,
+        current_date: date,
     ) -> None:
-        """Remove a member from policy (partner/dependent death)."""
+        """
+        Remove a member from policy (partner/dependent death).
+
+        Any policy_type change is queued for _flush_policy_type_changes().
+        """
         policy = self.active_policies.get(policy_id)
         if not policy:
             return
 
         # Update POLICY_MEMBER record to inactive
-        sql = f"""
-            UPDATE policy_member
-            SET is_active = FALSE,
-                end_date = '{current_date.isoformat()}'
-            WHERE policy_id = '{policy_id}'
-              AND member_id = '{member_id}'
-              AND is_active = TRUE
-        """
-        self.batch_writer.add_raw_sql("policy_member_removal", sql)
+        self.batch_writer.add_raw_sql(
+            "policy_member_removal",
+            _REMOVE_POLICY_MEMBER_SQL,
+            [current_date, policy_id, member_id],
+        )
 
         # Potentially update policy type
-        current_type = policy.get("policy_type", "Single")
-        new_type = None
-
-        if member_role == "Partner":
-            # Partner death: Family -> Single Parent, Couple -> Single
-            if current_type == "Family":
-                new_type = "Single Parent"
-            elif current_type == "Couple":
-                new_type = "Single"
-        elif member_role == "Dependent":
-            # Dependent death: May need to check remaining dependents
-            # If no dependents left, Family -> Couple, Single Parent -> Single
-            # For simplicity, we don't track exact counts, just log it
-            pass
+        current_type = policy.get("policy_type", PolicyType.SINGLE.value)
+        new_type = _DEATH_POLICY_TYPES.get((member_role, current_type))
+
+        if member_role == _ROLE_DEPENDENT:
+            # Only the last dependent's death changes the type. Policies
+            # registered without a dependent_count keep their type.
+            remaining = policy.get("dependent_count")
+            if remaining:
+                remaining = policy["dependent_count"] = remaining - 1
+            if remaining != 0:
+                new_type = None
 
         if new_type:
-            # Update policy type
-            sql = f"""
-                UPDATE policy
-                SET policy_type = '{new_type}',
-                    modified_at = '{self.sim_env.current_datetime.isoformat()}',
-                    modified_by = 'SIMULATION'
-                WHERE policy_id = '{policy_id}'
-            """
-            self.batch_writer.add_raw_sql("policy_type_change", sql)
+            # Update policy type (a later change the same day replaces this one)
+            self._pending_policy_type_changes[policy_id] = new_type
 
             policy["policy_type"] = new_type
 
-            logger.debug(
-                "policy_type_changed",
-                policy_id=str(policy_id),
-                from_type=current_type,
-                to_type=new_type,
-                reason="member_death",
-            )
+            if self._debug_enabled:
+                logger.debug(
+                    "policy_type_changed",
+                    policy_id=str(policy_id),
+                    from_type=current_type,
+                    to_type=new_type,
+                    reason="member_death",
+                )
 
         # Remove from shared state tracking if available
         if self.shared_state:
-            # Find and remove the policy_member by member_id
-            for pm_id, data in list(self.shared_state.policy_members.items()):
-                member = data.get("member")
-                if member and member.member_id == member_id:
-                    self.shared_state.remove_policy_member(pm_id)
-                    break
+            pm_id = self.shared_state.get_policy_member_id(member_id)
+            if pm_id is not None:
+                self.shared_state.remove_policy_member(pm_id)
 
         # Drop the deceased member from the policy's member roster so the
         # billing-time youngest-adult age-discount search does not see ghost
@@ -1015,44 +1228,63 @@ class PolicyLifecycleProcess(BaseProcess):
                 if getattr(m, "member_id", None) != member_id
             ]
 
-    def _handle_address_change(self, event: dict, current_date) -> None:
+    def _handle_address_change(self, event: dict, current_date: date) -> bool | None:
         """
         Handle address change for a member.
 
         Updates policy address and checks if ambulance coverage needs adjustment
         (ambulance coverage varies by state in Australia).
+
+        Returns:
+            Whether the move was interstate, or None if the event was skipped
         """
-        policy_id = event["policy_id"]
         change_data = event.get("change_data", {})
-        previous_state = change_data.get("previous_state")
-        new_state = change_data.get("new_state")
-        member_role = change_data.get("member_role")
-
-        policy = self.active_policies.get(policy_id)
-        if not policy:
-            return
 
         # Only update policy address if primary member moved
-        if member_role != "Primary":
-            return
+        if change_data.get("member_role") != _ROLE_PRIMARY:
+            return None
 
-        # Log interstate moves (may affect ambulance coverage)
-        if previous_state != new_state:
-            logger.debug(
-                "policy_interstate_move",
-                policy_id=str(policy_id),
-                from_state=previous_state,
-                to_state=new_state,
-            )
-            self.increment_stat("interstate_moves")
+        if event["policy_id"] not in self.active_policies:
+            return None
+
+        # Interstate moves may affect ambulance coverage. Note: Full ambulance
+        # coverage adjustment would require checking state-specific ambulance
+        # schemes and updating coverage records. For now, just track the event.
+        previous_state: str | None = change_data.get("previous_state")
+        new_state: str | None = change_data.get("new_state")
+        return previous_state != new_state
+
+    def _log_interstate_moves(
+        self,
+        events: list[dict],
+        moves: list[bool | None],
+        current_date: date,
+    ) -> None:
+        """Log a day's interstate moves as a single debug line."""
+        logger.debug(
+            "policy_interstate_moves",
+            date=current_date.isoformat(),
+            moves=[
+                {
+                    "policy_id": str(event["policy_id"]),
+                    "from_state": event["change_data"].get("previous_state"),
+                    "to_state": event["change_data"].get("new_state"),
+                }
+                for event, moved in zip(events, moves)
+                if moved
+            ],
+        )
 
-        # Note: Full ambulance coverage adjustment would require checking state-specific
-        # ambulance schemes and updating coverage records. For now, just track the event.
-        self.increment_stat("address_changes_processed")
+    def _log_progress_monthly(self) -> Generator:
+        """Log progress every 30 days, alongside the daily loop."""
+        while True:
+            yield self.env.timeout(30.0)
+            self._log_progress()
 
     def _log_progress(self) -> None:
         """Log lifecycle progress."""
-        stats = self.get_stats()
+        # Read the counters in place; get_stats() would copy them
+        stats = self._stats
         logger.info(
             "lifecycle_progress",
             worker_id=self.worker_id,
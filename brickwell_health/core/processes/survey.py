@@ -5,6 +5,7 @@ Generates pending NPS and CSAT surveys based on trigger events.
 NO LLM calls - surveys are populated post-simulation using Databricks ai_query.
 """
 
+from collections import deque
 from datetime import date, datetime, timedelta
 from typing import Any, Generator, Optional, TYPE_CHECKING
 from uuid import UUID
@@ -18,11 +19,41 @@ from brickwell_health.domain.enums import SurveyType
 from brickwell_health.generators.survey_generator import SurveyGenerator
 
 if TYPE_CHECKING:
-    from brickwell_health.core.shared_state import SharedState
+    from brickwell_health.core.shared_state import CRMQueueEvent, SharedState
 
 
 logger = structlog.get_logger()
 
+def _send_probabilities(triggers: dict) -> dict[str, float | None]:
+    """
+    Resolve trigger configs to their send probabilities.
+
+    A trigger config is either a dict with send_probability or a bare
+    probability. Unset or zero bare values map to None so each caller can
+    apply its own default.
+    """
+    probabilities: dict[str, float | None] = {}
+    for key, trigger_config in triggers.items():
+        if isinstance(trigger_config, dict):
+            probabilities[key] = trigger_config.get("send_probability")
+        else:
+            probabilities[key] = float(trigger_config) if trigger_config else None
+    return probabilities
+
+
+# Survey fatigue: at most this many surveys per member within the window
+_FATIGUE_MAX_SURVEYS = 2
+_FATIGUE_WINDOW = timedelta(days=30)
+
+
+def _anniversary_month(policy_data: dict) -> int | None:
+    """Get the month of a policy's start date, or None if it has none."""
+    # Fall back to the policy object's start_date
+    start_date = policy_data.get("start_date") or getattr(
+        policy_data.get("policy"), "start_date", None
+    )
+    return start_date.month if start_date else None
+
 
 class SurveyProcess(BaseProcess):
     """
@@ -99,8 +130,14 @@ class SurveyProcess(BaseProcess):
         self.nps_triggers = nps_config.get("triggers", {})
         self.csat_triggers = csat_config.get("triggers", {})
 
-        # Track surveys per member to prevent fatigue
-        self.surveys_sent: dict[UUID, list[dict]] = {}
+        # Send probabilities resolved once from the trigger configs
+        self._nps_send_prob = _send_probabilities(self.nps_triggers)
+        self._csat_send_prob = _send_probabilities(self.csat_triggers)
+        self._has_any_nps = any(p and p > 0 for p in self._nps_send_prob.values())
+
+        # Send times of each member's most recent surveys, oldest first,
+        # to prevent fatigue
+        self.surveys_sent: dict[UUID, deque[datetime]] = {}
 
         # Statistics
         self._stats = {
@@ -162,20 +199,17 @@ class SurveyProcess(BaseProcess):
             # CSAT Survey triggers
             self._maybe_create_csat_survey(event, event_type)
 
-    def _maybe_create_nps_survey(self, event: dict, event_type: str) -> None:
+    def _maybe_create_nps_survey(self, event: "CRMQueueEvent", event_type: str) -> None:
         """Maybe create a pending NPS survey based on event."""
+        if not self._has_any_nps:
+            return
+
         # Map event type to trigger config key
         trigger_key = self._get_nps_trigger_key(event_type)
         if not trigger_key:
             return
 
-        trigger_config = self.nps_triggers.get(trigger_key, {})
-
-        # Handle both dict config and simple float
-        if isinstance(trigger_config, dict):
-            send_probability = trigger_config.get("send_probability", 0)
-        else:
-            send_probability = float(trigger_config) if trigger_config else 0
+        send_probability = self._nps_send_prob.get(trigger_key) or 0
 
         # Check if survey should be sent
         if send_probability <= 0 or self.rng.random() >= send_probability:
@@ -238,18 +272,16 @@ class SurveyProcess(BaseProcess):
             self._stats["nps_will_respond"] += 1
 
         # Track for fatigue
-        self._track_survey_sent(member_id, "NPS")
+        self._track_survey_sent(member_id)
 
-    def _maybe_create_csat_survey(self, event: dict, event_type: str) -> None:
+    def _maybe_create_csat_survey(self, event: "CRMQueueEvent", event_type: str) -> None:
         """Maybe create a pending CSAT survey based on event."""
         # CSAT surveys triggered by interaction/case events
         if event_type not in ["interaction_completed", "case_resolved"]:
             return
 
         # Get trigger probability
-        trigger_probability = self.csat_triggers.get(event_type, 0)
-        if isinstance(trigger_probability, dict):
-            trigger_probability = trigger_probability.get("send_probability", 0)
+        trigger_probability = self._csat_send_prob.get(event_type) or 0
 
         if trigger_probability <= 0 or self.rng.random() >= trigger_probability:
             return
@@ -318,9 +350,9 @@ class SurveyProcess(BaseProcess):
             self._stats["csat_will_respond"] += 1
 
         # Track for fatigue
-        self._track_survey_sent(member_id, "CSAT")
+        self._track_survey_sent(member_id)
 
-    def _create_journey_nps_survey(self, event: dict) -> None:
+    def _create_journey_nps_survey(self, event: "CRMQueueEvent") -> None:
         """
         Create an NPS survey from a completed journey event.
 
@@ -341,9 +373,21 @@ class SurveyProcess(BaseProcess):
         Args:
             event: Journey completed event from CRM process
         """
+        trigger_type = event.get("trigger_type", "")
+
+        # Get NPS trigger config based on original trigger type
+        trigger_key = trigger_type.lower().replace("_", "_")  # claim_paid, claim_rejected
+        send_probability = self._nps_send_prob.get(trigger_key)
+        if send_probability is None:
+            send_probability = 0.30
+
+        # Check if survey should be sent. The draw does not depend on the
+        # member or policy, so it runs before any lookups.
+        if send_probability <= 0 or self.rng.random() >= send_probability:
+            return
+
         claim_member_id = event.get("member_id")  # Member who made the claim
         policy_id = event.get("policy_id")
-        trigger_type = event.get("trigger_type", "")
 
         if not claim_member_id or not policy_id:
             return
@@ -378,25 +422,9 @@ class SurveyProcess(BaseProcess):
             self._stats["surveys_suppressed_fatigue"] += 1
             return
 
-        # Get NPS trigger config based on original trigger type
-        trigger_key = trigger_type.lower().replace("_", "_")  # claim_paid, claim_rejected
-        trigger_config = self.nps_triggers.get(trigger_key, {})
-
-        # Handle both dict config and simple float
-        if isinstance(trigger_config, dict):
-            send_probability = trigger_config.get("send_probability", 0.30)
-        else:
-            send_probability = float(trigger_config) if trigger_config else 0.30
-
-        # Check if survey should be sent
-        if send_probability <= 0 or self.rng.random() >= send_probability:
-            return
-
-        # Get member and policy data
+        # Get member data (policy data was fetched above)
         member_data = self._get_member_data(member_id)
-        policy_data = self._get_policy_data(policy_id)
-
-        if not member_data or not policy_data:
+        if not member_data:
             return
 
         # Build rich trigger entity from journey context
@@ -457,7 +485,7 @@ class SurveyProcess(BaseProcess):
             self._stats["nps_will_respond"] += 1
 
         # Track for fatigue
-        self._track_survey_sent(member_id, "NPS")
+        self._track_survey_sent(member_id)
 
         logger.debug(
             "journey_nps_survey_created",
@@ -467,7 +495,7 @@ class SurveyProcess(BaseProcess):
             days_to_resolution=event.get("days_to_resolution"),
         )
 
-    def _build_journey_trigger_entity(self, event: dict) -> dict:
+    def _build_journey_trigger_entity(self, event: "CRMQueueEvent") -> dict:
         """
         Build a rich trigger entity from journey completed event.
 
@@ -582,43 +610,35 @@ class SurveyProcess(BaseProcess):
         if current_date.day != 1:
             return
 
-        for policy_id, policy_data in self.shared_state.active_policies.items():
-            start_date = policy_data.get("start_date")
-            if not start_date:
-                # Try to get from policy object
-                policy = policy_data.get("policy")
-                if policy and hasattr(policy, "start_date"):
-                    start_date = policy.start_date
-                else:
-                    continue
+        # Select this month's anniversaries in one pass over the book
+        month = current_date.month
+        anniversaries = [
+            (policy_id, policy_data)
+            for policy_id, policy_data in self.shared_state.active_policies.items()
+            if _anniversary_month(policy_data) == month
+        ]
+        if not anniversaries:
+            return
 
-            # Check if this month is anniversary
-            if start_date.month != current_date.month:
-                continue
+        # Send probability is the same for every policy this month
+        trigger_config = self.nps_triggers.get("policy_anniversary", {})
+        send_prob = (
+            trigger_config.get("send_probability", 0.50)
+            if isinstance(trigger_config, dict)
+            else 0.50
+        )
 
-            # Get primary member
+        for policy_id, policy_data in anniversaries:
+            # Get primary member (recorded when the policy is registered;
+            # otherwise the first member, who is the primary on creation)
             primary_member_id = policy_data.get("primary_member_id")
             if not primary_member_id:
-                # Try to find primary member
-                for pm_id, pm_data in self.shared_state.policy_members.items():
-                    pm_policy = pm_data.get("policy")
-                    if pm_policy and pm_policy.policy_id == policy_id:
-                        member = pm_data.get("member")
-                        if member:
-                            primary_member_id = member.member_id
-                            break
-
-            if not primary_member_id:
-                continue
+                members = policy_data.get("members")
+                if not members:
+                    continue
+                primary_member_id = members[0].member_id
 
             # Check send probability
-            trigger_config = self.nps_triggers.get("policy_anniversary", {})
-            send_prob = (
-                trigger_config.get("send_probability", 0.50)
-                if isinstance(trigger_config, dict)
-                else 0.50
-            )
-
             if self.rng.random() >= send_prob:
                 continue
 
@@ -652,7 +672,7 @@ class SurveyProcess(BaseProcess):
             if pending_survey.will_respond:
                 self._stats["nps_will_respond"] += 1
 
-            self._track_survey_sent(primary_member_id, "NPS")
+            self._track_survey_sent(primary_member_id)
 
     def _get_nps_trigger_key(self, event_type: str) -> Optional[str]:
         """Map event type to NPS trigger config key using reference data lookup.
@@ -703,44 +723,29 @@ class SurveyProcess(BaseProcess):
 
     def _is_survey_fatigued(self, member_id: UUID) -> bool:
         """Check if member has received too many surveys recently (max 2 per 30 days)."""
-        if member_id not in self.surveys_sent:
+        sent = self.surveys_sent.get(member_id)
+        if sent is None or len(sent) < _FATIGUE_MAX_SURVEYS:
             return False
 
-        recent = self.surveys_sent[member_id]
-        cutoff = self.sim_env.current_datetime - timedelta(days=30)
-        recent_count = sum(1 for s in recent if s.get("sent_date", cutoff) > cutoff)
-
-        return recent_count >= 2
+        # Sends are kept in time order, so the oldest retained send decides
+        return sent[0] > self.sim_env.current_datetime - _FATIGUE_WINDOW
 
-    def _track_survey_sent(self, member_id: UUID, survey_class: str) -> None:
+    def _track_survey_sent(self, member_id: UUID) -> None:
         """Track that a survey was sent to a member."""
-        if member_id not in self.surveys_sent:
-            self.surveys_sent[member_id] = []
-
-        self.surveys_sent[member_id].append(
-            {
-                "sent_date": self.sim_env.current_datetime,
-                "survey_class": survey_class,
-            }
-        )
-
-        # Keep only last 6 months
-        cutoff = self.sim_env.current_datetime - timedelta(days=180)
-        self.surveys_sent[member_id] = [
-            s for s in self.surveys_sent[member_id] if s.get("sent_date", cutoff) > cutoff
-        ]
+        sent = self.surveys_sent.get(member_id)
+        if sent is None:
+            sent = self.surveys_sent[member_id] = deque(maxlen=_FATIGUE_MAX_SURVEYS)
+        sent.append(self.sim_env.current_datetime)
 
     def _get_member_data(self, member_id: UUID) -> Optional[dict]:
         """Get member data from shared state."""
         if not self.shared_state:
             return None
 
-        for pm_id, data in self.shared_state.policy_members.items():
-            member = data.get("member")
-            if member and member.member_id == member_id:
-                return data
-
-        return None
+        pm_id = self.shared_state.get_policy_member_id(member_id)
+        if pm_id is None:
+            return None
+        return self.shared_state.policy_members[pm_id]
 
     def _get_policy_data(self, policy_id: UUID) -> Optional[dict]:
         """Get policy data from shared state, including coverage objects."""
@@ -828,7 +833,7 @@ class SurveyProcess(BaseProcess):
 
         return None
 
-    def _get_trigger_entity(self, event: dict) -> Optional[dict]:
+    def _get_trigger_entity(self, event: "CRMQueueEvent") -> Optional[dict]:
         """Get trigger entity details (claim, invoice, etc.)."""
         if event.get("claim_id"):
             return {
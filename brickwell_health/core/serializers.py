@@ -7,6 +7,8 @@ used in simulation checkpoints (UUIDs, dates, Decimals, enums, Pydantic models).
 
 import json
 from collections import deque
+from collections.abc import Iterable
+from dataclasses import fields, is_dataclass
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
@@ -15,6 +17,8 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from brickwell_health.domain.enums import TRIGGER_EVENT_TYPE_BY_NAME
+
 
 class CheckpointEncoder(json.JSONEncoder):
     """
@@ -26,6 +30,7 @@ class CheckpointEncoder(json.JSONEncoder):
     - Decimal -> string (preserves precision)
     - Enum -> value
     - Pydantic models -> dict (via model_dump)
+    - Dataclass instances -> dict of non-None fields (e.g. CRMEvent)
     - deque -> list
     - set -> list
     """
@@ -47,6 +52,12 @@ class CheckpointEncoder(json.JSONEncoder):
             return list(obj)
         if isinstance(obj, BaseModel):
             return obj.model_dump(mode="json")
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return {
+                f.name: getattr(obj, f.name)
+                for f in fields(obj)
+                if getattr(obj, f.name) is not None
+            }
         if hasattr(obj, "__dict__"):
             # Fallback for other objects with __dict__
             return {k: v for k, v in obj.__dict__.items() if not k.startswith("_")}
@@ -427,12 +438,12 @@ def deserialize_billing_retry_state(serialized: dict[str, dict]) -> dict[UUID, d
     return result
 
 
-def serialize_event_queue(queue: deque[dict]) -> list[dict]:
+def serialize_event_queue(queue: Iterable[Any]) -> list[dict]:
     """
     Serialize an event queue (CRM or communication events).
 
     Args:
-        queue: Deque of event dicts
+        queue: Deque of event dicts (or dataclass events such as CRMEvent)
 
     Returns:
         List of serialized event dicts
@@ -440,7 +451,7 @@ def serialize_event_queue(queue: deque[dict]) -> list[dict]:
     return json.loads(serialize_to_json(list(queue)))
 
 
-def deserialize_event_queue(events: list[dict]) -> deque[dict]:
+def deserialize_event_queue(events: list[dict]) -> deque[Any]:
     """
     Deserialize an event queue.
 
@@ -541,30 +552,55 @@ def deserialize_pending_campaign_responses(
     return result
 
 
-def serialize_digital_processed_triggers(triggers: set[str]) -> list[str]:
+def serialize_digital_processed_triggers(
+    triggers: set[tuple[Any, Any]],
+) -> list[list[str | None]]:
     """
     Serialize digital process trigger tracking set.
 
     Args:
-        triggers: Set of processed trigger keys
+        triggers: Set of (trigger event type, event_id) keys
 
     Returns:
-        List of trigger keys
-    """
-    return list(triggers)
+        List of [event type value, event_id] pairs
+    """
+    return [
+        [
+            event_type.value if isinstance(event_type, Enum) else event_type,
+            str(event_id) if event_id is not None else None,
+        ]
+        for event_type, event_id in triggers
+    ]
 
 
-def deserialize_digital_processed_triggers(triggers: list[str]) -> set[str]:
+def deserialize_digital_processed_triggers(
+    triggers: list[list[str | None] | str],
+) -> set[tuple[Any, Any]]:
     """
     Deserialize digital process trigger tracking set.
 
+    Event ids stay as strings, matching the ids of events restored from
+    the checkpointed CRM queue. Legacy "event_type:event_id" string keys
+    are converted to the tuple form.
+
     Args:
-        triggers: List of trigger keys
+        triggers: List of [event type value, event_id] pairs
 
     Returns:
-        Set of trigger keys
-    """
-    return set(triggers)
+        Set of (event type, event_id) keys
+    """
+    result: set[tuple[Any, Any]] = set()
+    for key in triggers:
+        if isinstance(key, str):
+            event_name, _, legacy_id = key.partition(":")
+            result.add((
+                TRIGGER_EVENT_TYPE_BY_NAME.get(event_name, event_name),
+                None if legacy_id == "None" else legacy_id,
+            ))
+        else:
+            event_type, event_id = key
+            result.add((event_type, event_id))
+    return result
 
 
 def serialize_nba_execution_history(
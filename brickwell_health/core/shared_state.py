@@ -5,12 +5,238 @@ Holds data that needs to be shared between Acquisition, Claims, Billing,
 and Lifecycle processes within a single worker.
 """
 
-from collections import deque
+import heapq
+from collections import Counter, deque
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
+import numpy as np
+
+
+@dataclass(slots=True)
+class CRMEvent:
+    """
+    Slotted CRM queue event for high-volume producers.
+
+    Exposes the dict-style ``get`` that queue consumers use, so it can be
+    queued alongside plain event dicts. Unset optional fields behave like
+    missing keys.
+    """
+
+    event_type: str
+    policy_id: UUID | None
+    member_id: UUID
+    timestamp: datetime
+    case_id: UUID | None = None
+    complaint_id: UUID | None = None
+    session_id: UUID | None = None
+    sla_breached: bool | None = None
+    resolution_outcome: str | None = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+
+# An entry on the CRM event queue: a plain event dict or a CRMEvent
+CRMQueueEvent = dict[str, Any] | CRMEvent
+
+
+@dataclass(frozen=True, slots=True)
+class MemberColumns:
+    """
+    Column view of policy_members for vectorized per-member sampling.
+
+    Row i describes one policy member; members without a policy or member
+    object are left out.
+    """
+
+    policy_ids: np.ndarray
+    member_ids: np.ndarray
+    # Index into engagement_levels for each row
+    engagement_idx: np.ndarray
+    engagement_levels: tuple[str, ...]
+
+    def __len__(self) -> int:
+        return len(self.member_ids)
+
+
+# Policy statuses whose members are left out of campaigns and baseline sessions
+INACTIVE_POLICY_STATUSES = frozenset({"Suspended", "Lapsed", "Cancelled"})
+
+# Executions kept per member in nba_execution_history
+NBA_EXECUTION_HISTORY_LIMIT = 50
+
+# Look-back for NBA max-attempts counting
+NBA_ATTEMPT_WINDOW = timedelta(days=365)
+
+# Index of each contact-limited NBA channel in NBAContactCounts channel
+# counts; every other channel is counted under NBA_OTHER_CHANNEL
+NBA_CHANNEL_CODES = {"Email": 0, "SMS": 1, "Phone": 2, "InApp": 3}
+NBA_OTHER_CHANNEL = 4
+
+
+@dataclass(slots=True)
+class NBAContactCounts:
+    """
+    Rolling NBA contact-policy counters for one member.
+
+    Kept in step with the member's nba_execution_history so contact policy
+    checks read counts instead of rescanning the history. ``window`` holds
+    (executed_at, action_id) for the history entries still inside
+    NBA_ATTEMPT_WINDOW, oldest first, and ``action_counts`` tallies them.
+    Channel counts, indexed by NBA_CHANNEL_CODES, cover executions on
+    ``day`` and since ``week_start`` (a Monday). ``latest_by_action`` and
+    ``latest_by_category`` point at the most recent retained execution for
+    cooldown checks.
+    """
+
+    day: date = date.min
+    day_channels: list[int] = field(default_factory=lambda: [0] * (NBA_OTHER_CHANNEL + 1))
+    week_start: date = date.min
+    week_channels: list[int] = field(default_factory=lambda: [0] * (NBA_OTHER_CHANNEL + 1))
+    action_counts: Counter = field(default_factory=Counter)
+    window: deque[tuple[datetime, Any]] = field(default_factory=deque)
+    latest_by_action: dict[Any, dict[str, Any]] = field(default_factory=dict)
+    latest_by_category: dict[Any, dict[str, Any]] = field(default_factory=dict)
+
+    def roll_to(self, current_date: date) -> None:
+        """Reset the day and week counts once ``current_date`` moves past them."""
+        if current_date != self.day:
+            self.day = current_date
+            self.day_channels = [0] * (NBA_OTHER_CHANNEL + 1)
+            week_start = current_date - timedelta(days=current_date.weekday())
+            if week_start != self.week_start:
+                self.week_start = week_start
+                self.week_channels = [0] * (NBA_OTHER_CHANNEL + 1)
+
+    def add(self, exec_data: dict[str, Any]) -> None:
+        """Count an execution; executions arrive in time order."""
+        executed_at = _executed_at(exec_data)
+        action_id = exec_data.get("action_id")
+        channel = NBA_CHANNEL_CODES.get(exec_data.get("channel", ""), NBA_OTHER_CHANNEL)
+
+        self.roll_to(executed_at.date())
+        self.day_channels[channel] += 1
+        self.week_channels[channel] += 1
+        self.window.append((executed_at, action_id))
+        self.action_counts[action_id] += 1
+        self.latest_by_action[action_id] = exec_data
+        self.latest_by_category[exec_data.get("action_category")] = exec_data
+
+    def discard(self, exec_data: dict[str, Any]) -> None:
+        """Uncount an execution trimmed (oldest first) from the history."""
+        if len(self.window) > NBA_EXECUTION_HISTORY_LIMIT:
+            _, action_id = self.window.popleft()
+            self.action_counts[action_id] -= 1
+
+        channel = NBA_CHANNEL_CODES.get(exec_data.get("channel", ""), NBA_OTHER_CHANNEL)
+        executed_on = _executed_at(exec_data).date()
+        if executed_on == self.day:
+            self.day_channels[channel] -= 1
+        if executed_on >= self.week_start:
+            self.week_channels[channel] -= 1
+
+        action_id = exec_data.get("action_id")
+        if self.latest_by_action.get(action_id) is exec_data:
+            del self.latest_by_action[action_id]
+        category = exec_data.get("action_category")
+        if self.latest_by_category.get(category) is exec_data:
+            del self.latest_by_category[category]
+
+    def cooldown_reason(
+        self,
+        action_id: Any,
+        action_category: str | None,
+        same_action_cooldown_days: int,
+        same_category_cooldown_days: int,
+        current_datetime: datetime,
+    ) -> str | None:
+        """
+        Get why an action is blocked by a cooldown, or None if it isn't.
+
+        Only the latest retained execution per action/category matters.
+        """
+        block = self.cooldown_block(
+            action_id,
+            action_category,
+            same_action_cooldown_days,
+            same_category_cooldown_days,
+            current_datetime,
+        )
+        return block[0] if block is not None else None
+
+    def cooldown_block(
+        self,
+        action_id: Any,
+        action_category: str | None,
+        same_action_cooldown_days: int,
+        same_category_cooldown_days: int,
+        current_datetime: datetime,
+    ) -> tuple[str, datetime] | None:
+        """
+        Get the blocking cooldown reason and when every active cooldown ends.
+
+        The reason names the same-action cooldown ahead of the category
+        one; the end time is the latest of the two, so nothing blocks the
+        action on cooldown grounds from then on. Returns None if neither
+        cooldown is active.
+        """
+        reason = None
+        ends_at = datetime.min
+
+        if action_id:
+            latest = self.latest_by_action.get(action_id)
+            if latest is not None:
+                cooldown_end = _executed_at(latest) + timedelta(days=same_action_cooldown_days)
+                if cooldown_end > current_datetime:
+                    reason = f"Same action cooldown ({same_action_cooldown_days} days)"
+                    ends_at = cooldown_end
+
+        if action_category:
+            latest = self.latest_by_category.get(action_category)
+            if latest is not None:
+                cooldown_end = _executed_at(latest) + timedelta(
+                    days=same_category_cooldown_days
+                )
+                if cooldown_end > current_datetime:
+                    if reason is None:
+                        reason = f"Same category cooldown ({same_category_cooldown_days} days)"
+                    ends_at = max(ends_at, cooldown_end)
+
+        if reason is None:
+            return None
+        return reason, ends_at
+
+    def attempts_free_at(self, action_id: Any, max_attempts: int) -> datetime:
+        """
+        Get when an action's attempts in the window drop below ``max_attempts``.
+
+        That is when the attempt that would still make the count reach the
+        limit ages out of NBA_ATTEMPT_WINDOW (assuming no new attempts).
+        """
+        excess = self.action_counts.get(action_id, 0) - max_attempts
+        for executed_at, window_action_id in self.window:
+            if window_action_id == action_id:
+                if excess <= 0:
+                    return executed_at + NBA_ATTEMPT_WINDOW
+                excess -= 1
+        return datetime.min
+
+    def expire(self, cutoff: datetime) -> None:
+        """Drop executions at or before ``cutoff`` from the attempt window."""
+        window = self.window
+        while window and window[0][0] <= cutoff:
+            _, action_id = window.popleft()
+            self.action_counts[action_id] -= 1
+
+
+def _executed_at(exec_data: dict[str, Any]) -> datetime:
+    """Get an NBA execution's timestamp, treating a missing one as datetime.min."""
+    return exec_data.get("executed_at") or datetime.min
+
 
 @dataclass
 class SharedState:
@@ -78,7 +304,8 @@ class SharedState:
     #     "member_id": UUID,
     #     # Event-specific fields...
     # }
-    crm_event_queue: deque[dict[str, Any]] = field(default_factory=deque)
+    # High-volume producers may queue CRMEvent instances instead of dicts.
+    crm_event_queue: deque[CRMQueueEvent] = field(default_factory=deque)
 
     # Track recent interactions for survey suppression and context
     # Used by: CRMProcess, SurveyProcess
@@ -160,6 +387,31 @@ class SharedState:
     # Structure: NBAActionWithRecommendation domain objects
     nba_action_queue: deque[Any] = field(default_factory=deque)
 
+    # Queued NBA recommendations by recommendation_id; queue entries missing
+    # from here were expired and are skipped when dequeued
+    _nba_pending: dict[UUID, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # Recommendations held back until a later date (not yet valid, or
+    # deferred by the NBA process), bucketed by release date, with a
+    # min-heap of the bucket dates
+    _nba_deferred: dict[date, list[Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _nba_deferred_dates: list[date] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    # Min-heap of (valid_until, recommendation_id) for queued recommendations,
+    # with the ids that currently have an entry
+    _nba_expiry_heap: list[tuple[date, UUID]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _nba_expiry_scheduled: set[UUID] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+
     # NBA Execution History: tracks recent executions per member for cooldown checks
     # Key: member_id -> list of execution records
     # Structure: {
@@ -182,6 +434,49 @@ class SharedState:
     # }
     nba_active_effects: dict[UUID, list[dict[str, Any]]] = field(default_factory=dict)
 
+    # Contact-policy counters per member, derived from nba_execution_history
+    # and reset if that dict is replaced (e.g. on checkpoint restore)
+    _nba_contact_counts: dict[UUID, NBAContactCounts] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _nba_contact_counts_source: dict | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Policy members recorded as deceased but not yet removed from tracking
+    # Used by: MemberLifecycleProcess (producer), live_policy_member_ids()
+    deceased_policy_member_ids: set[UUID] = field(default_factory=set)
+
+    # Bumped whenever policy_members or member_engagement_levels change through
+    # the methods below, so per-member caches know when to rebuild
+    members_version: int = 0
+
+    # Cached members_soa() result and the state it was built from
+    _members_soa: MemberColumns | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _members_soa_key: tuple[int, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Cached live_policy_member_ids() result and the state it was built from
+    _live_member_ids: tuple[UUID, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _live_member_ids_key: tuple[int, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # member_id -> policy_member_id, kept in step by the policy member mutators
+    # and rebuilt by get_policy_member_id() if policy_members is replaced or
+    # written directly
+    _member_pm_ids: dict[UUID, UUID] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _member_pm_ids_source: dict | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     # =========================================================================
     # Fraud Helper Methods
     # =========================================================================
@@ -261,6 +556,103 @@ class SharedState:
                 - ambulance_coverage: Ambulance coverage object (if any)
         """
         self.policy_members[policy_member_id] = member_data
+        self.members_version += 1
+        member = member_data.get("member")
+        if member is not None and self._member_pm_ids_source is self.policy_members:
+            self._member_pm_ids.setdefault(member.member_id, policy_member_id)
+
+    def members_soa(self) -> MemberColumns:
+        """
+        Get policy members as cached column arrays.
+
+        Rebuilt only when members_version moves or, for direct writes that
+        bypass the mutators (claims add/remove, state reconstruction), when
+        the identity or size of policy_members/member_engagement_levels
+        changes.
+
+        Returns:
+            MemberColumns over the current policy members
+        """
+        key = (
+            self.members_version,
+            id(self.policy_members),
+            len(self.policy_members),
+            id(self.member_engagement_levels),
+            len(self.member_engagement_levels),
+        )
+        if self._members_soa is not None and key == self._members_soa_key:
+            return self._members_soa
+
+        levels: list[str] = []
+        level_index: dict[str, int] = {}
+        policy_ids = []
+        member_ids = []
+        engagement_idx = []
+
+        for member_data in self.policy_members.values():
+            policy = member_data.get("policy")
+            member = member_data.get("member")
+
+            if not policy or not member:
+                continue
+
+            level = self.get_engagement_level(member.member_id)
+            idx = level_index.get(level)
+            if idx is None:
+                idx = level_index[level] = len(levels)
+                levels.append(level)
+
+            policy_ids.append(policy.policy_id)
+            member_ids.append(member.member_id)
+            engagement_idx.append(idx)
+
+        self._members_soa = MemberColumns(
+            policy_ids=np.array(policy_ids, dtype=object),
+            member_ids=np.array(member_ids, dtype=object),
+            engagement_idx=np.array(engagement_idx, dtype=np.int8),
+            engagement_levels=tuple(levels),
+        )
+        self._members_soa_key = key
+        return self._members_soa
+
+    def live_policy_member_ids(self) -> tuple[UUID, ...]:
+        """
+        Get the ids of tracked policy members who are not deceased.
+
+        Cached like members_soa(), and additionally rebuilt when a member is
+        marked deceased, so daily member scans skip the dead without
+        checking each entry.
+
+        Returns:
+            Tuple of policy_member UUIDs in policy_members order
+        """
+        key = (
+            self.members_version,
+            id(self.policy_members),
+            len(self.policy_members),
+            len(self.deceased_policy_member_ids),
+        )
+        if self._live_member_ids is not None and key == self._live_member_ids_key:
+            return self._live_member_ids
+
+        deceased = self.deceased_policy_member_ids
+        self._live_member_ids = tuple(
+            pm_id for pm_id in self.policy_members if pm_id not in deceased
+        )
+        self._live_member_ids_key = key
+        return self._live_member_ids
+
+    def mark_policy_member_deceased(self, policy_member_id: UUID) -> None:
+        """
+        Exclude a deceased policy member from live_policy_member_ids().
+
+        The member stays in policy_members until PolicyLifecycleProcess
+        handles the death event and removes it.
+
+        Args:
+            policy_member_id: The policy_member UUID
+        """
+        self.deceased_policy_member_ids.add(policy_member_id)
 
     def add_waiting_periods(
         self,
@@ -304,8 +696,11 @@ class SharedState:
             if data.get("policy") and data["policy"].policy_id == policy_id
         ]
         for pm_id in members_to_remove:
-            self.policy_members.pop(pm_id, None)
+            self._unindex_member(pm_id, self.policy_members.pop(pm_id, None))
             self.waiting_periods.pop(pm_id, None)
+            self.deceased_policy_member_ids.discard(pm_id)
+        if members_to_remove:
+            self.members_version += 1
 
     def update_policy_status(self, policy_id: UUID, status: str) -> None:
         """
@@ -334,7 +729,7 @@ class SharedState:
             "members_with_preferences": len(self.communication_preferences),
             "members_with_engagement_level": len(self.member_engagement_levels),
             "pending_campaign_responses": len(self.pending_campaign_responses),
-            "nba_action_queue": len(self.nba_action_queue),
+            "nba_action_queue": self.count_pending_nba_recommendations(),
             "members_with_nba_execution_history": len(self.nba_execution_history),
             "policies_with_nba_effects": len(self.nba_active_effects),
             "fraud_prone_members": len(self.fraud_prone_members),
@@ -369,6 +764,19 @@ class SharedState:
             "change_data": change_data,
         })
 
+    def add_member_change_events(self, events: list[dict[str, Any]]) -> None:
+        """
+        Queue a batch of member change events.
+
+        Batch counterpart of add_member_change_event() for producers that
+        collect a day's events before publishing them.
+
+        Args:
+            events: Event dicts with member_id, policy_id, change_type and
+                change_data keys
+        """
+        self.member_change_events.extend(events)
+
     def get_member_change_events(self, change_type: str | None = None) -> list[dict[str, Any]]:
         """
         Get and clear pending member change events.
@@ -393,6 +801,38 @@ class SharedState:
             self.member_change_events = []
         return events
 
+    def has_member_change_events(self) -> bool:
+        """Check whether any member change events are queued."""
+        return bool(self.member_change_events)
+
+    def drain_member_change_events(
+        self,
+        change_types: tuple[str, ...],
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Get and clear pending member change events of several types at once.
+
+        Single-pass counterpart of get_member_change_events() for consumers
+        that handle more than one change type. Events of other types stay
+        queued in their original order.
+
+        Args:
+            change_types: Event types to drain
+
+        Returns:
+            Dictionary of change type to its events, in queue order
+        """
+        drained: dict[str, list[dict[str, Any]]] = {t: [] for t in change_types}
+        remaining = []
+        for event in self.member_change_events:
+            bucket = drained.get(event["change_type"])
+            if bucket is None:
+                remaining.append(event)
+            else:
+                bucket.append(event)
+        self.member_change_events = remaining
+        return drained
+
     def update_member_data(self, member_id: UUID, updates: dict[str, Any]) -> None:
         """
         Update member data in the policy_members cache.
@@ -428,14 +868,70 @@ class SharedState:
         Args:
             policy_member_id: The policy_member UUID to remove
         """
-        self.policy_members.pop(policy_member_id, None)
+        self._unindex_member(
+            policy_member_id, self.policy_members.pop(policy_member_id, None)
+        )
         self.waiting_periods.pop(policy_member_id, None)
+        self.deceased_policy_member_ids.discard(policy_member_id)
+        self.members_version += 1
+
+    def get_policy_member_id(self, member_id: UUID) -> UUID | None:
+        """
+        Find the tracked policy_member UUID for a member.
+
+        Returns the first matching entry in policy_members order, like a scan
+        of policy_members would, from an index instead of a linear search.
+
+        Args:
+            member_id: The member UUID
+
+        Returns:
+            The policy_member UUID, or None if the member is not tracked
+        """
+        if self._member_pm_ids_source is not self.policy_members:
+            self._rebuild_member_index()
+
+        pm_id = self._member_pm_ids.get(member_id)
+        if pm_id is not None and self._is_member_entry(pm_id, member_id):
+            return pm_id
+
+        # Stale after a direct write to policy_members: rebuild and retry once
+        if pm_id is not None or len(self._member_pm_ids) != len(self.policy_members):
+            self._rebuild_member_index()
+            pm_id = self._member_pm_ids.get(member_id)
+        return pm_id
+
+    def _is_member_entry(self, policy_member_id: UUID, member_id: UUID) -> bool:
+        """Check that a policy member is still tracked for the given member."""
+        data = self.policy_members.get(policy_member_id)
+        member = data.get("member") if data else None
+        return member is not None and member.member_id == member_id
+
+    def _rebuild_member_index(self) -> None:
+        """Rebuild the member_id -> policy_member_id index."""
+        index: dict[UUID, UUID] = {}
+        for pm_id, data in self.policy_members.items():
+            member = data.get("member")
+            if member is not None:
+                index.setdefault(member.member_id, pm_id)
+        self._member_pm_ids = index
+        self._member_pm_ids_source = self.policy_members
+
+    def _unindex_member(
+        self,
+        policy_member_id: UUID,
+        member_data: dict[str, Any] | None,
+    ) -> None:
+        """Drop a removed policy member from the member_id index."""
+        member = member_data.get("member") if member_data else None
+        if member is not None and self._member_pm_ids.get(member.member_id) == policy_member_id:
+            del self._member_pm_ids[member.member_id]
 
     # =========================================================================
     # CRM Event Queue Methods
     # =========================================================================
 
-    def add_crm_event(self, event: dict[str, Any]) -> None:
+    def add_crm_event(self, event: CRMQueueEvent) -> None:
         """
         Add a CRM trigger event to the queue.
 
@@ -443,7 +939,7 @@ class SharedState:
         that should trigger CRM actions (interactions, cases, surveys).
 
         Args:
-            event: Event dictionary containing:
+            event: Event dictionary (or CRMEvent) containing:
                 - event_type: str (TriggerEventType value)
                 - timestamp: datetime
                 - policy_id: UUID
@@ -452,7 +948,16 @@ class SharedState:
         """
         self.crm_event_queue.append(event)
 
-    def get_crm_events(self, max_events: int | None = None) -> list[dict[str, Any]]:
+    def add_crm_events(self, events: list[CRMQueueEvent]) -> None:
+        """
+        Add several CRM trigger events to the queue in one call.
+
+        Args:
+            events: Events (same structure as add_crm_event)
+        """
+        self.crm_event_queue.extend(events)
+
+    def get_crm_events(self, max_events: int | None = None) -> list[CRMQueueEvent]:
         """
         Get and remove CRM events from the queue (FIFO).
 
@@ -471,7 +976,7 @@ class SharedState:
             count += 1
         return events
 
-    def peek_crm_events(self) -> list[dict[str, Any]]:
+    def peek_crm_events(self) -> list[CRMQueueEvent]:
         """Peek at CRM events without removing them."""
         return list(self.crm_event_queue)
 
@@ -631,6 +1136,7 @@ class SharedState:
             level: "high", "medium", or "low"
         """
         self.member_engagement_levels[member_id] = level
+        self.members_version += 1
 
     def get_engagement_level(self, member_id: UUID) -> str:
         """
@@ -786,8 +1292,47 @@ class SharedState:
         Args:
             recommendation: NBAActionWithRecommendation object
         """
+        self._track_nba_pending(recommendation)
         self.nba_action_queue.append(recommendation)
 
+    def defer_nba_recommendation(self, recommendation: Any, release_date: date) -> None:
+        """
+        Hold an NBA recommendation out of the queue until ``release_date``.
+
+        The recommendation still counts as pending (and can expire) while
+        held, but is not dequeued again until release_deferred_nba_recommendations
+        reaches its date.
+
+        Args:
+            recommendation: NBAActionWithRecommendation object
+            release_date: First date the recommendation should be queued
+        """
+        self._track_nba_pending(recommendation)
+
+        bucket = self._nba_deferred.get(release_date)
+        if bucket is None:
+            bucket = self._nba_deferred[release_date] = []
+            heapq.heappush(self._nba_deferred_dates, release_date)
+        bucket.append(recommendation)
+
+    def release_deferred_nba_recommendations(self, current_date: date) -> int:
+        """
+        Move deferred NBA recommendations due by ``current_date`` into the queue.
+
+        Args:
+            current_date: The simulation date
+
+        Returns:
+            Number of recommendations released
+        """
+        dates = self._nba_deferred_dates
+        released = 0
+        while dates and dates[0] <= current_date:
+            bucket = self._nba_deferred.pop(heapq.heappop(dates))
+            self.nba_action_queue.extend(bucket)
+            released += len(bucket)
+        return released
+
     def add_nba_recommendations(self, recommendations: list[Any]) -> None:
         """
         Add multiple NBA recommendations to the action queue.
@@ -795,7 +1340,8 @@ class SharedState:
         Args:
             recommendations: List of NBAActionWithRecommendation objects
         """
-        self.nba_action_queue.extend(recommendations)
+        for recommendation in recommendations:
+            self.add_nba_recommendation(recommendation)
 
     def get_nba_recommendations(
         self, max_items: int | None = None
@@ -814,13 +1360,23 @@ class SharedState:
         items = []
         count = 0
         while self.nba_action_queue and (max_items is None or count < max_items):
-            items.append(self.nba_action_queue.popleft())
+            recommendation = self.nba_action_queue.popleft()
+            if self._nba_pending.pop(recommendation.recommendation_id, None) is None:
+                continue  # Expired while queued
+            items.append(recommendation)
             count += 1
         return items
 
     def peek_nba_recommendations(self) -> list[Any]:
         """Peek at NBA recommendations without removing them."""
-        return list(self.nba_action_queue)
+        return [
+            r for r in self.nba_action_queue
+            if r.recommendation_id in self._nba_pending
+        ]
+
+    def count_pending_nba_recommendations(self) -> int:
+        """Count pending NBA recommendations, queued or deferred, excluding expired ones."""
+        return len(self._nba_pending)
 
     def get_nba_recommendations_for_member(
         self, member_id: UUID, max_items: int | None = None
@@ -839,12 +1395,47 @@ class SharedState:
         """
         items = [
             r for r in self.nba_action_queue
-            if r.member_id == member_id
+            if r.member_id == member_id and r.recommendation_id in self._nba_pending
         ]
         if max_items:
             items = items[:max_items]
         return items
 
+    def _track_nba_pending(self, recommendation: Any) -> None:
+        """Mark a recommendation pending and schedule its expiry once."""
+        recommendation_id = recommendation.recommendation_id
+        self._nba_pending[recommendation_id] = recommendation
+        if recommendation_id not in self._nba_expiry_scheduled:
+            self._nba_expiry_scheduled.add(recommendation_id)
+            heapq.heappush(
+                self._nba_expiry_heap,
+                (recommendation.valid_until, recommendation_id),
+            )
+
+    def expire_nba_recommendations(self, current_date: date) -> list[Any]:
+        """
+        Remove queued NBA recommendations whose valid_until is before current_date.
+
+        Pops only the due entries off the expiry heap, so days with nothing
+        to expire cost O(1) regardless of queue length. Recommendations
+        consumed since they were scheduled are skipped.
+
+        Args:
+            current_date: The simulation date
+
+        Returns:
+            List of expired NBAActionWithRecommendation objects
+        """
+        heap = self._nba_expiry_heap
+        expired = []
+        while heap and heap[0][0] < current_date:
+            _, recommendation_id = heapq.heappop(heap)
+            self._nba_expiry_scheduled.discard(recommendation_id)
+            recommendation = self._nba_pending.pop(recommendation_id, None)
+            if recommendation is not None:
+                expired.append(recommendation)
+        return expired
+
     # =========================================================================
     # NBA Execution History Methods
     # =========================================================================
@@ -863,14 +1454,55 @@ class SharedState:
             member_id: The member UUID
             execution_data: Execution details including action_id, category, timestamp
         """
+        counts = self._contact_counts_for(member_id)
         if member_id not in self.nba_execution_history:
             self.nba_execution_history[member_id] = []
         self.nba_execution_history[member_id].append(execution_data)
+        counts.add(execution_data)
 
         # Keep only last 50 executions per member (for memory efficiency)
-        if len(self.nba_execution_history[member_id]) > 50:
-            self.nba_execution_history[member_id] = \
-                self.nba_execution_history[member_id][-50:]
+        if len(self.nba_execution_history[member_id]) > NBA_EXECUTION_HISTORY_LIMIT:
+            history = self.nba_execution_history[member_id]
+            for dropped in history[:-NBA_EXECUTION_HISTORY_LIMIT]:
+                counts.discard(dropped)
+            self.nba_execution_history[member_id] = history[-NBA_EXECUTION_HISTORY_LIMIT:]
+
+    def get_nba_contact_counts(
+        self,
+        member_id: UUID,
+        current_datetime: datetime,
+    ) -> NBAContactCounts:
+        """
+        Get a member's contact-policy counters as of ``current_datetime``.
+
+        The counts match what scanning get_recent_nba_executions(member_id,
+        days=365) would give: per-action attempts inside NBA_ATTEMPT_WINDOW
+        and per-channel executions today and this week (from Monday).
+
+        Args:
+            member_id: The member UUID
+            current_datetime: Reference datetime
+
+        Returns:
+            NBAContactCounts for the member (treat as read-only)
+        """
+        counts = self._contact_counts_for(member_id)
+        counts.roll_to(current_datetime.date())
+        counts.expire(current_datetime - NBA_ATTEMPT_WINDOW)
+        return counts
+
+    def _contact_counts_for(self, member_id: UUID) -> NBAContactCounts:
+        """Get or build the contact counters for a member."""
+        if self._nba_contact_counts_source is not self.nba_execution_history:
+            self._nba_contact_counts = {}
+            self._nba_contact_counts_source = self.nba_execution_history
+
+        counts = self._nba_contact_counts.get(member_id)
+        if counts is None:
+            counts = self._nba_contact_counts[member_id] = NBAContactCounts()
+            for exec_data in self.nba_execution_history.get(member_id, []):
+                counts.add(exec_data)
+        return counts
 
     def get_recent_nba_executions(
         self,
@@ -929,25 +1561,15 @@ class SharedState:
         if current_datetime is None:
             current_datetime = datetime.now()
 
-        # Check same-action cooldown
-        if action_id:
-            action_cutoff = current_datetime - timedelta(days=same_action_cooldown_days)
-            for exec_data in self.nba_execution_history.get(member_id, []):
-                if (
-                    exec_data.get("action_id") == action_id
-                    and exec_data.get("executed_at", datetime.min) > action_cutoff
-                ):
-                    return True, f"Same action cooldown ({same_action_cooldown_days} days)"
-
-        # Check same-category cooldown
-        if action_category:
-            category_cutoff = current_datetime - timedelta(days=same_category_cooldown_days)
-            for exec_data in self.nba_execution_history.get(member_id, []):
-                if (
-                    exec_data.get("action_category") == action_category
-                    and exec_data.get("executed_at", datetime.min) > category_cutoff
-                ):
-                    return True, f"Same category cooldown ({same_category_cooldown_days} days)"
+        reason = self._contact_counts_for(member_id).cooldown_reason(
+            action_id,
+            action_category,
+            same_action_cooldown_days,
+            same_category_cooldown_days,
+            current_datetime,
+        )
+        if reason is not None:
+            return True, reason
 
         return False, None
 
@@ -973,6 +1595,24 @@ class SharedState:
             self.nba_active_effects[policy_id] = []
         self.nba_active_effects[policy_id].append(effect_data)
 
+    def add_nba_effects(self, effects: list[tuple[UUID, dict[str, Any]]]) -> None:
+        """
+        Add a batch of active NBA behavioral effects.
+
+        Batch counterpart of add_nba_effect() for producers that collect a
+        day's effects before publishing them.
+
+        Args:
+            effects: List of (policy_id, effect_data) pairs
+        """
+        active_effects = self.nba_active_effects
+        for policy_id, effect_data in effects:
+            policy_effects = active_effects.get(policy_id)
+            if policy_effects is None:
+                active_effects[policy_id] = [effect_data]
+            else:
+                policy_effects.append(effect_data)
+
     def get_active_nba_effects(
         self,
         policy_id: UUID,
@@ -15,7 +15,7 @@ from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
 from brickwell_health.core.shared_state import SharedState
-from brickwell_health.domain.enums import Gender, MaritalStatus, PolicyType
+from brickwell_health.domain.enums import Gender, MaritalStatus, MemberRole, PolicyType
 from brickwell_health.domain.member import MemberCreate
 
 
@@ -220,6 +220,7 @@ def load_active_policies(
             "payment_frequency": row.payment_frequency,
             "state_of_residence": row.state_of_residence,
             "members": [],
+            "dependent_count": 0,
             "coverages": [],
         }
 
@@ -304,6 +305,10 @@ def load_active_policies(
                 marital_status=MaritalStatus(row.marital_status) if row.marital_status else MaritalStatus.SINGLE,
             )
             policies[policy_id]["members"].append(member)
+            if row.member_role == MemberRole.PRIMARY:
+                policies[policy_id]["primary_member_id"] = member.member_id
+            elif row.member_role == MemberRole.DEPENDENT:
+                policies[policy_id]["dependent_count"] += 1
 
     # Load coverages for these policies
     coverage_query = text("""
@@ -1265,6 +1270,7 @@ def load_single_policy(
         "excess": row.excess_amount,
         "payment_frequency": row.payment_frequency,
         "members": [],
+        "dependent_count": 0,
         "coverages": [],
     }
 
@@ -1343,6 +1349,10 @@ def load_single_policy(
             marital_status=MaritalStatus(member_row.marital_status) if member_row.marital_status else MaritalStatus.SINGLE,
         )
         policy_data["members"].append(member)
+        if member_row.member_role == MemberRole.PRIMARY:
+            policy_data["primary_member_id"] = member.member_id
+        elif member_row.member_role == MemberRole.DEPENDENT:
+            policy_data["dependent_count"] += 1
 
     # Load coverages for this policy
     coverage_query = text("""
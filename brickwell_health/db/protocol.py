@@ -4,6 +4,7 @@ Protocol definition for batch writer interface.
 Defines the contract that both BatchWriter and StreamingBatchWriter satisfy.
 """
 
+from collections.abc import Sequence
 from typing import Any, Protocol, runtime_checkable
 
 
@@ -24,7 +25,12 @@ class BatchWriterProtocol(Protocol):
         """Add multiple records to the batch buffer."""
         ...
 
-    def add_raw_sql(self, operation_type: str, sql: str) -> None:
+    def add_raw_sql(
+        self,
+        operation_type: str,
+        sql: str,
+        params: Sequence[Any] | None = None,
+    ) -> None:
         """Add a raw SQL statement to be executed during flush."""
         ...
 
@@ -38,6 +44,15 @@ class BatchWriterProtocol(Protocol):
         """Update a record in buffer or database."""
         ...
 
+    def update_many(
+        self,
+        table_name: str,
+        key_field: str,
+        rows: list[tuple[Any, dict[str, Any]]],
+    ) -> list[bool]:
+        """Update many records in buffer or database as a single group."""
+        ...
+
     def is_in_buffer(self, table_name: str, key_field: str, key_value: Any) -> bool:
         """Check if a record exists in the buffer."""
         ...
@@ -46,6 +61,12 @@ class BatchWriterProtocol(Protocol):
         """Flush all buffers if a specific record is still in buffer."""
         ...
 
+    def flush_for_cdc_many(
+        self, table_name: str, key_field: str, key_values: list[Any]
+    ) -> bool:
+        """Flush all buffers once if any of the given records is still in buffer."""
+        ...
+
     def flush_all(self) -> None:
         """Flush all table buffers."""
         ...
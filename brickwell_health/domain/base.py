@@ -0,0 +1,33 @@
+"""
+Shared helpers for Brickwell Health domain models.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+
+def dump_db_many(
+    adapter: TypeAdapter[Any],
+    models: Sequence[BaseModel],
+    enum_fields: tuple[str, ...],
+) -> list[dict[str, Any]]:
+    """
+    Serialize several models for database insertion in one pass.
+
+    Args:
+        adapter: TypeAdapter for a list of the models' class
+        models: Models to serialize
+        enum_fields: Columns holding enums, converted to their values
+
+    Returns:
+        One database-ready dict per model
+    """
+    rows: list[dict[str, Any]] = adapter.dump_python(models)
+    for row in rows:
+        for field in enum_fields:
+            val = row[field]
+            if val is not None and hasattr(val, "value"):
+                row[field] = val.value
+    return rows
@@ -9,8 +9,9 @@ from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
+from brickwell_health.domain.base import dump_db_many
 from brickwell_health.domain.enums import (
     CasePriority,
     CaseStatus,
@@ -23,6 +24,9 @@ from brickwell_health.domain.enums import (
     TriggerEventType,
 )
 
+# Enum columns converted to their values for database insertion
+_INTERACTION_ENUM_FIELDS = ("channel", "direction", "trigger_event_type")
+
 
 # ============================================================================
 # INTERACTION MODELS
@@ -101,6 +105,14 @@ class InteractionCreate(BaseModel):
             )
         return data
 
+    @classmethod
+    def model_dump_db_many(cls, interactions: list["InteractionCreate"]) -> list[dict]:
+        """Convert several interactions for database insertion in one pass."""
+        return dump_db_many(_INTERACTION_LIST, interactions, _INTERACTION_ENUM_FIELDS)
+
+
+_INTERACTION_LIST = TypeAdapter(list[InteractionCreate])
+
 
 class Interaction(InteractionCreate):
     """Full interaction model with audit fields."""
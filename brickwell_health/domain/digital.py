@@ -8,8 +8,9 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
+from brickwell_health.domain.base import dump_db_many
 from brickwell_health.domain.enums import (
     DeviceType,
     DigitalEventType,
@@ -18,6 +19,10 @@ from brickwell_health.domain.enums import (
     TriggerEventType,
 )
 
+# Enum columns converted to their values for database insertion
+_WEB_SESSION_ENUM_FIELDS = ("device_type", "session_type", "trigger_event_type")
+_DIGITAL_EVENT_ENUM_FIELDS = ("event_type", "page_category")
+
 
 # ============================================================================
 # WEB SESSION MODELS
@@ -75,12 +80,20 @@ class WebSessionCreate(BaseModel):
         """Convert to dictionary for database insertion."""
         data = self.model_dump()
         # Convert enums to their values
-        for field in ["device_type", "session_type", "trigger_event_type"]:
+        for field in _WEB_SESSION_ENUM_FIELDS:
             if data.get(field) is not None:
                 val = data[field]
                 data[field] = val.value if hasattr(val, "value") else val
         return data
 
+    @classmethod
+    def model_dump_db_many(cls, sessions: list["WebSessionCreate"]) -> list[dict]:
+        """Convert several sessions for database insertion in one pass."""
+        return dump_db_many(_WEB_SESSION_LIST, sessions, _WEB_SESSION_ENUM_FIELDS)
+
+
+_WEB_SESSION_LIST = TypeAdapter(list[WebSessionCreate])
+
 
 class WebSession(WebSessionCreate):
     """Full web session model."""
@@ -139,12 +152,20 @@ class DigitalEventCreate(BaseModel):
         """Convert to dictionary for database insertion."""
         data = self.model_dump()
         # Convert enums to their values
-        for field in ["event_type", "page_category"]:
+        for field in _DIGITAL_EVENT_ENUM_FIELDS:
             if data.get(field) is not None:
                 val = data[field]
                 data[field] = val.value if hasattr(val, "value") else val
         return data
 
+    @classmethod
+    def model_dump_db_many(cls, events: list["DigitalEventCreate"]) -> list[dict]:
+        """Convert several events for database insertion in one pass."""
+        return dump_db_many(_DIGITAL_EVENT_LIST, events, _DIGITAL_EVENT_ENUM_FIELDS)
+
+
+_DIGITAL_EVENT_LIST = TypeAdapter(list[DigitalEventCreate])
+
 
 class DigitalEvent(DigitalEventCreate):
     """Full digital event model."""
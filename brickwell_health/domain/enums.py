@@ -532,3 +532,18 @@ class TriggerEventType(str, Enum):
     INTERACTION_COMPLETED = "InteractionCompleted"
     CASE_RESOLVED = "CaseResolved"
     COMPLAINT_RESOLVED = "ComplaintResolved"
+
+
+# Lowercase CRM queue event names -> TriggerEventType. Producers resolve the
+# enum once at emission so consumers don't re-map strings per event.
+TRIGGER_EVENT_TYPE_BY_NAME: dict[str, TriggerEventType] = {
+    "claim_submitted": TriggerEventType.CLAIM_SUBMITTED,
+    "claim_rejected": TriggerEventType.CLAIM_REJECTED,
+    "claim_delayed": TriggerEventType.CLAIM_DELAYED,
+    "claim_paid": TriggerEventType.CLAIM_PAID,
+    "invoice_issued": TriggerEventType.INVOICE_ISSUED,
+    "payment_failed": TriggerEventType.PAYMENT_FAILED,
+    "arrears_created": TriggerEventType.ARREARS_CREATED,
+    "policy_suspended": TriggerEventType.POLICY_SUSPENDED,
+    "renewal_reminder": TriggerEventType.RENEWAL_REMINDER,
+}
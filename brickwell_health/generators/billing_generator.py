@@ -465,31 +465,36 @@ class BillingGenerator(BaseGenerator[InvoiceCreate]):
         direct_debit_id: UUID,
         cancellation_date: date,
         reason: str,
-    ) -> str:
+    ) -> tuple[str, list[Any]]:
         """
         Build the UPDATE statement that terminates a direct-debit mandate.
 
-        The SQL is intended to be queued via ``BatchWriter.add_raw_sql`` and
-        executed after COPY operations complete.
+        The statement is intended to be queued via ``BatchWriter.add_raw_sql``
+        (with its params) and executed after COPY operations complete.
 
         Args:
             direct_debit_id: Mandate to cancel
             cancellation_date: Effective cancellation date
-            reason: Free-text cancellation reason (single-quoted in SQL)
+            reason: Free-text cancellation reason (bound as a parameter)
 
         Returns:
-            SQL string with no trailing semicolon
+            Tuple of (SQL with %s placeholders and no trailing semicolon, params)
         """
-        safe_reason = reason.replace("'", "''")
-        return (
+        sql = (
             "UPDATE billing.direct_debit_mandate "
-            f"SET status = 'Cancelled', "
-            f"cancellation_date = '{cancellation_date.isoformat()}', "
-            f"cancellation_reason = '{safe_reason}', "
-            f"modified_at = '{self.get_current_datetime().isoformat()}', "
+            "SET status = 'Cancelled', "
+            "cancellation_date = %s, "
+            "cancellation_reason = %s, "
+            "modified_at = %s, "
             "modified_by = 'SIMULATION' "
-            f"WHERE direct_debit_id = '{direct_debit_id}'"
+            "WHERE direct_debit_id = %s"
         )
+        return sql, [
+            cancellation_date,
+            reason,
+            self.get_current_datetime(),
+            direct_debit_id,
+        ]
 
     def replace_mandate(
         self,
@@ -498,7 +503,7 @@ class BillingGenerator(BaseGenerator[InvoiceCreate]):
         replacement_date: date,
         old_mandate: DirectDebitMandateCreate,
         reason: str = "Mandate replaced (bank change)",
-    ) -> tuple[BankAccountCreate, DirectDebitMandateCreate, str]:
+    ) -> tuple[BankAccountCreate, DirectDebitMandateCreate, tuple[str, list[Any]]]:
         """
         Generate a replacement bank account + mandate and the cancel SQL for the old mandate.
 
@@ -515,7 +520,7 @@ class BillingGenerator(BaseGenerator[InvoiceCreate]):
             reason: Cancellation reason for the old mandate
 
         Returns:
-            Tuple of (new_bank_account, new_mandate, cancel_sql_for_old_mandate)
+            Tuple of (new_bank_account, new_mandate, (sql, params) cancelling the old mandate)
         """
         new_bank_account = self.generate_bank_account(member=member, policy=policy)
         new_mandate = self.generate_direct_debit_mandate(
@@ -523,9 +528,9 @@ class BillingGenerator(BaseGenerator[InvoiceCreate]):
             bank_account=new_bank_account,
             authorization_date=replacement_date,
         )
-        cancel_sql = self.cancel_mandate_sql(
+        cancel_stmt = self.cancel_mandate_sql(
             direct_debit_id=old_mandate.direct_debit_id,
             cancellation_date=replacement_date,
             reason=reason,
         )
-        return new_bank_account, new_mandate, cancel_sql
+        return new_bank_account, new_mandate, cancel_stmt
@@ -389,7 +389,7 @@ class MemberGenerator(BaseGenerator[MemberCreate]):
         self,
         current_last_name: str,
         partner_last_name: str | None = None,
-    ) -> str:
+    ) -> str | None:
         """
         Generate a new last name for marriage.
 
@@ -403,28 +403,30 @@ class MemberGenerator(BaseGenerator[MemberCreate]):
             partner_last_name: Partner's last name (if available)
 
         Returns:
-            New last name
+            New last name, or None if the member keeps their current name
         """
+        roll = self.rng.random()
+        if roll >= 0.8:
+            # Keep original
+            return None
+
         if partner_last_name is None:
             # Generate a random name if partner name not provided
             partner_last_name = self.faker.last_name()
 
-        roll = self.rng.random()
         if roll < 0.6:
             # Take partner's name
+            if partner_last_name == current_last_name:
+                return None
             return partner_last_name
-        elif roll < 0.8:
-            # Hyphenate
-            return f"{current_last_name}-{partner_last_name}"
-        else:
-            # Keep original
-            return current_last_name
+        # Hyphenate
+        return f"{current_last_name}-{partner_last_name}"
 
     def generate_divorce_name(
         self,
         current_last_name: str,
         maiden_name: str | None = None,
-    ) -> str:
+    ) -> str | None:
         """
         Generate a name change for divorce.
 
@@ -433,13 +435,14 @@ class MemberGenerator(BaseGenerator[MemberCreate]):
             maiden_name: Original name before marriage (if known)
 
         Returns:
-            New last name (may revert to maiden name or keep current)
+            Maiden name to revert to, or None if the member keeps their
+            current name
         """
-        if maiden_name and self.bernoulli(0.6):
+        if maiden_name and maiden_name != current_last_name and self.bernoulli(0.6):
             # 60% revert to maiden name
             return maiden_name
         # 40% keep married name
-        return current_last_name
+        return None
 
     def generate_medicare_renewal(self, current_expiry: date) -> date:
         """
@@ -403,6 +403,29 @@ class ChurnPredictionModel:
 
         return final_prob
 
+    def max_daily_churn_probability(self) -> float:
+        """
+        Upper bound on predict_daily_churn_probability() for any policy.
+
+        Takes the highest age bracket rate, every churn-raising log-odds
+        adjustment and every churn-raising multiplier. Callers sampling
+        many policies can skip the full prediction for draws at or above
+        this bound, since no policy can churn on them.
+
+        Returns:
+            Daily churn probability bound (0-1)
+        """
+        base_rate = min(max(max(self.CHURN_BY_AGE_BRACKET.values()), 0.08), 0.999)
+        log_odds = _probability_to_log_odds(base_rate) + sum(
+            v for v in self.LOG_ODDS_ADJUSTMENTS.values() if v > 0
+        )
+        annual_prob = _log_odds_to_probability(log_odds)
+        for multiplier in self.RETENTION_MULTIPLIERS.values():
+            if multiplier > 1:
+                annual_prob *= multiplier
+        annual_prob = min(1.0, annual_prob)
+        return float(1 - (1 - annual_prob) ** (1 / 365))
+
     def predict_daily_churn_probability(
         self,
         member_age: int,
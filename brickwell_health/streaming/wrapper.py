@@ -5,6 +5,7 @@ StreamingBatchWriter: wrapper that delegates to BatchWriter and publishes events
 import queue
 import threading
 from collections import defaultdict
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any, Callable
 
@@ -130,8 +131,13 @@ class StreamingBatchWriter:
         elif resolved is not None and self._closed:
             self._stats["events_dropped_after_close"] += len(records)
 
-    def add_raw_sql(self, operation_type: str, sql: str) -> None:
-        self._inner.add_raw_sql(operation_type, sql)
+    def add_raw_sql(
+        self,
+        operation_type: str,
+        sql: str,
+        params: Sequence[Any] | None = None,
+    ) -> None:
+        self._inner.add_raw_sql(operation_type, sql, params)
 
     def update_record(
         self,
@@ -157,12 +163,44 @@ class StreamingBatchWriter:
             self._stats["events_dropped_after_close"] += 1
         return result
 
+    def update_many(
+        self,
+        table_name: str,
+        key_field: str,
+        rows: list[tuple[Any, dict[str, Any]]],
+    ) -> list[bool]:
+        results = self._inner.update_many(table_name, key_field, rows)
+        resolved = self._resolve_streaming_name(table_name)
+        if resolved is not None and not self._closed:
+            ts = self._get_sim_datetime()
+            for (key_value, updates), updated in zip(rows, results):
+                if not updated:
+                    continue
+                event = create_event(
+                    event_type="update",
+                    table=resolved,
+                    timestamp=ts,
+                    worker_id=self._worker_id,
+                    data=updates,
+                    key={key_field: key_value},
+                )
+                self._queue.put(event)
+                self._stats["events_queued"] += 1
+        elif resolved is not None and self._closed:
+            self._stats["events_dropped_after_close"] += sum(1 for r in results if r)
+        return results
+
     def is_in_buffer(self, table_name: str, key_field: str, key_value: Any) -> bool:
         return self._inner.is_in_buffer(table_name, key_field, key_value)
 
     def flush_for_cdc(self, table_name: str, key_field: str, key_value: Any) -> bool:
         return self._inner.flush_for_cdc(table_name, key_field, key_value)
 
+    def flush_for_cdc_many(
+        self, table_name: str, key_field: str, key_values: list[Any]
+    ) -> bool:
+        return self._inner.flush_for_cdc_many(table_name, key_field, key_values)
+
     def flush_all(self) -> None:
         self._inner.flush_all()
 
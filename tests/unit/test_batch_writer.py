@@ -0,0 +1,176 @@
+"""
+Unit tests for BatchWriter COPY flushes.
+
+Tests run the writer against a fake DB-API connection to verify that
+binary COPY tables take their column types from the catalog, that other
+tables fall back to text COPY, and that both paths share the flush
+bookkeeping.
+"""
+
+import json
+from datetime import date, datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from psycopg.types.json import Jsonb
+
+from brickwell_health.db.writer import BatchWriter
+
+
+class FakeCopy:
+    """Records what a COPY block was given."""
+
+    def __init__(self, sql):
+        self.sql = sql
+        self.types = None
+        self.rows = []
+        self.data = b""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set_types(self, types):
+        self.types = types
+
+    def write_row(self, row):
+        self.rows.append(row)
+
+    def write(self, data):
+        self.data += data
+
+
+class FakeCursor:
+    """Answers catalog queries from a column type map and records COPYs."""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.queries = []
+        self.copies = []
+        self._result = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.queries.append((sql, params))
+        schema, table = params
+        self._result = list(self.catalog.get(f"{schema}.{table}", {}).items())
+
+    def fetchall(self):
+        return self._result
+
+    def copy(self, sql):
+        copy = FakeCopy(sql)
+        self.copies.append(copy)
+        return copy
+
+
+MEMBER_UPDATE_CATALOG = {
+    "member_lifecycle.member_update": {
+        "member_update_id": "uuid",
+        "member_id": "uuid",
+        "change_type": "varchar",
+        "change_date": "date",
+        "previous_values": "jsonb",
+        "new_values": "jsonb",
+        "reason": "varchar",
+        "triggered_by": "varchar",
+        "created_at": "timestamp",
+        "created_by": "varchar",
+    },
+}
+
+
+@pytest.fixture
+def cursor():
+    """Create a fake cursor over the member_update catalog."""
+    return FakeCursor(MEMBER_UPDATE_CATALOG)
+
+
+@pytest.fixture
+def writer(cursor):
+    """Create a BatchWriter whose engine hands out the fake cursor."""
+    engine = MagicMock()
+    raw_conn = engine.connect.return_value.__enter__.return_value.connection.dbapi_connection
+    raw_conn.cursor.return_value = cursor
+    return BatchWriter(engine, batch_size=100)
+
+
+def _member_update(reason="Member relocation"):
+    """Build a member_update record as MemberLifecycleProcess writes it."""
+    return {
+        "member_update_id": uuid4(),
+        "member_id": uuid4(),
+        "change_type": "AddressChange",
+        "change_date": date(2024, 3, 1),
+        "previous_values": json.dumps({"state": "NSW"}),
+        "new_values": json.dumps({"state": "VIC"}),
+        "reason": reason,
+        "triggered_by": "SIMULATION",
+        "created_at": datetime(2024, 3, 1, 9, 30),
+        "created_by": "SIMULATION",
+    }
+
+
+class TestBinaryCopy:
+    """Tests for the binary COPY path."""
+
+    def test_types_read_from_catalog_once(self, writer, cursor):
+        """Column types follow the record's column order and are looked up once."""
+        records = [_member_update(), _member_update(reason=None)]
+        writer.add_many("member_lifecycle.member_update", records)
+        writer.flush_all()
+        writer.add("member_lifecycle.member_update", _member_update())
+        writer.flush_all()
+
+        assert len(cursor.queries) == 1
+        assert cursor.queries[0][1] == ("member_lifecycle", "member_update")
+
+        first, second = cursor.copies
+        assert "FORMAT binary" in first.sql
+        assert first.types == list(
+            MEMBER_UPDATE_CATALOG["member_lifecycle.member_update"].values()
+        )
+        assert second.types == first.types
+        assert [row[0] for row in first.rows] == [r["member_update_id"] for r in records]
+        assert first.rows[1][6] is None
+        assert isinstance(first.rows[0][4], Jsonb)
+        assert first.rows[0][4].obj == records[0]["previous_values"]
+
+        assert writer._counts["member_lifecycle.member_update"] == 3
+        assert writer._buffers["member_lifecycle.member_update"] == []
+
+    def test_unknown_column_rejected(self, writer):
+        """A record column missing from the table fails before any COPY."""
+        record = {**_member_update(), "not_a_column": 1}
+        writer.add("member_lifecycle.member_update", record)
+
+        with pytest.raises(ValueError, match="not_a_column"):
+            writer.flush_all()
+
+
+class TestTextCopyFallback:
+    """Tests for tables without binary COPY."""
+
+    def test_text_copy_used_without_catalog_lookup(self, writer, cursor):
+        """Other tables are written as tab-separated text with the same bookkeeping."""
+        interaction_id = uuid4()
+        writer.add("crm.interaction", {"interaction_id": interaction_id, "notes": None})
+        writer.flush_all()
+
+        assert cursor.queries == []
+        (copy,) = cursor.copies
+        assert copy.sql.startswith("COPY crm.interaction (interaction_id, notes) FROM STDIN")
+        assert "FORMAT text" in copy.sql
+        assert copy.types is None
+        assert copy.data == f"{interaction_id}\t\\N\n".encode()
+
+        assert writer._counts["crm.interaction"] == 1
+        assert writer._buffers["crm.interaction"] == []
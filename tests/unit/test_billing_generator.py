@@ -93,3 +93,40 @@ class TestPaymentLifecycle:
         assert payment.payment_status == PaymentStatus.PENDING, (
             f"Expected PENDING, got {payment.payment_status}"
         )
+
+
+class TestMandateReplacement:
+    """Tests for in-life direct-debit mandate replacement."""
+
+    def test_cancel_statement_is_parameterized(
+        self,
+        billing_generator: BillingGenerator,
+        sample_policy,
+        sample_member_data,
+    ):
+        """The old mandate is cancelled by a %s-parameterized UPDATE, not inlined values."""
+        from brickwell_health.domain.member import MemberCreate
+
+        member = MemberCreate(**sample_member_data)
+        old_mandate = billing_generator.generate_direct_debit_mandate(
+            policy=sample_policy,
+            bank_account=billing_generator.generate_bank_account(
+                member=member, policy=sample_policy
+            ),
+            authorization_date=date(2024, 1, 1),
+        )
+        replacement_date = date(2024, 6, 1)
+
+        _, new_mandate, (sql, params) = billing_generator.replace_mandate(
+            policy=sample_policy,
+            member=member,
+            replacement_date=replacement_date,
+            old_mandate=old_mandate,
+        )
+
+        assert new_mandate.direct_debit_id != old_mandate.direct_debit_id
+        assert sql.count("%s") == len(params)
+        assert str(old_mandate.direct_debit_id) not in sql
+        assert replacement_date.isoformat() not in sql
+        assert params[0] == replacement_date
+        assert params[-1] == old_mandate.direct_debit_id
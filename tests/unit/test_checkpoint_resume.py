@@ -49,7 +49,8 @@ from brickwell_health.core.checkpoint_v2 import (
     get_checkpoint_dates,
     restore_shared_state_from_checkpoint,
 )
-from brickwell_health.core.shared_state import SharedState
+from brickwell_health.core.shared_state import CRMEvent, SharedState
+from brickwell_health.domain.enums import TriggerEventType
 
 
 class TestCheckpointEncoder:
@@ -382,6 +383,26 @@ class TestEventQueueSerializer:
         assert len(result) == 2
         assert result[0]["event_type"] == "claim_paid"
 
+    def test_serialize_event_queue_with_crm_event(self):
+        """Test slotted CRMEvents serialize to dicts without unset fields."""
+        case_id = uuid4()
+        queue = deque([
+            CRMEvent(
+                event_type="case_resolved",
+                policy_id=uuid4(),
+                member_id=uuid4(),
+                timestamp=datetime(2024, 1, 15, 10, 0),
+                case_id=case_id,
+                sla_breached=False,
+            ),
+        ])
+
+        result = serialize_event_queue(queue)
+        assert result[0]["event_type"] == "case_resolved"
+        assert result[0]["case_id"] == str(case_id)
+        assert result[0]["sla_breached"] is False
+        assert "complaint_id" not in result[0]
+
     def test_deserialize_event_queue(self):
         """Test deserializing event queue."""
         events = [
@@ -421,12 +442,35 @@ class TestDigitalTriggersSerializer:
 
     def test_roundtrip_processed_triggers(self):
         """Test round-trip serialization of processed triggers."""
-        original = {"trigger-1", "trigger-2", "trigger-3"}
+        claim_id = uuid4()
+        original = {
+            (TriggerEventType.CLAIM_PAID, claim_id),
+            (TriggerEventType.PAYMENT_FAILED, None),
+        }
 
         serialized = serialize_digital_processed_triggers(original)
-        deserialized = deserialize_digital_processed_triggers(serialized)
+        deserialized = deserialize_digital_processed_triggers(
+            json.loads(json.dumps(serialized))
+        )
+
+        # Event ids come back as strings, like restored CRM queue events
+        assert deserialized == {
+            (TriggerEventType.CLAIM_PAID, str(claim_id)),
+            (TriggerEventType.PAYMENT_FAILED, None),
+        }
+
+    def test_deserialize_legacy_string_keys(self):
+        """Test legacy "event_type:event_id" keys are converted to tuples."""
+        claim_id = uuid4()
+
+        deserialized = deserialize_digital_processed_triggers(
+            [f"claim_rejected:{claim_id}", "payment_failed:None"]
+        )
 
-        assert deserialized == original
+        assert deserialized == {
+            (TriggerEventType.CLAIM_REJECTED, str(claim_id)),
+            (TriggerEventType.PAYMENT_FAILED, None),
+        }
 
 
 class TestCheckpointManagerV2:
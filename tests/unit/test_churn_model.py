@@ -410,6 +410,20 @@ class TestPredictChurnProbability:
         assert daily_prob < annual_prob / 300
         assert daily_prob > annual_prob / 400
 
+    def test_daily_probability_bound_covers_worst_case(self, test_rng: np.random.Generator):
+        """max_daily_churn_probability() bounds the riskiest policy in Q2."""
+        model = ChurnPredictionModel(test_rng)
+        model._has_life_event = lambda: True
+
+        daily_prob = model.predict_daily_churn_probability(
+            20,
+            {"tenure_years": 0, "annual_premium": 2400},
+            {"days_since_last_claim": None, "denial_count": 3},
+            date(2024, 5, 1),
+        )
+
+        assert daily_prob == pytest.approx(model.max_daily_churn_probability())
+
 
 class TestCancellationReasonSampling:
     """Tests for cancellation reason sampling."""
@@ -447,6 +447,22 @@ class TestGetClaimsHistoryPruning:
 
         assert len(policy["denial_log"]) == 1
 
+    def test_logs_within_window_left_in_place(self, mock_lifecycle_process, sim_env):
+        """Logs with nothing to prune keep their list; missing logs stay missing."""
+        sim_env.env.run(until=400)
+        current = sim_env.current_date
+        paid_log = [(current - timedelta(days=30), 200.0, 20.0)]
+        denial_log = [current - timedelta(days=10)]
+        policy = {"paid_claim_log": paid_log, "denial_log": denial_log}
+
+        mock_lifecycle_process._get_claims_history(policy)
+        empty_policy = {}
+        mock_lifecycle_process._get_claims_history(empty_policy)
+
+        assert policy["paid_claim_log"] is paid_log
+        assert policy["denial_log"] is denial_log
+        assert empty_policy == {}
+
 
 class TestGetClaimsHistoryDefaults:
     """Tests for default values when policy dict has no claims fields."""
@@ -185,6 +185,28 @@ class TestInteractionCreate:
         assert data["direction"] == "Outbound"
         assert data["trigger_event_type"] == "ClaimRejected"
 
+    def test_interaction_model_dump_db_many_matches_single(self):
+        """Test batch conversion yields the same rows as model_dump_db."""
+        interactions = [
+            InteractionCreate(
+                interaction_id=uuid4(),
+                interaction_reference=f"INT-W0-2024-00000{i}",
+                policy_id=uuid4(),
+                member_id=uuid4(),
+                interaction_type_id=1,
+                channel=InteractionChannel.PHONE,
+                direction=InteractionDirection.INBOUND,
+                start_datetime=datetime.now(),
+                trigger_event_type=trigger,
+            )
+            for i, trigger in enumerate([None, TriggerEventType.CLAIM_PAID])
+        ]
+
+        rows = InteractionCreate.model_dump_db_many(interactions)
+
+        assert rows == [interaction.model_dump_db() for interaction in interactions]
+        assert rows[1]["trigger_event_type"] == "ClaimPaid"
+
 
 class TestCaseCreate:
     """Tests for CaseCreate domain model."""
@@ -0,0 +1,91 @@
+"""
+Unit tests for CRMProcess case lifecycle.
+
+Tests verify that cases due on a day are resolved as one grouped
+flush/update, and that the lifecycle scan is skipped until the earliest
+pending resolution date.
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from brickwell_health.core.processes.crm import CRMProcess
+from brickwell_health.core.shared_state import SharedState
+from brickwell_health.domain.enums import CaseStatus
+
+
+@pytest.fixture
+def crm_process(test_config, sim_env, id_generator):
+    """Create a CRM process with a mock writer over a fresh SharedState."""
+    return CRMProcess(
+        sim_env=sim_env,
+        config=test_config,
+        batch_writer=MagicMock(),
+        id_generator=id_generator,
+        reference=MagicMock(),
+        worker_id=0,
+        shared_state=SharedState(),
+    )
+
+
+def _add_pending_case(crm_process, resolution_date):
+    """Track a pending case due on resolution_date and return its case_id."""
+    case_id = uuid4()
+    crm_process.pending_cases[case_id] = {
+        "case": SimpleNamespace(case_id=case_id, policy_id=uuid4(), member_id=uuid4()),
+        "resolution_date": resolution_date,
+        "sla_breached": False,
+    }
+    crm_process._next_case_due = None
+    return case_id
+
+
+class TestCaseLifecycle:
+    """Tests for CRMProcess._process_case_lifecycle()."""
+
+    def test_due_cases_resolved_as_single_group(self, crm_process, sim_env):
+        """All cases due on a day are resolved with one grouped flush and update."""
+        today = sim_env.current_date
+        case_ids = [_add_pending_case(crm_process, today) for _ in range(3)]
+        writer = crm_process.batch_writer
+
+        crm_process._process_case_lifecycle(today)
+
+        assert crm_process.pending_cases == {}
+        assert crm_process._stats["cases_resolved"] == 3
+        writer.flush_for_cdc_many.assert_called_once_with(
+            "service_case", "case_id", case_ids
+        )
+        writer.update_many.assert_called_once()
+        table, key_field, rows = writer.update_many.call_args[0]
+        assert (table, key_field) == ("service_case", "case_id")
+        assert [case_id for case_id, _ in rows] == case_ids
+        assert all(u["status"] == CaseStatus.RESOLVED.value for _, u in rows)
+
+        events = crm_process.shared_state.get_crm_events()
+        assert [e.get("event_type") for e in events] == ["case_resolved"] * 3
+
+    def test_case_lifecycle_skips_scan_until_next_due(self, crm_process, sim_env):
+        """No case is resolved, or rescanned, before the earliest resolution date."""
+        today = sim_env.current_date
+        due_date = today + timedelta(days=5)
+        _add_pending_case(crm_process, due_date)
+
+        crm_process._process_case_lifecycle(today)
+        assert crm_process._next_case_due == due_date
+        assert len(crm_process.pending_cases) == 1
+
+        # Moving the date earlier behind the cursor is not seen: the scan is skipped
+        (data,) = crm_process.pending_cases.values()
+        data["resolution_date"] = today
+        crm_process._process_case_lifecycle(today + timedelta(days=1))
+        assert len(crm_process.pending_cases) == 1
+        crm_process.batch_writer.update_many.assert_not_called()
+
+        crm_process._process_case_lifecycle(due_date)
+        assert crm_process.pending_cases == {}
+        crm_process.batch_writer.update_many.assert_called_once()
@@ -112,6 +112,31 @@ class TestDigitalEventCreate:
         assert data["page_category"] == "Claims"
         assert data["page_path"] == "/claims/submit"
 
+    def test_event_model_dump_db_many_matches_single(self):
+        """Test batch conversion yields the same rows as model_dump_db."""
+        events = [
+            DigitalEventCreate(
+                event_id=uuid4(),
+                session_id=uuid4(),
+                member_id=uuid4(),
+                event_timestamp=datetime.now(),
+                event_type=DigitalEventType.PAGE_VIEW,
+                page_category=PageCategory.CLAIMS,
+            ),
+            DigitalEventCreate(
+                event_id=uuid4(),
+                session_id=uuid4(),
+                member_id=uuid4(),
+                event_timestamp=datetime.now(),
+                event_type=DigitalEventType.CLICK,
+            ),
+        ]
+
+        rows = DigitalEventCreate.model_dump_db_many(events)
+
+        assert rows == [event.model_dump_db() for event in events]
+        assert rows[1]["page_category"] is None
+
     def test_click_event(self):
         """Test click event with element details."""
         event = DigitalEventCreate(
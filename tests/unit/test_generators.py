@@ -160,3 +160,18 @@ class TestMemberGenerator:
 
         # Family should have at least 3 members (primary, partner, child)
         assert len(members) >= 3
+
+    def test_generate_married_name_returns_none_when_unchanged(
+        self,
+        test_rng: np.random.Generator,
+        test_reference,
+        id_generator: IDGenerator,
+        sim_env: SimulationEnvironment,
+    ):
+        """Keeping the current surname should be reported as no change."""
+        gen = MemberGenerator(test_rng, test_reference, id_generator, sim_env=sim_env)
+        names = [gen.generate_married_name("Smith", "Jones") for _ in range(200)]
+
+        assert None in names
+        assert "Smith" not in names
+        assert set(names) == {None, "Jones", "Smith-Jones"}
@@ -0,0 +1,372 @@
+"""
+Unit tests for MemberLifecycleProcess daily events and database writes.
+
+Tests verify that daily event selection picks each member at most once
+with the expected trial counts and per-member death rates, that member
+column updates are coalesced per day into batched, parameterized UPDATE
+statements, that the day's change events reach SharedState as one batch
+equal to per-event publishing, that member_update audit rows match the
+MemberUpdate model's database form, and that deceased members drop out of
+the live member index.
+"""
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from brickwell_health.core.processes.member_lifecycle import MemberLifecycleProcess
+from brickwell_health.core.shared_state import SharedState
+from brickwell_health.domain.enums import Gender, MemberChangeType
+from brickwell_health.domain.member import MemberUpdate
+
+
+@pytest.fixture
+def lifecycle_process(sim_env):
+    """Create a minimal member lifecycle process with a mock batch writer."""
+    with patch.object(MemberLifecycleProcess, "__init__", lambda self, *args, **kwargs: None):
+        process = MemberLifecycleProcess()
+        process.sim_env = sim_env
+        process.batch_writer = MagicMock()
+        process._pending_member_updates = {}
+        return process
+
+
+@pytest.fixture
+def member_process(test_config, sim_env, id_generator):
+    """Create a member lifecycle process over a fresh SharedState."""
+    return MemberLifecycleProcess(
+        sim_env=sim_env,
+        config=test_config,
+        batch_writer=MagicMock(),
+        id_generator=id_generator,
+        reference=MagicMock(),
+        shared_state=SharedState(),
+    )
+
+
+def _add_members(process, n, age=50, medicare_expiry_date=None):
+    """Track n members on the process's SharedState and return the live ids."""
+    for _ in range(n):
+        member = SimpleNamespace(member_id=uuid4(), medicare_expiry_date=medicare_expiry_date)
+        process.shared_state.add_policy_member(uuid4(), {"member": member, "age": age})
+    return process.shared_state.live_policy_member_ids()
+
+
+class TestBatchedMemberUpdates:
+    """Tests for end-of-day batched member UPDATE statements."""
+
+    def test_updates_grouped_by_column_set(self, lifecycle_process):
+        """One parameterized statement is written per distinct column set."""
+        first, second = uuid4(), uuid4()
+        today = date(2024, 3, 1)
+
+        lifecycle_process._update_member_in_db(first, {"email": "o'neil@example.com"}, today)
+        lifecycle_process._update_member_in_db(second, {"email": "b@example.com"}, today)
+        lifecycle_process._update_member_in_db(
+            second, {"medicare_expiry_date": date(2029, 3, 1)}, today
+        )
+        lifecycle_process._flush_member_updates()
+
+        calls = lifecycle_process.batch_writer.add_raw_sql.call_args_list
+        assert len(calls) == 2
+
+        operation_type, sql, params = calls[0].args
+        assert operation_type == "member_update"
+        assert "FROM (VALUES (%s, %s), (%s, %s))" in sql
+        assert "o'neil" not in sql
+        assert params == [
+            lifecycle_process.sim_env.current_datetime,
+            first, "o'neil@example.com",
+            second, "b@example.com",
+        ]
+
+        _, sql, params = calls[1].args
+        assert "medicare_expiry_date = v.medicare_expiry_date::date" in sql
+        assert params[1:] == [second, date(2029, 3, 1)]
+
+        assert lifecycle_process._pending_member_updates == {}
+
+    def test_repeat_update_same_day_keeps_last_value(self, lifecycle_process):
+        """A second update to the same member and columns replaces the first."""
+        member_id = uuid4()
+        today = date(2024, 3, 1)
+
+        lifecycle_process._update_member_in_db(member_id, {"marital_status": "Married"}, today)
+        lifecycle_process._update_member_in_db(member_id, {"marital_status": "Separated"}, today)
+        lifecycle_process._flush_member_updates()
+
+        (call,) = lifecycle_process.batch_writer.add_raw_sql.call_args_list
+        assert call.args[2][1:] == [member_id, "Separated"]
+
+    def test_large_mixed_batch_chunked_with_nulls(self, lifecycle_process):
+        """Groups over the row limit are chunked; NULLs stay bound parameters."""
+        today = date(2024, 3, 1)
+        address = {
+            "address_line_1": "2 Collins St",
+            "address_line_2": None,
+            "suburb": "Melbourne",
+            "state": "VIC",
+            "postcode": "3000",
+        }
+        movers = [uuid4() for _ in range(1500)]
+        for member_id in movers:
+            lifecycle_process._update_member_in_db(member_id, address, today)
+        deceased = uuid4()
+        lifecycle_process._update_member_in_db(
+            deceased, {"deceased_flag": True, "deceased_date": today}, today
+        )
+        lifecycle_process._flush_member_updates()
+
+        calls = lifecycle_process.batch_writer.add_raw_sql.call_args_list
+        assert [len(call.args[2]) for call in calls] == [
+            1 + 1000 * 6, 1 + 500 * 6, 1 + 1 * 3,
+        ]
+        modified_at = lifecycle_process.sim_env.current_datetime
+
+        for call, chunk in zip(calls[:2], (movers[:1000], movers[1000:])):
+            operation_type, sql, params = call.args
+            assert operation_type == "member_update"
+            assert sql.count("(%s, %s, %s, %s, %s, %s)") == len(chunk)
+            assert sql.count("%s") == len(params)
+            assert (
+                "AS v(member_id, address_line_1, address_line_2, suburb, state, postcode)"
+                in sql
+            )
+            assert "address_line_2 = v.address_line_2::text" in sql
+            assert "None" not in sql and "NULL" not in sql
+            assert params[0] == modified_at
+            rows = [params[i:i + 6] for i in range(1, len(params), 6)]
+            assert [row[0] for row in rows] == chunk
+            assert all(row[1:] == list(address.values()) for row in rows)
+
+        _, sql, params = calls[2].args
+        assert "deceased_flag = v.deceased_flag::boolean" in sql
+        assert "deceased_date = v.deceased_date::date" in sql
+        assert params == [modified_at, deceased, True, today]
+
+
+class TestMemberUpdateRecords:
+    """Tests for member_update audit rows written by _create_member_update()."""
+
+    def test_row_matches_model_dump_db(self, member_process):
+        """The directly built row equals MemberUpdate.model_dump_db(), column for column."""
+        member_id = uuid4()
+        previous_values = {"state": "NSW", "postcode": "2000"}
+        new_values = {"state": "VIC", "postcode": "3000"}
+
+        member_process._create_member_update(
+            member_id=member_id,
+            change_type=MemberChangeType.ADDRESS_CHANGE,
+            change_date=date(2024, 3, 1),
+            previous_values=previous_values,
+            new_values=new_values,
+            reason="Member relocation",
+        )
+
+        table, row = member_process.batch_writer.add.call_args.args
+        expected = MemberUpdate(
+            member_update_id=row["member_update_id"],
+            member_id=member_id,
+            change_type=MemberChangeType.ADDRESS_CHANGE,
+            change_date=date(2024, 3, 1),
+            previous_values=previous_values,
+            new_values=new_values,
+            reason="Member relocation",
+            triggered_by="SIMULATION",
+            created_at=member_process.sim_env.current_datetime,
+        ).model_dump_db()
+        assert table == "member_lifecycle.member_update"
+        assert list(row.items()) == list(expected.items())
+
+
+class TestDailyEventSelection:
+    """Tests for MemberLifecycleProcess._select_daily_events() and _draw_hits()."""
+
+    def test_draw_hits_rate_zero_and_one(self, member_process):
+        """Rate 0 never fires; rate 1 fires for every member exactly once."""
+        assert len(member_process._draw_hits(500, 0.0)) == 0
+        assert len(member_process._draw_hits(0, 1.0)) == 0
+        assert sorted(member_process._draw_hits(500, 1.0)) == list(range(500))
+
+    def test_draw_hits_distinct_and_in_expected_range(self, member_process):
+        """Hits are distinct in-range indices with a Binomial(n, p) count."""
+        n, rate = 10_000, 0.1
+        for _ in range(20):
+            idx = member_process._draw_hits(n, rate)
+            assert len(np.unique(idx)) == len(idx)
+            assert idx.min() >= 0 and idx.max() < n
+            # mean 1000, sd 30
+            assert 850 <= len(idx) <= 1150
+
+    def test_no_events_at_zero_rates(self, member_process):
+        """No member is selected when every trial rate is zero and nothing is due."""
+        live_ids = _add_members(member_process, 200)
+        member_process._change_rates = np.zeros(6)
+        member_process._daily_death_rate_by_age[:] = 0.0
+
+        policy_members = member_process.shared_state.policy_members
+
+        assert member_process._select_daily_events(
+            policy_members, live_ids, date(2024, 3, 1)
+        ) == ([], [], [], [])
+
+    def test_rate_one_selects_every_member(self, member_process):
+        """Rate 1 flags the event for every member, each selected once."""
+        live_ids = _add_members(member_process, 200)
+        member_process._change_rates = np.array([0.0, 1.0, 0.0, 0.0, 0.0, 0.0])
+        member_process._daily_death_rate_by_age[:] = 1.0
+
+        hits, fired, died, renew = member_process._select_daily_events(
+            member_process.shared_state.policy_members, live_ids, date(2024, 3, 1)
+        )
+
+        assert hits == list(range(200))
+        assert all(flags == [False, True, False, False, False, False] for flags in fired)
+        assert all(died)
+        assert not any(renew)
+
+    def test_selected_members_unique_with_expected_counts(self, member_process):
+        """Each member appears once per day and per-event counts track the rates."""
+        n = 4000
+        _add_members(member_process, n, age=40)
+        live_ids = _add_members(member_process, n, age=90, medicare_expiry_date=date(2024, 3, 15))
+        member_process._change_rates = np.full(6, 0.05)
+        member_process._daily_death_rate_by_age[:] = 0.0
+        member_process._daily_death_rate_by_age[90] = 0.05
+
+        hits, fired, died, renew = member_process._select_daily_events(
+            member_process.shared_state.policy_members, live_ids, date(2024, 4, 1)
+        )
+
+        assert hits == sorted(set(hits))
+        assert len(hits) == len(fired) == len(died) == len(renew)
+        # Each event column: mean 400, sd ~14
+        for counts in zip(*fired):
+            assert 330 <= sum(counts) <= 470
+        # Deaths only among the 90-year-olds: mean 200, sd ~14
+        assert all(hits[i] >= n for i, dead in enumerate(died) if dead)
+        assert 140 <= sum(died) <= 260
+        # Every 90-year-old's Medicare card is due
+        assert [hits[i] for i, due in enumerate(renew) if due] == list(range(n, 2 * n))
+
+    def test_death_rates_match_per_member_formula(self, member_process):
+        """Grouped daily death rates equal the per-member age-band formula."""
+        ages = [0, 18, 30, 31, 45, 46, 60, 61, 70, 71, 80, 81, 99, 120, 130]
+        for age in ages:
+            for gender in (Gender.MALE, Gender.FEMALE):
+                member = SimpleNamespace(
+                    member_id=uuid4(), gender=gender, medicare_expiry_date=None
+                )
+                member_process.shared_state.add_policy_member(
+                    uuid4(), {"member": member, "age": age}
+                )
+        live_ids = member_process.shared_state.live_policy_member_ids()
+        policy_members = member_process.shared_state.policy_members
+
+        death_groups, _ = member_process._live_member_columns(policy_members, live_ids)
+
+        rate_of = {int(idx): rate for rate, members in death_groups for idx in members}
+        assert sorted(rate_of) == list(range(len(live_ids)))
+        for idx, pm_id in enumerate(live_ids):
+            age = policy_members[pm_id]["age"]
+            expected = member_process.annual_rate_to_daily(member_process._get_death_rate(age))
+            assert rate_of[idx] == pytest.approx(expected, rel=1e-12)
+
+
+class TestChangeEventPublishing:
+    """Tests for the end-of-day batch of member change events."""
+
+    def test_batched_events_match_per_event_publishing(self, member_process):
+        """The day's batch holds the same events, in order, as per-event publishing."""
+        today = date(2024, 3, 1)
+        roles = ["Primary", "Partner", "Dependent"]
+        for role in roles:
+            member = SimpleNamespace(
+                member_id=uuid4(),
+                state="NSW",
+                address_line_1="1 George St",
+                address_line_2=None,
+                suburb="Sydney",
+                postcode="2000",
+                medicare_expiry_date=None,
+            )
+            member_process.shared_state.add_policy_member(uuid4(), {
+                "member": member,
+                "policy": SimpleNamespace(policy_id=uuid4()),
+                "member_role": role,
+                "age": 40,
+            })
+        live_ids = member_process.shared_state.live_policy_member_ids()
+        policy_members = member_process.shared_state.policy_members
+        member_process.member_gen = MagicMock()
+        member_process.member_gen.generate_new_address.return_value = {
+            "address_line_1": "2 Collins St",
+            "address_line_2": None,
+            "suburb": "Melbourne",
+            "state": "VIC",
+            "postcode": "3000",
+        }
+        member_process._change_rates = np.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+        member_process._daily_death_rate_by_age[:] = 1.0
+
+        member_process._process_member_changes(today)
+
+        expected = SharedState()
+        for pm_id in live_ids:
+            data = policy_members[pm_id]
+            member_id, policy_id = data["member"].member_id, data["policy"].policy_id
+            expected.add_member_change_event(
+                member_id=member_id,
+                policy_id=policy_id,
+                change_type="ADDRESS_CHANGE",
+                change_data={
+                    "previous_state": "NSW",
+                    "new_state": "VIC",
+                    "member_role": data["member_role"],
+                    "date": today.isoformat(),
+                },
+            )
+            expected.add_member_change_event(
+                member_id=member_id,
+                policy_id=policy_id,
+                change_type="DEATH",
+                change_data={
+                    "member_role": data["member_role"],
+                    "date": today.isoformat(),
+                    "age": 40,
+                },
+            )
+
+        events = member_process.shared_state.get_member_change_events()
+        assert events == expected.member_change_events
+        assert [list(e) for e in events] == [list(e) for e in expected.member_change_events]
+        assert [list(e["change_data"]) for e in events] == [
+            list(e["change_data"]) for e in expected.member_change_events
+        ]
+        assert member_process._pending_change_events == []
+
+
+class TestLiveMemberIndex:
+    """Tests for SharedState.live_policy_member_ids()."""
+
+    def test_deceased_members_excluded_until_removed(self):
+        """Marking a member deceased drops it from the cached live ids."""
+        shared_state = SharedState()
+        alive, dead = uuid4(), uuid4()
+        shared_state.add_policy_member(alive, {"member": MagicMock()})
+        shared_state.add_policy_member(dead, {"member": MagicMock()})
+
+        first = shared_state.live_policy_member_ids()
+        assert first == (alive, dead)
+        assert shared_state.live_policy_member_ids() is first
+
+        shared_state.mark_policy_member_deceased(dead)
+        assert shared_state.live_policy_member_ids() == (alive,)
+
+        shared_state.remove_policy_member(dead)
+        assert shared_state.deceased_policy_member_ids == set()
+        assert shared_state.live_policy_member_ids() == (alive,)
@@ -0,0 +1,329 @@
+"""
+Unit tests for NBAActionProcess contact policy.
+
+Tests verify that the rolling contact counters kept in SharedState agree
+with the member's execution history, that the contact policy applies
+daily, weekly and max-attempt limits from them, and that queued
+recommendations expire once past their validity window.
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from brickwell_health.config.models import NBAConfig
+from brickwell_health.core.processes.nba import NBAActionProcess
+from brickwell_health.core.shared_state import (
+    NBA_CHANNEL_CODES,
+    NBA_EXECUTION_HISTORY_LIMIT,
+    SharedState,
+)
+from brickwell_health.domain.nba import (
+    ActionCategory,
+    NBAActionWithRecommendation,
+    NBAChannel,
+)
+
+
+def _make_recommendation(member_id, action_id, channel=NBAChannel.EMAIL, **overrides):
+    """Build a recommendation valid for all of 2024."""
+    fields = dict(
+        recommendation_id=uuid4(),
+        member_id=member_id,
+        policy_id=uuid4(),
+        valid_from=date(2024, 1, 1),
+        valid_until=date(2024, 12, 31),
+        action_id=action_id,
+        action_code="RET_CALL",
+        action_name="Retention call",
+        action_category=ActionCategory.SERVICE,
+        channel=channel,
+        probability_multiplier=Decimal("0.9"),
+        cooldown_days=7,
+        max_attempts=3,
+    )
+    fields.update(overrides)
+    return NBAActionWithRecommendation(**fields)
+
+
+@pytest.fixture
+def nba_process(sim_env):
+    """Create an NBA process at 10am on 2024-03-06 over a fresh SharedState."""
+    sim_env.env.run(until=65 + 10 / 24)
+    return NBAActionProcess(
+        sim_env=sim_env,
+        config=SimpleNamespace(nba=NBAConfig()),
+        batch_writer=MagicMock(),
+        id_generator=MagicMock(),
+        reference=MagicMock(),
+        shared_state=SharedState(),
+    )
+
+
+class TestNBAContactCounts:
+    """Tests for SharedState.get_nba_contact_counts()."""
+
+    def test_counts_match_execution_history(self):
+        """Counters agree with a scan of the retained executions."""
+        shared_state = SharedState()
+        member_id, action_a, action_b = uuid4(), uuid4(), uuid4()
+        executed = [
+            (datetime(2023, 2, 1, 9), action_a, "Email"),   # outside 365 days
+            (datetime(2024, 3, 1, 9), action_a, "SMS"),     # previous week
+            (datetime(2024, 3, 4, 9), action_b, "Email"),   # Monday this week
+            (datetime(2024, 3, 6, 8), action_a, "Email"),   # today
+        ]
+        for executed_at, action_id, channel in executed:
+            shared_state.add_nba_execution(member_id, {
+                "action_id": action_id,
+                "channel": channel,
+                "executed_at": executed_at,
+            })
+
+        counts = shared_state.get_nba_contact_counts(member_id, datetime(2024, 3, 6, 10))
+
+        assert counts.action_counts[action_a] == 2
+        assert counts.action_counts[action_b] == 1
+        assert counts.day_channels == [1, 0, 0, 0, 0]
+        assert counts.week_channels == [2, 0, 0, 0, 0]
+
+    def test_counts_follow_history_trim_and_restore(self):
+        """Trimmed executions stop counting; a replaced history is recounted."""
+        shared_state = SharedState()
+        member_id, action_id = uuid4(), uuid4()
+        start = datetime(2024, 3, 6, 8)
+        for i in range(NBA_EXECUTION_HISTORY_LIMIT + 5):
+            shared_state.add_nba_execution(member_id, {
+                "action_id": action_id,
+                "channel": "InApp",
+                "executed_at": start + timedelta(seconds=i),
+            })
+
+        counts = shared_state.get_nba_contact_counts(member_id, start)
+        assert counts.action_counts[action_id] == NBA_EXECUTION_HISTORY_LIMIT
+        assert counts.day_channels[NBA_CHANNEL_CODES["InApp"]] == NBA_EXECUTION_HISTORY_LIMIT
+        assert sum(counts.day_channels) == NBA_EXECUTION_HISTORY_LIMIT
+
+        shared_state.nba_execution_history = {
+            member_id: shared_state.nba_execution_history[member_id][-2:]
+        }
+        counts = shared_state.get_nba_contact_counts(member_id, start)
+        assert counts.action_counts[action_id] == 2
+
+
+class TestNBACooldown:
+    """Tests for SharedState.check_nba_cooldown()."""
+
+    def test_same_action_reason_wins_over_category(self):
+        """A same-action hit is reported even after an earlier category hit."""
+        shared_state = SharedState()
+        member_id, action_id = uuid4(), uuid4()
+        for executed_at, executed_action in (
+            (datetime(2024, 3, 4), uuid4()),
+            (datetime(2024, 3, 5), action_id),
+        ):
+            shared_state.add_nba_execution(member_id, {
+                "action_id": executed_action,
+                "action_category": "Retention",
+                "channel": "Email",
+                "executed_at": executed_at,
+            })
+
+        assert shared_state.check_nba_cooldown(
+            member_id,
+            action_id=action_id,
+            action_category="Retention",
+            current_datetime=datetime(2024, 3, 6),
+        ) == (True, "Same action cooldown (30 days)")
+        assert shared_state.check_nba_cooldown(
+            member_id,
+            action_id=uuid4(),
+            action_category="Retention",
+            current_datetime=datetime(2024, 3, 6),
+        ) == (True, "Same category cooldown (7 days)")
+
+class TestRecommendationExpiry:
+    """Tests for SharedState.expire_nba_recommendations()."""
+
+    def test_expires_only_queued_recommendations_past_validity(self):
+        """Due recommendations leave the queue once; consumed ones are skipped."""
+        shared_state = SharedState()
+        member_id = uuid4()
+        expiring = _make_recommendation(member_id, uuid4(), valid_until=date(2024, 3, 5))
+        consumed = _make_recommendation(member_id, uuid4(), valid_until=date(2024, 3, 4))
+        current = _make_recommendation(member_id, uuid4(), valid_until=date(2024, 3, 6))
+        shared_state.add_nba_recommendations([consumed])
+        shared_state.get_nba_recommendations()
+        shared_state.add_nba_recommendations([expiring, current])
+
+        assert shared_state.expire_nba_recommendations(date(2024, 3, 6)) == [expiring]
+        assert shared_state.expire_nba_recommendations(date(2024, 3, 6)) == []
+        assert shared_state.peek_nba_recommendations() == [current]
+        assert shared_state.get_nba_recommendations() == [current]
+
+class TestDeferredRecommendations:
+    """Tests for deferring NBA recommendations to a later date."""
+
+    def test_deferred_recommendation_released_on_its_date(self):
+        """Deferred recommendations stay out of the queue until released."""
+        shared_state = SharedState()
+        member_id = uuid4()
+        later = _make_recommendation(member_id, uuid4())
+        sooner = _make_recommendation(member_id, uuid4())
+        shared_state.defer_nba_recommendation(later, date(2024, 3, 8))
+        shared_state.defer_nba_recommendation(sooner, date(2024, 3, 7))
+
+        assert shared_state.release_deferred_nba_recommendations(date(2024, 3, 6)) == 0
+        assert shared_state.get_nba_recommendations() == []
+
+        assert shared_state.release_deferred_nba_recommendations(date(2024, 3, 8)) == 2
+        assert shared_state.get_nba_recommendations() == [sooner, later]
+
+    def test_pending_count_includes_deferred_and_drops_expired(self):
+        """Queued and deferred recommendations count as pending until they expire."""
+        shared_state = SharedState()
+        member_id = uuid4()
+        expiring = _make_recommendation(member_id, uuid4(), valid_until=date(2024, 3, 5))
+        queued = _make_recommendation(member_id, uuid4())
+        deferred = _make_recommendation(member_id, uuid4())
+        shared_state.add_nba_recommendations([expiring, queued])
+        shared_state.defer_nba_recommendation(deferred, date(2024, 3, 8))
+
+        assert shared_state.count_pending_nba_recommendations() == 3
+
+        shared_state.expire_nba_recommendations(date(2024, 3, 6))
+        assert len(shared_state.nba_action_queue) == 2
+        assert shared_state.count_pending_nba_recommendations() == 2
+        assert shared_state.get_stats()["nba_action_queue"] == 2
+
+class TestContactPolicy:
+    """Tests for NBAActionProcess._check_contact_policy()."""
+
+    def test_daily_channel_limit_suppresses(self, nba_process):
+        """A second email on the same day hits the daily Email limit."""
+        member_id = uuid4()
+        nba_process.shared_state.add_nba_execution(member_id, {
+            "action_id": uuid4(),
+            "action_category": ActionCategory.RETENTION.value,
+            "channel": "Email",
+            "executed_at": datetime(2024, 3, 6, 9, 0),
+        })
+
+        now_dt = nba_process.sim_env.current_datetime
+        counts = nba_process.shared_state.get_nba_contact_counts(member_id, now_dt)
+        email = _make_recommendation(member_id, uuid4())
+        sms = _make_recommendation(member_id, uuid4(), channel=NBAChannel.SMS)
+
+        assert nba_process._check_contact_policy(
+            email, counts, "Email", "Service", now_dt
+        ) == (False, "Daily Email limit reached", date(2024, 3, 7))
+        assert nba_process._check_contact_policy(
+            sms, counts, "SMS", "Service", now_dt
+        ) == (True, None, None)
+
+    def test_max_attempts_counts_prior_executions(self, nba_process):
+        """An action executed max_attempts times in the last year is suppressed."""
+        member_id, action_id = uuid4(), uuid4()
+        for month in (6, 9):
+            nba_process.shared_state.add_nba_execution(member_id, {
+                "action_id": action_id,
+                "action_category": ActionCategory.SERVICE.value,
+                "channel": "Email",
+                "executed_at": datetime(2023, month, 1),
+            })
+        recommendation = _make_recommendation(member_id, action_id, max_attempts=2)
+        now_dt = nba_process.sim_env.current_datetime
+        counts = nba_process.shared_state.get_nba_contact_counts(member_id, now_dt)
+
+        assert nba_process._check_contact_policy(
+            recommendation, counts, "Email", "Service", now_dt
+        ) == (False, "Max attempts reached (2)", date(2024, 5, 31))
+
+    def test_suppressed_until_cooldown_ends(self, nba_process):
+        """A recommendation under cooldown is held until the cooldown lifts."""
+        member_id, action_id = uuid4(), uuid4()
+        nba_process.shared_state.add_nba_execution(member_id, {
+            "action_id": action_id,
+            "action_category": ActionCategory.SERVICE.value,
+            "channel": "Email",
+            "executed_at": datetime(2024, 3, 1, 10),
+        })
+        recommendation = _make_recommendation(member_id, action_id)
+        now_dt = nba_process.sim_env.current_datetime
+        counts = nba_process.shared_state.get_nba_contact_counts(member_id, now_dt)
+
+        assert nba_process._check_contact_policy(
+            recommendation, counts, "Email", "Service", now_dt
+        ) == (False, "Same action cooldown (7 days)", date(2024, 3, 8))
+
+        nba_process.shared_state.add_nba_recommendations([recommendation])
+        nba_process._process_daily_recommendations(date(2024, 3, 6))
+
+        shared_state = nba_process.shared_state
+        assert shared_state.release_deferred_nba_recommendations(date(2024, 3, 7)) == 0
+        assert shared_state.release_deferred_nba_recommendations(date(2024, 3, 8)) == 1
+
+    def test_weekly_limit_retries_next_week(self, nba_process):
+        """A weekly limit holds the recommendation until the next Monday."""
+        member_id = uuid4()
+        for day in (4, 5):
+            nba_process.shared_state.add_nba_execution(member_id, {
+                "action_id": uuid4(),
+                "action_category": ActionCategory.WELLNESS.value,
+                "channel": "SMS",
+                "executed_at": datetime(2024, 3, day, 10),
+            })
+        recommendation = _make_recommendation(member_id, uuid4(), channel=NBAChannel.SMS)
+        now_dt = nba_process.sim_env.current_datetime
+        counts = nba_process.shared_state.get_nba_contact_counts(member_id, now_dt)
+
+        assert nba_process._check_contact_policy(
+            recommendation, counts, "SMS", "Service", now_dt
+        ) == (False, "Weekly SMS limit reached", date(2024, 3, 11))
+
+    def test_member_at_daily_total_skips_policy_check(self, nba_process):
+        """Recommendations for a member at the daily total are deferred unchecked."""
+        member_id = uuid4()
+        for channel in ("SMS", "InApp"):
+            nba_process.shared_state.add_nba_execution(member_id, {
+                "action_id": uuid4(),
+                "action_category": ActionCategory.WELLNESS.value,
+                "channel": channel,
+                "executed_at": datetime(2024, 3, 6, 8),
+            })
+        nba_process.shared_state.add_nba_recommendations(
+            [_make_recommendation(member_id, uuid4())]
+        )
+        nba_process._check_contact_policy = MagicMock()
+
+        nba_process._process_daily_recommendations(date(2024, 3, 6))
+
+        nba_process._check_contact_policy.assert_not_called()
+        assert nba_process._stats["recommendations_suppressed"] == 1
+        assert nba_process.shared_state.release_deferred_nba_recommendations(
+            date(2024, 3, 7)
+        ) == 1
+
+
+class TestImmediateResponses:
+    """Tests for NBAActionProcess._sample_immediate_responses()."""
+
+    def test_responses_follow_channel(self, nba_process):
+        """Each channel only yields its own response types."""
+        channels = ["Phone", "Email", "SMS", "InApp", "Web"] * 200
+        responses = nba_process._sample_immediate_responses(channels)
+
+        assert len(responses) == len(channels)
+        by_channel: dict[str, set[str]] = {}
+        for channel, response in zip(channels, responses):
+            by_channel.setdefault(channel, set()).add(response.value)
+
+        assert by_channel["Phone"] <= {"NoAnswer", "Answered"}
+        assert by_channel["Email"] <= {"Ignored", "Opened", "Clicked"}
+        assert by_channel["SMS"] <= {"Ignored", "Delivered", "Clicked"}
+        assert by_channel["InApp"] <= {"Ignored", "Opened", "Clicked"}
+        assert by_channel["Web"] <= {"Ignored", "Delivered"}
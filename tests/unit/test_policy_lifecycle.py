@@ -0,0 +1,423 @@
+"""
+Unit tests for PolicyLifecycleProcess daily event sampling.
+
+Tests verify that lifecycle events are drawn for all active policies in
+one pass, that policies before their effective date or not active are
+skipped, and that sampled events reach the matching handler.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from brickwell_health.core.processes.acquisition import AcquisitionProcess
+from brickwell_health.core.processes.policy_lifecycle import (
+    PolicyLifecycleProcess,
+    _select_events,
+)
+from brickwell_health.core.shared_state import SharedState
+from brickwell_health.domain.enums import DistributionChannel, MemberRole, PolicyType
+from brickwell_health.domain.policy import PolicyCreate
+
+
+@pytest.fixture
+def lifecycle_process(test_config, sim_env, id_generator):
+    """Create a lifecycle process over an empty policy book."""
+    reference = MagicMock()
+    reference.get_products.return_value = [
+        {"product_id": 1, "product_tier_id": 1, "product_name": "Gold Hospital No Excess"},
+        {"product_id": 2, "product_tier_id": 2, "product_name": "Silver Hospital $500 Excess"},
+        {"product_id": 3, "product_tier_id": 3, "product_name": "Bronze Hospital $500 Excess"},
+        {"product_id": 4, "product_tier_id": 4, "product_name": "Basic Hospital $500 Excess"},
+    ]
+    return PolicyLifecycleProcess(
+        sim_env=sim_env,
+        config=test_config,
+        batch_writer=MagicMock(),
+        id_generator=id_generator,
+        reference=reference,
+        active_policies={},
+    )
+
+
+def _add_policy(process, effective_date=date(2023, 1, 1), status="Active"):
+    """Track a Bronze policy and return its id."""
+    policy_id = uuid4()
+    process.add_policy(policy_id, {
+        "policy_id": policy_id,
+        "policy": SimpleNamespace(
+            policy_id=policy_id,
+            effective_date=effective_date,
+            premium_amount=Decimal("150.00"),
+        ),
+        "members": [SimpleNamespace(member_id=uuid4(), date_of_birth=date(1980, 5, 1))],
+        "status": status,
+        "tier": "Bronze",
+        "product_id": 3,
+        "excess": Decimal("500"),
+    })
+    return policy_id
+
+
+class TestDailyEventSampling:
+    """Tests for PolicyLifecycleProcess._process_policy_events()."""
+
+    def test_certain_event_dispatched_for_eligible_policies(self, lifecycle_process):
+        """Every eligible policy gets the event; others are left alone."""
+        eligible = [_add_policy(lifecycle_process) for _ in range(3)]
+        not_yet_effective = _add_policy(lifecycle_process, effective_date=date(2024, 2, 1))
+        suspended = _add_policy(lifecycle_process, status="Suspended")
+        lifecycle_process.upgrade_daily = 1.0
+
+        lifecycle_process._process_policy_events(date(2024, 1, 10), datetime(2024, 1, 10))
+
+        policies = lifecycle_process.active_policies
+        assert [policies[policy_id]["tier"] for policy_id in eligible] == ["Silver"] * 3
+        assert policies[not_yet_effective]["tier"] == "Bronze"
+        assert policies[suspended]["tier"] == "Bronze"
+        assert lifecycle_process.get_stats()["upgrades"] == 3
+
+    def test_policy_book_changes_picked_up(self, lifecycle_process):
+        """Policies swapped into the book between days are swept the next day."""
+        first = _add_policy(lifecycle_process)
+        lifecycle_process._process_policy_events(date(2024, 1, 10), datetime(2024, 1, 10))
+
+        lifecycle_process.remove_policy(first)
+        second = _add_policy(lifecycle_process)
+        lifecycle_process.upgrade_daily = 1.0
+        lifecycle_process._process_policy_events(date(2024, 1, 11), datetime(2024, 1, 11))
+
+        assert lifecycle_process.active_policies[second]["tier"] == "Silver"
+        assert lifecycle_process.get_stats()["upgrades"] == 1
+
+    def test_events_follow_stacked_rates(self, lifecycle_process):
+        """Draws past the upgrade band land in the downgrade band."""
+        policy_id = _add_policy(lifecycle_process)
+        lifecycle_process.upgrade_daily = 0.0
+        lifecycle_process.downgrade_daily = 1.0
+
+        lifecycle_process._process_policy_events(date(2024, 1, 10), datetime(2024, 1, 10))
+
+        assert lifecycle_process.active_policies[policy_id]["tier"] == "Basic"
+        assert lifecycle_process.get_stats().get("upgrades", 0) == 0
+
+    def test_churn_only_computed_below_rate_bound(self, lifecycle_process):
+        """Draws no policy's rates could reach skip the churn model."""
+        policy_ids = [_add_policy(lifecycle_process) for _ in range(2)]
+        lifecycle_process.rng = MagicMock()
+        lifecycle_process.rng.random.return_value = np.array([0.5, 0.0])
+        churned = []
+        lifecycle_process._get_churn_probability = (
+            lambda policy, current_date: churned.append(policy["policy_id"]) or 1.0
+        )
+
+        lifecycle_process._process_policy_events(date(2024, 1, 10), datetime(2024, 1, 10))
+
+        assert churned == [policy_ids[1]]
+
+
+class TestSelectEvents:
+    """Tests for the _select_events() threshold kernel."""
+
+    def test_draws_map_to_rate_bands(self):
+        """Each draw selects the band it falls in; draws past all bands select none."""
+        rates = np.array([[0.1] * 5, [0.2] * 5, [0.3] * 5, [0.1] * 5])
+        rands = np.array([0.05, 0.15, 0.45, 0.65, 0.95])
+
+        hits, events = _select_events(rands, rates)
+
+        assert hits.tolist() == [0, 1, 2, 3]
+        assert events.tolist() == [0, 1, 2, 3]
+
+    def test_zero_rate_bands_never_selected(self):
+        """Draws skip over bands with no probability."""
+        rates = np.array([[0.0, 0.2], [0.0, 0.0], [0.5, 0.0], [0.0, 0.3]])
+        rands = np.array([0.0, 0.2])
+
+        hits, events = _select_events(rands, rates)
+
+        assert hits.tolist() == [0, 1]
+        assert events.tolist() == [2, 3]
+
+
+class TestChurnInputs:
+    """Tests for the cached churn model inputs."""
+
+    def test_inputs_follow_primary_member(self, lifecycle_process):
+        """Cached ages are recomputed when the primary member changes."""
+        policy = lifecycle_process.active_policies[_add_policy(lifecycle_process)]
+        ages = []
+        lifecycle_process.churn_model.predict_daily_churn_probability = (
+            lambda member_age, **kwargs: ages.append(member_age) or 0.0
+        )
+
+        lifecycle_process._get_churn_probability(policy, date(2024, 6, 1))
+        policy["members"] = [SimpleNamespace(member_id=uuid4(), date_of_birth=date(1960, 1, 1))]
+        lifecycle_process._get_churn_probability(policy, date(2024, 6, 1))
+        policy["members"] = []
+
+        assert ages == [44, 64]
+        assert lifecycle_process._get_churn_probability(policy, date(2024, 6, 1)) == (
+            lifecycle_process.config.events.cancellation_rate / 365
+        )
+
+
+class TestCancellationStatements:
+    """Tests for the parameterized cancellation UPDATE statements."""
+
+    def test_day_of_deaths_written_as_one_statement_each(self, lifecycle_process):
+        """Primary deaths share one bound statement per table for the day."""
+        lifecycle_process.shared_state = SharedState()
+        policy_ids = [_add_policy(lifecycle_process) for _ in range(2)]
+        survivor = _add_policy(lifecycle_process)
+        for policy_id in policy_ids:
+            lifecycle_process.shared_state.add_member_change_event(
+                uuid4(), policy_id, "DEATH", {"member_role": "Primary"}
+            )
+        lifecycle_process.shared_state.add_member_change_event(
+            uuid4(), survivor, "OTHER", {}
+        )
+        today = date(2024, 1, 10)
+        now = datetime(2024, 1, 10, 9, 30)
+
+        lifecycle_process._process_member_change_events(today, now)
+
+        calls = lifecycle_process.batch_writer.add_raw_sql.call_args_list
+        assert [call.args[0] for call in calls] == [
+            "policy_cancellation_death",
+            "coverage_termination_death",
+            "policy_member_termination_death",
+        ]
+        for _, sql, params in (call.args for call in calls):
+            assert str(policy_ids[0]) not in sql
+            assert params[0] == today
+            assert params[-1] == policy_ids
+        assert calls[0].args[2][1:3] == ["Primary member deceased", now]
+        assert list(lifecycle_process.active_policies) == [survivor]
+        assert lifecycle_process.get_stats()["cancellation_reason_deceased"] == 2
+        assert [e["change_type"] for e in lifecycle_process.shared_state.member_change_events] == [
+            "OTHER"
+        ]
+
+
+class TestPolicyTypeChanges:
+    """Tests for batched policy_type updates on partner deaths."""
+
+    def test_day_of_changes_written_as_one_statement(self, lifecycle_process):
+        """Each policy's final type for the day is bound in one VALUES update."""
+        lifecycle_process.shared_state = SharedState()
+        couple, family = _add_policy(lifecycle_process), _add_policy(lifecycle_process)
+        lifecycle_process.active_policies[couple]["policy_type"] = "Couple"
+        lifecycle_process.active_policies[family]["policy_type"] = "Family"
+        for policy_id in (couple, family):
+            lifecycle_process.shared_state.add_member_change_event(
+                uuid4(), policy_id, "DEATH", {"member_role": "Partner"}
+            )
+        now = datetime(2024, 1, 10, 9, 30)
+
+        lifecycle_process._process_member_change_events(date(2024, 1, 10), now)
+
+        calls = lifecycle_process.batch_writer.add_raw_sql.call_args_list
+        assert [call.args[0] for call in calls] == [
+            "policy_member_removal",
+            "policy_member_removal",
+            "policy_type_change",
+        ]
+        _, sql, params = calls[-1].args
+        assert "FROM (VALUES (%s, %s), (%s, %s))" in sql
+        assert params == [now, couple, "Single", family, "Single Parent"]
+        assert lifecycle_process._pending_policy_type_changes == {}
+
+    def test_last_dependent_death_changes_type(self, lifecycle_process):
+        """Family becomes Couple only once its last dependent dies."""
+        policy_id = _add_policy(lifecycle_process)
+        policy = lifecycle_process.active_policies[policy_id]
+        policy.update(policy_type="Family", dependent_count=2)
+        untracked = _add_policy(lifecycle_process)
+        lifecycle_process.active_policies[untracked]["policy_type"] = "Family"
+        today = date(2024, 1, 10)
+
+        lifecycle_process._remove_member_from_policy(policy_id, uuid4(), "Dependent", today)
+        assert (policy["policy_type"], policy["dependent_count"]) == ("Family", 1)
+
+        lifecycle_process._remove_member_from_policy(policy_id, uuid4(), "Dependent", today)
+        lifecycle_process._remove_member_from_policy(untracked, uuid4(), "Dependent", today)
+        assert (policy["policy_type"], policy["dependent_count"]) == ("Couple", 0)
+        assert lifecycle_process.active_policies[untracked]["policy_type"] == "Family"
+        assert lifecycle_process._pending_policy_type_changes == {policy_id: "Couple"}
+
+    def test_dependent_death_on_acquired_policy(
+        self, lifecycle_process, test_config, sim_env, id_generator
+    ):
+        """An acquired Family policy becomes Couple when its last dependent dies."""
+        shared_state = SharedState()
+        acquisition = AcquisitionProcess(
+            sim_env=sim_env,
+            config=test_config,
+            batch_writer=MagicMock(),
+            id_generator=id_generator,
+            reference=MagicMock(),
+            worker_id=0,
+            shared_state=shared_state,
+        )
+        policy = PolicyCreate(
+            policy_id=uuid4(),
+            policy_number="POL-2024-000001",
+            product_id=1,
+            policy_type=PolicyType.FAMILY,
+            effective_date=date(2024, 1, 1),
+            premium_amount=Decimal("400.00"),
+            distribution_channel=DistributionChannel.ONLINE,
+            state_of_residence="NSW",
+            original_join_date=date(2024, 1, 1),
+        )
+        roles = [MemberRole.PRIMARY, MemberRole.PARTNER, MemberRole.DEPENDENT, MemberRole.DEPENDENT]
+        members = [
+            MagicMock(member_id=uuid4(), date_of_birth=date(1985, 1, 1)) for _ in roles
+        ]
+        policy_members = [
+            MagicMock(policy_member_id=uuid4(), member_id=m.member_id, member_role=role)
+            for m, role in zip(members, roles)
+        ]
+        acquisition.app_gen = MagicMock()
+        acquisition.policy_gen = MagicMock()
+        acquisition.policy_gen.generate.return_value = (policy, policy_members)
+        acquisition.coverage_gen = MagicMock()
+        acquisition.coverage_gen.generate_coverages_for_policy.return_value = []
+        acquisition.waiting_gen = MagicMock()
+        acquisition.waiting_gen.generate_waiting_periods_for_member.return_value = []
+        acquisition.regulatory_gen = MagicMock()
+        acquisition.regulatory_gen.generate_all_regulatory_records.return_value = {
+            "lhc_loadings": [], "age_discounts": [], "rebate_entitlements": [],
+        }
+        acquisition.billing_gen = MagicMock()
+        acquisition.preference_gen = MagicMock()
+        acquisition.preference_gen.generate_default_preferences.return_value = []
+        acquisition._sample_engagement_level = lambda: "low"
+        for _ in acquisition._create_policy_from_application(MagicMock(), [], members, 1):
+            pass
+
+        lifecycle_process.active_policies = shared_state.active_policies
+        lifecycle_process.shared_state = shared_state
+        today = date(2024, 6, 1)
+        for pm in policy_members[2:]:
+            lifecycle_process._remove_member_from_policy(
+                policy.policy_id, pm.member_id, "Dependent", today
+            )
+
+        registered = shared_state.active_policies[policy.policy_id]
+        assert (registered["policy_type"], registered["dependent_count"]) == ("Couple", 0)
+        assert lifecycle_process._pending_policy_type_changes == {policy.policy_id: "Couple"}
+
+
+class TestAddressChanges:
+    """Tests for primary member address change handling."""
+
+    def test_day_of_moves_counted_once(self, lifecycle_process):
+        """Only primary members' moves on tracked policies are counted."""
+        lifecycle_process.shared_state = SharedState()
+        policy_id = _add_policy(lifecycle_process)
+        for role, new_state, target in [
+            ("Primary", "VIC", policy_id),
+            ("Primary", "NSW", policy_id),
+            ("Partner", "VIC", policy_id),
+            ("Primary", "VIC", uuid4()),
+        ]:
+            lifecycle_process.shared_state.add_member_change_event(
+                uuid4(), target, "ADDRESS_CHANGE",
+                {"member_role": role, "previous_state": "NSW", "new_state": new_state},
+            )
+
+        lifecycle_process._debug_enabled = True
+
+        with patch("brickwell_health.core.processes.policy_lifecycle.logger") as logger:
+            lifecycle_process._process_member_change_events(
+                date(2024, 1, 10), datetime(2024, 1, 10)
+            )
+
+        stats = lifecycle_process.get_stats()
+        assert stats["address_changes_processed"] == 2
+        assert stats["interstate_moves"] == 1
+        (call,) = logger.debug.call_args_list
+        assert call.kwargs["moves"] == [
+            {"policy_id": str(policy_id), "from_state": "NSW", "to_state": "VIC"}
+        ]
+
+
+class TestDeceasedMemberRemoval:
+    """Tests for dropping a deceased member from shared member tracking."""
+
+    def test_member_found_through_index(self, lifecycle_process):
+        """Tracked members are found by member_id, including direct writes."""
+        shared_state = lifecycle_process.shared_state = SharedState()
+        policy_id = _add_policy(lifecycle_process)
+        partner, child = uuid4(), uuid4()
+        partner_pm, child_pm, other_pm = uuid4(), uuid4(), uuid4()
+        shared_state.add_policy_member(
+            partner_pm, {"member": SimpleNamespace(member_id=partner)}
+        )
+        shared_state.add_policy_member(
+            other_pm, {"member": SimpleNamespace(member_id=uuid4())}
+        )
+        assert shared_state.get_policy_member_id(partner) == partner_pm
+
+        # Written around add_policy_member, as ClaimsProcess.add_member does
+        shared_state.policy_members[child_pm] = {"member": SimpleNamespace(member_id=child)}
+
+        today = date(2024, 1, 10)
+        lifecycle_process._remove_member_from_policy(policy_id, partner, "Partner", today)
+        lifecycle_process._remove_member_from_policy(policy_id, child, "Dependent", today)
+
+        assert list(shared_state.policy_members) == [other_pm]
+        assert shared_state.get_policy_member_id(partner) is None
+
+
+class TestProductTierLookup:
+    """Tests for PolicyLifecycleProcess._find_product_in_tier()."""
+
+    def test_matches_excess_then_falls_back_to_first_product(self, lifecycle_process):
+        """A matching excess wins; otherwise the tier's first product is used."""
+        lifecycle_process.reference.get_products.return_value = [
+            {"product_id": 10, "product_tier_id": 2, "product_name": "Silver Hospital No Excess"},
+            {"product_id": 11, "product_tier_id": 2, "product_name": "Silver Hospital $500 Excess"},
+            {"product_id": 12, "product_tier_id": 2, "product_name": "Silver Plus $500 Excess"},
+        ]
+        lifecycle_process._build_product_tier_lookups()
+
+        assert lifecycle_process._find_product_in_tier("Silver", Decimal("500")) == 11
+        assert lifecycle_process._find_product_in_tier("Silver", Decimal("0.00")) == 10
+        assert lifecycle_process._find_product_in_tier("Silver", Decimal("750")) == 10
+        assert lifecycle_process._find_product_in_tier("Silver", None) == 10
+        assert lifecycle_process._find_product_in_tier("Gold", Decimal("500")) is None
+
+
+class TestProratedRefund:
+    """Tests for PolicyLifecycleProcess._calculate_prorated_refund()."""
+
+    def test_refunds_remaining_days_of_month(self, lifecycle_process):
+        """The refund covers the days after the event to the end of the month."""
+        policy = SimpleNamespace(premium_amount=Decimal("290.00"))
+
+        refund = lifecycle_process._calculate_prorated_refund(
+            policy, date(2024, 2, 19), "Cancellation"
+        )
+
+        assert refund == Decimal("100.00")
+        assert lifecycle_process._calculate_prorated_refund(
+            policy, date(2024, 2, 29), "Cancellation"
+        ) is None
+
+    def test_half_cent_refunds_round_to_even(self, lifecycle_process):
+        """An exact half cent rounds to the even cent, as quantize() does."""
+        policy = SimpleNamespace(premium_amount=Decimal("391.18"))
+
+        refund = lifecycle_process._calculate_prorated_refund(
+            policy, date(2025, 2, 7), "Cancellation"
+        )
+
+        assert str(refund) == "293.38"
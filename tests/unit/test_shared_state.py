@@ -0,0 +1,44 @@
+"""
+Unit tests for SharedState member views.
+
+Tests verify that the members_soa() column view reflects the tracked
+policy members and is cached until the member set changes.
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from brickwell_health.core.shared_state import SharedState
+
+
+@pytest.fixture
+def shared_state():
+    """Create a fresh SharedState."""
+    return SharedState()
+
+
+class TestMembersSoa:
+    """Tests for SharedState.members_soa()."""
+
+    def test_members_soa_cached_until_members_change(self, shared_state):
+        """Columns are reused until members change, even via direct writes."""
+        member = SimpleNamespace(member_id=uuid4())
+        policy = SimpleNamespace(policy_id=uuid4())
+        shared_state.add_policy_member(uuid4(), {"policy": policy, "member": member})
+        shared_state.set_engagement_level(member.member_id, "high")
+
+        members = shared_state.members_soa()
+        assert len(members) == 1
+        assert members.member_ids[0] == member.member_id
+        assert members.policy_ids[0] == policy.policy_id
+        assert members.engagement_levels[members.engagement_idx[0]] == "high"
+        assert shared_state.members_soa() is members
+
+        # Direct writes that bypass the mutators still invalidate the cache
+        shared_state.policy_members[uuid4()] = {
+            "policy": policy,
+            "member": SimpleNamespace(member_id=uuid4()),
+        }
+        assert len(shared_state.members_soa()) == 2
@@ -584,19 +584,27 @@ class _MockBatchWriter:
         for r in records:
             self.add(table_name, r)
 
-    def add_raw_sql(self, operation_type, sql):
+    def add_raw_sql(self, operation_type, sql, params=None):
         pass
 
     def update_record(self, table_name, key_field, key_value, updates):
         self.updates.append((table_name, key_field, key_value, updates))
         return True
 
+    def update_many(self, table_name, key_field, rows):
+        for key_value, updates in rows:
+            self.updates.append((table_name, key_field, key_value, updates))
+        return [key_value != "missing" for key_value, _ in rows]
+
     def is_in_buffer(self, table_name, key_field, key_value):
         return False
 
     def flush_for_cdc(self, table_name, key_field, key_value):
         return False
 
+    def flush_for_cdc_many(self, table_name, key_field, key_values):
+        return False
+
     def flush_all(self):
         self.flushed += 1
 
@@ -671,6 +679,21 @@ class TestStreamingBatchWriter:
         assert updates[0].data["status"] == "approved"
         assert updates[0].key == {"claim_id": "abc"}
 
+    def test_update_many_queues_event_per_updated_row(self, setup):
+        wrapper, inner, publisher = setup
+        results = wrapper.update_many(
+            "claim",
+            "claim_id",
+            [("abc", {"status": "approved"}), ("missing", {"status": "paid"})],
+        )
+        wrapper.close()
+        time.sleep(0.2)
+        assert results == [True, False]
+        assert len(inner.updates) == 2
+        updates = publisher.get_events_by_type("update")
+        assert len(updates) == 1
+        assert updates[0].key == {"claim_id": "abc"}
+
     def test_update_ignores_non_configured_table(self, setup):
         wrapper, inner, publisher = setup
         wrapper.update_record("invoice", "invoice_id", "xyz", {"paid": True})
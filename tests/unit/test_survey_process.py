@@ -0,0 +1,151 @@
+"""
+Unit tests for SurveyProcess shared state lookups and survey fatigue.
+
+Tests verify that member data is found through the SharedState member
+index, that anniversary surveys go to the policy's recorded primary
+member, that the fatigue window holds only the latest sends, and that
+trigger send probabilities are resolved once and checked before lookups.
+"""
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from brickwell_health.core.processes.survey import SurveyProcess, _send_probabilities
+from brickwell_health.core.shared_state import SharedState
+
+
+@pytest.fixture
+def survey_process(test_config, sim_env, id_generator):
+    """Create a survey process over a fresh SharedState."""
+    return SurveyProcess(
+        sim_env=sim_env,
+        config=test_config,
+        batch_writer=MagicMock(),
+        id_generator=id_generator,
+        reference=MagicMock(),
+        shared_state=SharedState(),
+    )
+
+
+def _add_member(shared_state, policy):
+    """Track a new member on a policy and return its member_id."""
+    member_id = uuid4()
+    shared_state.add_policy_member(
+        uuid4(), {"policy": policy, "member": SimpleNamespace(member_id=member_id)}
+    )
+    return member_id
+
+
+class TestMemberLookup:
+    """Tests for SurveyProcess._get_member_data()."""
+
+    def test_member_data_found_by_member_id(self, survey_process):
+        """The tracked member's data dict is returned; unknown members give None."""
+        shared_state = survey_process.shared_state
+        policy = SimpleNamespace(policy_id=uuid4())
+        _add_member(shared_state, policy)
+        member_id = _add_member(shared_state, policy)
+
+        data = survey_process._get_member_data(member_id)
+
+        assert data["member"].member_id == member_id
+        assert survey_process._get_member_data(uuid4()) is None
+
+
+class TestAnniversarySurveys:
+    """Tests for SurveyProcess._generate_anniversary_surveys()."""
+
+    def test_survey_sent_to_recorded_primary_member(self, survey_process):
+        """Only this month's anniversaries are surveyed, via primary_member_id."""
+        shared_state = survey_process.shared_state
+        policy = SimpleNamespace(policy_id=uuid4())
+        _add_member(shared_state, policy)
+        primary_id = _add_member(shared_state, policy)
+        shared_state.add_policy(policy.policy_id, {
+            "policy": policy,
+            "start_date": date(2023, 3, 15),
+            "primary_member_id": primary_id,
+        })
+        other = SimpleNamespace(policy_id=uuid4(), start_date=date(2023, 4, 1))
+        shared_state.add_policy(other.policy_id, {
+            "policy": other,
+            "primary_member_id": _add_member(shared_state, other),
+        })
+        survey_process.nps_triggers = {"policy_anniversary": {"send_probability": 1.0}}
+        survey_process.survey_gen = MagicMock()
+
+        survey_process._generate_anniversary_surveys(date(2024, 3, 1))
+
+        (call,) = survey_process.survey_gen.generate_nps_pending.call_args_list
+        assert call.kwargs["member_data"]["member"].member_id == primary_id
+        assert survey_process.get_stats()["anniversary_surveys"] == 1
+
+
+class TestSurveyFatigue:
+    """Tests for the per-member survey fatigue window."""
+
+    def test_two_surveys_within_thirty_days_fatigue(self, survey_process, sim_env):
+        """A member is fatigued while their last two surveys are within 30 days."""
+        member_id = uuid4()
+        assert not survey_process._is_survey_fatigued(member_id)
+
+        survey_process._track_survey_sent(member_id)
+        sim_env.env.run(until=10)
+        survey_process._track_survey_sent(member_id)
+        assert survey_process._is_survey_fatigued(member_id)
+
+        sim_env.env.run(until=30)
+        assert not survey_process._is_survey_fatigued(member_id)
+
+        survey_process._track_survey_sent(member_id)
+        assert survey_process._is_survey_fatigued(member_id)
+        assert len(survey_process.surveys_sent[member_id]) == 2
+
+
+class TestTriggerProbabilities:
+    """Tests for trigger send probabilities resolved at construction."""
+
+    def test_dict_and_bare_configs_resolved(self):
+        """Dict and bare configs give their probability; unset ones give None."""
+        probabilities = _send_probabilities({
+            "claim_paid": {"send_probability": 0.2},
+            "claim_rejected": {"send_probability": 0},
+            "case_resolved": 0.4,
+            "interaction_completed": 0,
+            "policy_anniversary": {},
+        })
+
+        assert probabilities == {
+            "claim_paid": 0.2,
+            "claim_rejected": 0,
+            "case_resolved": 0.4,
+            "interaction_completed": None,
+            "policy_anniversary": None,
+        }
+
+    def test_nps_skipped_without_configured_triggers(self, survey_process):
+        """With no positive NPS probability, events skip the trigger lookup."""
+        assert not survey_process._has_any_nps
+
+        survey_process._maybe_create_nps_survey({"member_id": uuid4()}, "claim_paid")
+
+        survey_process.reference.get_survey_type_by_trigger_event.assert_not_called()
+
+
+class TestJourneySurveyGate:
+    """Tests for the journey NPS send probability gate."""
+
+    @pytest.mark.parametrize("send_probability, lookups", [(0.0, 0), (1.0, 1)])
+    def test_gate_runs_before_policy_lookup(self, survey_process, send_probability, lookups):
+        """Rejected journeys skip the lookups; accepted ones fetch the policy once."""
+        survey_process._nps_send_prob = {"claim_paid": send_probability}
+        event = {"member_id": uuid4(), "policy_id": uuid4(), "trigger_type": "claim_paid"}
+
+        with patch.object(survey_process, "_get_policy_data", return_value=None) as get_policy:
+            survey_process._create_journey_nps_survey(event)
+
+        assert get_policy.call_count == lookups